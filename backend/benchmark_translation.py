@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Translation benchmark against a running API.
+
+Run the API with the fake translator so no LLM key or network access is needed,
+and with its in-process job worker so the translator counters are in the same
+process as /api/admin/cache-stats:
+
+    RUN_JOB_WORKER=true TRANSLATOR_BACKEND=fake FAKE_TRANSLATOR_LATENCY_MS=800 uvicorn server:app --port 8001
+    python benchmark_translation.py --base-url http://localhost:8001 --concurrency 1,4,16
+
+Measures /api/translate latency, up to the end of the job it queues, and
+throughput at each concurrency level with unique texts (every call reaches the
+translator), the same texts again (served from the translation memory), and
+whole-disease translation jobs for several diseases at once. It ends with the translator, memory and batching counters.
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SAMPLE_PARAGRAPH = (
+    "<p>Patients present with progressive weakness of the proximal lower limb muscles, "
+    "difficulty rising from a chair and climbing stairs. Gait analysis shows a Trendelenburg "
+    "pattern; rehabilitation focuses on hip abductor strengthening, balance training and "
+    "energy conservation strategies.</p>"
+)
+
+DISEASE_SECTIONS = ["definition", "epidemiology", "pathophysiology", "clinical_presentation", "treatment_conservative", "prognosis"]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label, latencies, errors, elapsed):
+    done = len(latencies)
+    print(
+        f"  {label:<28} ok={done:<5} errors={errors:<4} "
+        f"throughput={done / elapsed if elapsed else 0:7.2f}/s  "
+        f"p50={percentile(latencies, 50) * 1000:7.0f}ms  "
+        f"p95={percentile(latencies, 95) * 1000:7.0f}ms  "
+        f"max={max(latencies, default=0) * 1000:7.0f}ms"
+    )
+
+
+class Benchmark:
+    def __init__(self, base_url, email, password, target_language, poll_seconds):
+        self.base_url = base_url.rstrip('/')
+        self.api = f"{self.base_url}/api"
+        self.poll_seconds = poll_seconds
+        self.session = requests.Session()
+        self.target_language = target_language
+        response = self.session.post(f"{self.api}/auth/login", json={"email": email, "password": password})
+        if response.status_code != 200:
+            sys.exit(f"Login failed: {response.status_code} {response.text}")
+        self.session.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+        self.run_id = uuid.uuid4().hex[:8]
+
+    def cache_stats(self):
+        return self.session.get(f"{self.api}/admin/cache-stats").json()
+
+    def translate(self, text):
+        started = time.monotonic()
+        response = self.session.post(f"{self.api}/translate", json={
+            "text": text,
+            "source_language": "en",
+            "target_language": self.target_language
+        }, timeout=600)
+        # Texts not in the translation memory are queued; follow the job until it ends
+        if response.status_code == 202:
+            job_url = f"{self.base_url}{response.headers['Location']}"
+            job = response.json()
+            while job["status"] in ("queued", "running") and not job["next_attempt_at"]:
+                time.sleep(self.poll_seconds)
+                job = self.session.get(job_url).json()
+            return job["status"] == "completed", time.monotonic() - started
+        return response.status_code == 200, time.monotonic() - started
+
+    def run_translations(self, label, texts, concurrency):
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(self.translate, texts))
+        elapsed = time.monotonic() - started
+        latencies = [latency for ok, latency in results if ok]
+        report(label, latencies, len(results) - len(latencies), elapsed)
+
+    def bench_translate(self, levels, requests_per_level):
+        print(f"/api/translate, {requests_per_level} requests per level")
+        texts = []
+        for level in levels:
+            texts = [f"{SAMPLE_PARAGRAPH} [{self.run_id}-{level}-{i}]" for i in range(requests_per_level)]
+            self.run_translations(f"concurrency {level}", texts, level)
+        # The last level again: every text is now in the translation memory
+        self.run_translations(f"concurrency {levels[-1]}, repeated", texts, levels[-1])
+
+    def bench_jobs(self, disease_count, poll_seconds):
+        print(f"Whole-disease jobs, {disease_count} diseases of {len(DISEASE_SECTIONS) + 1} fields")
+        category_id = self.session.get(f"{self.api}/categories").json()[0]["id"]
+        disease_ids = []
+        for i in range(disease_count):
+            body = {"name": f"Benchmark {self.run_id} {i}", "category_id": category_id}
+            body.update({section: f"{SAMPLE_PARAGRAPH} [{self.run_id}-{i}-{section}]" for section in DISEASE_SECTIONS})
+            disease_ids.append(self.session.post(f"{self.api}/diseases", json=body).json()["id"])
+
+        try:
+            started = time.monotonic()
+            pending = {}
+            for disease_id in disease_ids:
+                job = self.session.post(
+                    f"{self.api}/translate-disease/{disease_id}",
+                    params={"target_language": self.target_language}
+                ).json()
+                pending[job["job_id"]] = time.monotonic()
+
+            durations, failed, fields = [], 0, 0
+            while pending:
+                time.sleep(poll_seconds)
+                for job_id, enqueued in list(pending.items()):
+                    job = self.session.get(f"{self.api}/translation-jobs/{job_id}").json()
+                    if job["status"] in ("queued", "running") and not job["next_attempt_at"]:
+                        continue
+                    del pending[job_id]
+                    fields += job["completed"]
+                    if job["status"] == "completed":
+                        durations.append(time.monotonic() - enqueued)
+                    else:
+                        failed += 1
+            elapsed = time.monotonic() - started
+            report("jobs", durations, failed, elapsed)
+            print(f"  {'fields translated':<28} {fields} ({fields / elapsed:.2f}/s)")
+        finally:
+            for disease_id in disease_ids:
+                self.session.delete(f"{self.api}/diseases/{disease_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the translation endpoints of a running API")
+    parser.add_argument("--base-url", default=os.environ.get("REACT_APP_BACKEND_URL", "http://localhost:8001"))
+    parser.add_argument("--email", default="admin@pmr.edu")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--target-language", default="pt")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=32, help="translate requests per concurrency level")
+    parser.add_argument("--diseases", type=int, default=8, help="diseases translated as concurrent jobs")
+    parser.add_argument("--poll-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    bench = Benchmark(args.base_url, args.email, args.password, args.target_language, args.poll_seconds)
+    before = bench.cache_stats()
+    print(f"Translator: {before['translator']['backend']} ({before['translator']['model']}), run {bench.run_id}")
+
+    bench.bench_translate([int(level) for level in args.concurrency.split(",")], args.requests)
+    if args.diseases:
+        bench.bench_jobs(args.diseases, args.poll_seconds)
+
+    after = bench.cache_stats()
+    translator = after["translator"]
+    print("Counters for this run")
+    for key in ("calls", "errors", "input_tokens", "output_tokens"):
+        print(f"  translator {key:<17} {translator[key] - before['translator'][key]}")
+    print(f"  translator avg_call_ms      {translator['avg_call_ms']}")
+    memory = after["translation_memory"]
+    print(f"  memory hit rate (lifetime)  {memory['memory_hit_rate']}")
+    batches = after["translation_batches"]
+    for key in ("requests", "sections", "fallbacks"):
+        print(f"  batch {key:<22} {batches[key] - before['translation_batches'][key]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Small in-process caching primitives shared by the API.
+
+LRUCache is a size-bounded, optionally TTL-bounded mapping; SingleFlight makes
+concurrent callers asking for the same key share one in-flight load. Both are
+per-process: with several uvicorn workers each keeps its own copy, so TTLs bound
+how long another worker's write can stay invisible.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """Least-recently-used cache with an optional per-entry time to live"""
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any):
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]):
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class _LoadCancelled(Exception):
+    """Set on a shared load whose caller was cancelled; the callers waiting on it load again"""
+
+
+class SingleFlight:
+    """Coalesce concurrent loads of the same key into one awaited call"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        while key in self._inflight:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(self._inflight[key])
+            except _LoadCancelled:
+                # The first waiter to get here loads the key; the others wait on it
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a load nobody else waited on does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
@@ -0,0 +1,100 @@
+"""
+Circuit breaker for calls to an unreliable dependency.
+
+Closed: calls go through and consecutive failed calls are counted. After
+failure_threshold of them the breaker opens and every call is rejected at once
+with CircuitOpenError, instead of queueing behind a dependency that is down.
+Once reset_seconds have passed it lets a single trial call through (half-open).
+If that call succeeds the breaker closes again; if it fails the breaker reopens
+for another reset_seconds.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is unavailable, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_opened: Optional[str] = None
+        self.trial_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self.retry_after() == 0:
+            return HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def available(self) -> bool:
+        """Whether a call made now would be let through"""
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and not self.trial_in_flight)
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError; an admitted call must report its outcome"""
+        state = self.state
+        if state == OPEN or (state == HALF_OPEN and self.trial_in_flight):
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.retry_after() or self.reset_seconds)
+        if state == HALF_OPEN:
+            self._state = HALF_OPEN
+            self.trial_in_flight = True
+
+    def record_success(self):
+        self._state = CLOSED
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+
+    def abandon(self):
+        """An admitted call ended without an outcome (e.g. it was cancelled)"""
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        # Calls admitted before the breaker opened can still fail afterwards; they don't extend the cool-down
+        if self._state == OPEN:
+            return
+        if self._state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self):
+        self._state = OPEN
+        self.opened_at = time.monotonic()
+        self.last_opened = datetime.now(timezone.utc).isoformat()
+        self.trial_in_flight = False
+        self.times_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after_seconds": round(self.retry_after(), 1),
+            "times_opened": self.times_opened,
+            "last_opened": self.last_opened,
+            "rejected": self.rejected
+        }
@@ -0,0 +1,307 @@
+"""
+Durable job queue on a MongoDB collection.
+
+Jobs are documents with a kind, a status and a lease. A worker claims a job by
+atomically moving it to running under its own worker id and a lease deadline,
+renews the lease while the handler runs, and marks the job completed when the
+handler returns. A handler that raises puts the job back in the queue with an
+exponential, jittered delay until max_attempts is reached; the job is then
+parked as dead (the dead-letter list) for an admin to inspect and retry. Jobs
+whose worker disappears are reclaimed once their lease lapses, which counts as
+an attempt so a job that kills its worker cannot loop forever.
+
+Any process can enqueue; JobWorker runs the handlers, either inside the API
+process or in a standalone worker (worker.py).
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_JOB_STATUSES = ["queued", "running"]
+JOB_STATUSES = ["queued", "running", "completed", "dead"]
+
+JobHandler = Callable[[dict], Awaitable[Any]]
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueue:
+    """Enqueue, claim, complete and retry jobs stored in one collection"""
+
+    def __init__(
+        self,
+        collection,
+        worker_id: str,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float
+    ):
+        self.collection = collection
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+    def lease_deadline(self) -> str:
+        return (utc_now() + timedelta(seconds=self.lease_seconds)).isoformat()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter: half to all of base * 2^(attempts-1), capped"""
+        delay = min(self.retry_base_seconds * 2 ** max(attempts - 1, 0), self.retry_max_seconds)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def enqueue(self, kind: str, **fields: Any) -> dict:
+        now = utc_now().isoformat()
+        job = {
+            "id": str(uuid.uuid4()),
+            "kind": kind,
+            **fields,
+            "status": "queued",
+            "attempts": 0,
+            "max_attempts": self.max_attempts,
+            "run_at": now,
+            "worker_id": None,
+            "lease_expires_at": None,
+            "last_error": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        await self.collection.insert_one(job)
+        job.pop("_id", None)
+        return job
+
+    def claimable(self, kinds: List[str]) -> dict:
+        now = utc_now().isoformat()
+        return {
+            "kind": {"$in": kinds},
+            "$or": [
+                {"status": "queued", "run_at": {"$lte": now}},
+                {"status": "running", "lease_expires_at": {"$lt": now}}
+            ]
+        }
+
+    async def claim(self, kinds: List[str]) -> Optional[dict]:
+        """Lease the next due job of one of the given kinds, or None if there is none"""
+        candidates = await self.collection.find(
+            self.claimable(kinds), {"_id": 0, "id": 1, "status": 1, "attempts": 1, "max_attempts": 1}
+        ).sort("run_at", 1).to_list(10)
+
+        for candidate in candidates:
+            # A running job found here lost its worker mid-attempt
+            if candidate["status"] == "running" and candidate["attempts"] >= candidate["max_attempts"]:
+                await self.bury(candidate["id"], "Worker stopped responding", {"status": "running"})
+                continue
+            # Conditional on the job still being claimable, so only one worker wins it
+            now = utc_now().isoformat()
+            result = await self.collection.update_one(
+                {"id": candidate["id"], **self.claimable(kinds)},
+                {
+                    "$set": {
+                        "status": "running",
+                        "worker_id": self.worker_id,
+                        "lease_expires_at": self.lease_deadline(),
+                        "started_at": now,
+                        "updated_at": now
+                    },
+                    "$inc": {"attempts": 1}
+                }
+            )
+            if result.modified_count:
+                return await self.collection.find_one({"id": candidate["id"]}, {"_id": 0})
+        return None
+
+    def held(self, job_id: str) -> dict:
+        return {"id": job_id, "status": "running", "worker_id": self.worker_id}
+
+    async def renew(self, job_id: str) -> bool:
+        result = await self.collection.update_one(
+            self.held(job_id), {"$set": {"lease_expires_at": self.lease_deadline()}}
+        )
+        return result.matched_count > 0
+
+    async def complete(self, job_id: str, result: Any = None):
+        now = utc_now().isoformat()
+        await self.collection.update_one(
+            self.held(job_id),
+            {"$set": {
+                "status": "completed",
+                "result": result,
+                "error": None,
+                "finished_at": now,
+                "updated_at": now,
+                "lease_expires_at": None
+            }}
+        )
+
+    async def fail(self, job: dict, error: str) -> str:
+        """Schedule a retry of a failed attempt, or bury the job once it is out of attempts"""
+        if job["attempts"] >= job.get("max_attempts", self.max_attempts):
+            await self.bury(job["id"], error, {"worker_id": self.worker_id})
+            return "dead"
+        now = utc_now()
+        await self.collection.update_one(
+            self.held(job["id"]),
+            {"$set": {
+                "status": "queued",
+                "run_at": (now + timedelta(seconds=self.retry_delay(job["attempts"]))).isoformat(),
+                "last_error": error,
+                "updated_at": now.isoformat(),
+                "worker_id": None,
+                "lease_expires_at": None
+            }}
+        )
+        return "queued"
+
+    async def bury(self, job_id: str, error: str, condition: Dict[str, Any]):
+        now = utc_now().isoformat()
+        await self.collection.update_one(
+            {"id": job_id, **condition},
+            {"$set": {
+                "status": "dead",
+                "error": error,
+                "last_error": error,
+                "finished_at": now,
+                "updated_at": now,
+                "lease_expires_at": None
+            }}
+        )
+
+    async def retry(self, job_id: str) -> bool:
+        """Move a dead job back to the queue with a fresh set of attempts"""
+        now = utc_now().isoformat()
+        result = await self.collection.update_one(
+            {"id": job_id, "status": "dead"},
+            {
+                "$set": {"status": "queued", "attempts": 0, "run_at": now, "error": None, "updated_at": now},
+                "$unset": {"finished_at": ""}
+            }
+        )
+        return result.modified_count > 0
+
+    async def release(self):
+        """Hand this worker's running jobs back to the queue; an interrupted attempt is not counted"""
+        now = utc_now().isoformat()
+        await self.collection.update_many(
+            {"status": "running", "worker_id": self.worker_id},
+            {
+                "$set": {"status": "queued", "run_at": now, "worker_id": None, "lease_expires_at": None, "updated_at": now},
+                "$inc": {"attempts": -1}
+            }
+        )
+
+    async def dead_letters(self, limit: int = 100) -> List[dict]:
+        return await self.collection.find({"status": "dead"}, {"_id": 0}).sort("finished_at", -1).to_list(limit)
+
+    async def stats(self) -> Dict[str, Any]:
+        counts = {status: 0 for status in JOB_STATUSES}
+        by_kind: Dict[str, Dict[str, int]] = {}
+        pipeline = [{"$group": {"_id": {"kind": "$kind", "status": "$status"}, "count": {"$sum": 1}}}]
+        async for row in self.collection.aggregate(pipeline):
+            kind, status_value = row["_id"].get("kind"), row["_id"].get("status")
+            counts[status_value] = counts.get(status_value, 0) + row["count"]
+            by_kind.setdefault(kind, {})[status_value] = row["count"]
+        retrying = await self.collection.count_documents({"status": "queued", "attempts": {"$gt": 0}})
+        return {**counts, "retrying": retrying, "by_kind": by_kind}
+
+
+class JobWorker:
+    """Claims jobs of the kinds it has handlers for and runs up to concurrency of them at once"""
+
+    def __init__(self, queue: JobQueue, handlers: Dict[str, JobHandler], concurrency: int, poll_interval: float):
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.wakeup = asyncio.Event()
+        self.loop_task: Optional[asyncio.Task] = None
+        self.completed = 0
+        self.retried = 0
+        self.dead = 0
+
+    def wake(self):
+        """Check the queue now instead of at the next poll"""
+        self.wakeup.set()
+
+    async def fill(self):
+        while len(self.tasks) < self.concurrency:
+            job = await self.queue.claim(list(self.handlers))
+            if job is None:
+                return
+            self.tasks[job["id"]] = asyncio.create_task(self.process(job))
+
+    async def run(self):
+        while True:
+            self.wakeup.clear()
+            try:
+                await self.fill()
+            except Exception:
+                logger.exception("Claiming jobs failed")
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def heartbeat(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            if not await self.queue.renew(job_id):
+                logger.warning(f"Lost the lease on job {job_id}")
+                return
+
+    async def process(self, job: dict):
+        heartbeat = asyncio.create_task(self.heartbeat(job["id"]))
+        try:
+            result = await self.handlers[job["kind"]](job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = "Timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+            logger.warning(f"Job {job['id']} ({job['kind']}) attempt {job['attempts']} failed: {error}")
+            if await self.queue.fail(job, error) == "dead":
+                self.dead += 1
+            else:
+                self.retried += 1
+        else:
+            await self.queue.complete(job["id"], result)
+            self.completed += 1
+        finally:
+            heartbeat.cancel()
+            self.tasks.pop(job["id"], None)
+            self.wake()
+
+    def start(self):
+        if self.loop_task is None:
+            self.wakeup = asyncio.Event()
+            self.loop_task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.loop_task is not None:
+            self.loop_task.cancel()
+            self.loop_task = None
+        for task in list(self.tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        await self.queue.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.queue.worker_id,
+            "running": self.loop_task is not None,
+            "concurrency": self.concurrency,
+            "active_jobs": len(self.tasks),
+            "completed": self.completed,
+            "retried": self.retried,
+            "dead": self.dead
+        }
@@ -0,0 +1,170 @@
+"""
+Token counting and request packing for LLM translation.
+
+Several short sections can share one model request: pack_batches() groups them
+under a token budget and the sections travel as a JSON object whose keys come
+back unchanged, so parse_batch_response() can map each translation to its field
+and reject anything malformed.
+
+A long section goes the other way: chunk_text() splits it between top-level
+blocks (paragraphs, lists, headings, tables...) so each chunk is well-formed
+markup under a token budget, and reassemble() joins the translated chunks back
+with the original whitespace between them.
+"""
+
+import json
+import logging
+import re
+from typing import Dict, Iterable, List, Optional
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Encoding used by the gpt-4.1 family
+TOKEN_ENCODING = "o200k_base"
+
+# Rough characters per token, used only if the tiktoken encoding cannot be loaded
+FALLBACK_CHARS_PER_TOKEN = 4
+
+_encoding = None
+_encoding_failed = False
+
+CODE_FENCE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Block-level tags that nest (depth is tracked so splits never land inside one),
+# plus line breaks, rules and blank lines, which end a block at the top level
+BLOCK_BOUNDARY = re.compile(
+    r'<(/?)(p|div|ul|ol|li|h[1-6]|blockquote|pre|table|thead|tbody|tfoot|tr|td|th|figure|section|article)\b[^>]*?(/?)>'
+    r'|<(?:br|hr)\b[^>]*>'
+    r'|\n[ \t]*\n',
+    re.IGNORECASE
+)
+
+
+def _get_encoding():
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            # tiktoken downloads its BPE files on first use; estimate rather than fail
+            _encoding_failed = True
+            logger.warning(f"tiktoken encoding {TOKEN_ENCODING} unavailable, estimating token counts: {e}")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is None:
+        return -(-len(text) // FALLBACK_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def batch_payload(sections: Dict[str, str]) -> str:
+    """JSON envelope sent as the user message of a batched request"""
+    return json.dumps(sections, ensure_ascii=False)
+
+
+def pack_batches(sections: Dict[str, str], budget: int) -> List[List[str]]:
+    """Group field names, in order, so each group's envelope stays within budget tokens.
+
+    A section too large for the budget on its own gets a group to itself.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    used = 2  # the envelope braces
+    for field, text in sections.items():
+        # key, quotes, colon and separator cost a few tokens beyond the text itself
+        cost = count_tokens(text) + count_tokens(field) + 4
+        if current and used + cost > budget:
+            batches.append(current)
+            current, used = [], 2
+        current.append(field)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(response: str, fields: Iterable[str]) -> Dict[str, str]:
+    """Translations from a batched response, keeping only expected fields with non-empty text"""
+    try:
+        data = json.loads(CODE_FENCE.sub('', response.strip()))
+    except (TypeError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    parsed = {}
+    for field in fields:
+        value: Optional[object] = data.get(field)
+        if isinstance(value, str) and value.strip():
+            parsed[field] = value
+    return parsed
+
+
+def split_blocks(text: str) -> List[str]:
+    """Top-level blocks of rich text, such that ''.join(blocks) == text"""
+    blocks: List[str] = []
+    start = 0
+    depth = 0
+    for match in BLOCK_BOUNDARY.finditer(text):
+        if match.group(2):
+            if match.group(3):
+                continue
+            if match.group(1):
+                depth = max(depth - 1, 0)
+                at_boundary = depth == 0
+            else:
+                depth += 1
+                at_boundary = False
+        else:
+            at_boundary = depth == 0
+        if at_boundary:
+            _append_block(blocks, text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        _append_block(blocks, text[start:])
+    return blocks
+
+
+def _append_block(blocks: List[str], block: str):
+    # Whitespace between blocks stays with the block before it, never a chunk of its own
+    if blocks and not block.strip():
+        blocks[-1] += block
+    else:
+        blocks.append(block)
+
+
+def chunk_text(text: str, budget: int) -> List[str]:
+    """Split text into runs of whole blocks of at most budget tokens each.
+
+    A single block larger than the budget becomes a chunk on its own rather than
+    being cut through its markup.
+    """
+    if count_tokens(text) <= budget:
+        return [text]
+    chunks: List[str] = []
+    current = ""
+    used = 0
+    for block in split_blocks(text):
+        cost = count_tokens(block)
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = "", 0
+        current += block
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def reassemble(chunks: List[str], translations: List[str]) -> str:
+    """Join translated chunks in order, restoring the whitespace around each original chunk"""
+    parts = []
+    for chunk, translated in zip(chunks, translations):
+        stripped = chunk.strip()
+        leading = chunk[:len(chunk) - len(chunk.lstrip())]
+        trailing = chunk[len(chunk.rstrip()):] if stripped else ""
+        parts.append(leading + translated.strip() + trailing)
+    return "".join(parts)
@@ -0,0 +1,92 @@
+"""
+Password hashing off the event loop.
+
+bcrypt deliberately costs 100+ ms per call, which would stall every other request
+if run inside a coroutine. PasswordHasher runs it on a dedicated, bounded thread
+pool (bcrypt releases the GIL while hashing) and counts how many calls are queued
+behind the pool so login bursts are visible.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+
+
+class PasswordHasher:
+    """bcrypt hash/verify on a bounded worker pool, with queue metrics"""
+
+    def __init__(self, rounds: int, workers: int):
+        self.rounds = rounds
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rehashed = 0
+        self._wait_seconds = 0.0
+        self._work_seconds = 0.0
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        submitted = time.monotonic()
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        def work():
+            started = time.monotonic()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self._wait_seconds += started - submitted
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                    self._work_seconds += time.monotonic() - started
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, work)
+
+    async def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        hashed = await self._run(bcrypt.hashpw, password.encode('utf-8'), salt)
+        return hashed.decode('utf-8')
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True when a stored hash was made with a different cost factor than configured"""
+        try:
+            return int(hashed.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self.completed
+            return {
+                "rounds": self.rounds,
+                "workers": self.workers,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "completed": completed,
+                "rehashed": self.rehashed,
+                "avg_wait_ms": round(self._wait_seconds / completed * 1000, 2) if completed else 0.0,
+                "avg_work_ms": round(self._work_seconds / completed * 1000, 2) if completed else 0.0
+            }
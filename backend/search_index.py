@@ -0,0 +1,308 @@
+"""
+In-process full-text search for diseases.
+
+An inverted index over the disease name, tags and the 13 clinical sections,
+ranked with BM25 and per-field boosts. Text is HTML-stripped, accent-folded,
+lower-cased and lightly stemmed. Each language (en, pt, es) has its own
+analyzer and its own index segment built from the suffixed translation
+fields (definition_pt, prognosis_es, ...), so a query is one lookup in the
+segment for its language. The index lives in the API process: it is rebuilt
+from Mongo at startup and kept current by the disease write endpoints, so
+every worker process holds its own copy.
+"""
+
+import bisect
+import math
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+SECTION_FIELDS = [
+    'definition', 'epidemiology', 'pathophysiology', 'biomechanics',
+    'clinical_presentation', 'physical_examination', 'imaging_findings',
+    'differential_diagnosis', 'treatment_conservative', 'treatment_interventional',
+    'treatment_surgical', 'rehabilitation_protocol', 'prognosis'
+]
+
+# name > tags > definition > rest of the body
+FIELD_BOOSTS = {
+    'name': 4.0,
+    'tags': 2.5,
+    'definition': 1.5,
+    **{field: 1.0 for field in SECTION_FIELDS if field != 'definition'}
+}
+
+SEARCH_LANGUAGES = ['en', 'pt', 'es']
+
+
+def source_field(field: str, language: str) -> str:
+    """Document field holding `field` in `language`; tags are not translated"""
+    if language == 'en' or field == 'tags':
+        return field
+    return f"{field}_{language}"
+
+
+# Every document field read by the index, across all languages
+INDEXED_FIELDS = sorted({
+    source_field(field, language) for field in FIELD_BOOSTS for language in SEARCH_LANGUAGES
+})
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Matches on a prefix of the last query word (search-as-you-type) count for less
+PREFIX_MATCH_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+TAG_RE = re.compile(r'<[^>]+>')
+ENTITY_RE = re.compile(r'&[a-zA-Z]+;|&#\d+;')
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+ENGLISH_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to', 'was', 'with'
+}
+
+# Accent-folded, since stopwords are matched after folding
+PORTUGUESE_STOPWORDS = {
+    'a', 'ao', 'aos', 'as', 'com', 'da', 'das', 'de', 'do', 'dos', 'e', 'em', 'entre',
+    'na', 'nas', 'no', 'nos', 'o', 'os', 'ou', 'para', 'pela', 'pelo', 'por', 'que',
+    'se', 'sao', 'um', 'uma'
+}
+
+SPANISH_STOPWORDS = {
+    'a', 'al', 'con', 'de', 'del', 'e', 'el', 'en', 'entre', 'es', 'la', 'las', 'lo',
+    'los', 'o', 'para', 'por', 'que', 'se', 'son', 'su', 'sus', 'u', 'un', 'una', 'y'
+}
+
+
+def fold(text: str) -> str:
+    """Lower-case and strip accents, e.g. 'Lesão' -> 'lesao'"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def strip_html(text: str) -> str:
+    return ENTITY_RE.sub(' ', TAG_RE.sub(' ', text))
+
+
+def stem_english(word: str) -> str:
+    """Light suffix-stripping stemmer (plural, -ing, -ed, -ly, -ation, ...)"""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in (
+        ('ational', 'ate'), ('ization', 'ize'), ('fulness', 'ful'), ('iveness', 'ive'),
+        ('ation', 'ate'), ('ities', 'ity'), ('ness', ''), ('sses', 'ss'), ('ies', 'y'), ('ing', ''),
+        ('edly', ''), ('ed', ''), ('ly', ''), ('es', ''), ('s', '')
+    ):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == 's' and word.endswith(('ss', 'us', 'is')):
+                return word
+            if suffix == 'es' and not word.endswith(('xes', 'zes', 'ches', 'shes')):
+                continue
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+
+def strip_suffixes(word: str, rules) -> str:
+    """Apply the first matching (suffix, replacement) rule that leaves a 3+ letter stem"""
+    for suffix, replacement in rules:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+
+# Rules operate on accent-folded words: 'lesões' -> 'lesoes', 'inflamação' -> 'inflamacao'
+PORTUGUESE_SUFFIXES = (
+    ('amentos', ''), ('imentos', ''), ('amento', ''), ('imento', ''), ('mente', ''),
+    ('acoes', 'ac'), ('icoes', 'ic'), ('acao', 'ac'), ('icao', 'ic'), ('oes', 'ao'),
+    ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ois', 'ol'), ('res', 'r'), ('zes', 'z'),
+    ('ns', 'm'), ('as', 'a'), ('es', 'e'), ('os', 'o'), ('s', '')
+)
+
+SPANISH_SUFFIXES = (
+    ('amientos', ''), ('imientos', ''), ('amiento', ''), ('imiento', ''), ('mente', ''),
+    ('aciones', 'ac'), ('iciones', 'ic'), ('acion', 'ac'), ('icion', 'ic'), ('ones', 'on'),
+    ('ces', 'z'), ('les', 'l'), ('res', 'r'), ('des', 'd'), ('nes', 'n'),
+    ('as', 'a'), ('es', 'e'), ('os', 'o'), ('s', '')
+)
+
+
+def stem_portuguese(word: str) -> str:
+    if len(word) <= 3 or word.isdigit():
+        return word
+    return strip_suffixes(word, PORTUGUESE_SUFFIXES)
+
+
+def stem_spanish(word: str) -> str:
+    if len(word) <= 3 or word.isdigit():
+        return word
+    return strip_suffixes(word, SPANISH_SUFFIXES)
+
+
+class Analyzer:
+    """Turns raw field text into index terms for one language"""
+
+    def __init__(self, stopwords: set, stemmer):
+        self.stopwords = stopwords
+        self.stemmer = stemmer
+
+    def words(self, text: str) -> List[str]:
+        """Folded, unstemmed words with stopwords removed"""
+        return [w for w in TOKEN_RE.findall(fold(strip_html(text))) if w not in self.stopwords]
+
+    def terms(self, text: str) -> List[str]:
+        return [self.stemmer(w) for w in self.words(text)]
+
+
+ANALYZERS = {
+    'en': Analyzer(ENGLISH_STOPWORDS, stem_english),
+    'pt': Analyzer(PORTUGUESE_STOPWORDS, stem_portuguese),
+    'es': Analyzer(SPANISH_STOPWORDS, stem_spanish),
+}
+
+
+class SearchIndex:
+    """Inverted index with per-field postings and BM25 scoring"""
+
+    def __init__(self, analyzer: Analyzer, field_boosts: Dict[str, float]):
+        self.analyzer = analyzer
+        self.field_boosts = field_boosts
+        # term -> field -> doc_id -> term frequency
+        self.postings: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # doc_id -> field -> token count
+        self.doc_lengths: Dict[str, Dict[str, int]] = {}
+        self.total_lengths: Dict[str, int] = {field: 0 for field in field_boosts}
+        # doc_id -> terms it contains, so removal is proportional to the document
+        self.doc_terms: Dict[str, set] = {}
+        # Unstemmed words, kept sorted for prefix lookups, mapped to their terms
+        self.vocabulary: Dict[str, set] = {}
+        self.sorted_words: List[str] = []
+        self._words_dirty = False
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def clear(self):
+        self.__init__(self.analyzer, self.field_boosts)
+
+    def add(self, doc_id: str, fields: Dict[str, str]):
+        """Index (or re-index) one document given its field texts"""
+        self.remove(doc_id)
+        lengths = {}
+        terms = set()
+        for field in self.field_boosts:
+            text = fields.get(field) or ''
+            if isinstance(text, list):
+                text = ' '.join(str(t) for t in text)
+            words = self.analyzer.words(text)
+            if not words:
+                continue
+            lengths[field] = len(words)
+            self.total_lengths[field] += len(words)
+            for word in words:
+                term = self.analyzer.stemmer(word)
+                field_postings = self.postings.setdefault(term, {}).setdefault(field, {})
+                field_postings[doc_id] = field_postings.get(doc_id, 0) + 1
+                terms.add(term)
+                if word not in self.vocabulary:
+                    self.vocabulary[word] = set()
+                    self._words_dirty = True
+                self.vocabulary[word].add(term)
+        self.doc_lengths[doc_id] = lengths
+        self.doc_terms[doc_id] = terms
+
+    def remove(self, doc_id: str):
+        lengths = self.doc_lengths.pop(doc_id, None)
+        if lengths is None:
+            return
+        for field, length in lengths.items():
+            self.total_lengths[field] -= length
+        # Only touch the postings of terms this document contributed
+        for term in self.doc_terms.pop(doc_id, ()):
+            fields = self.postings[term]
+            for field in list(fields):
+                if fields[field].pop(doc_id, None) is not None and not fields[field]:
+                    del fields[field]
+            if not fields:
+                del self.postings[term]
+
+    def _expand_prefix(self, prefix: str) -> set:
+        if self._words_dirty:
+            self.sorted_words = sorted(self.vocabulary)
+            self._words_dirty = False
+        terms = set()
+        start = bisect.bisect_left(self.sorted_words, prefix)
+        for word in self.sorted_words[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not word.startswith(prefix):
+                break
+            terms.update(self.vocabulary[word])
+        return terms
+
+    def _score_term(self, term: str, weight: float, scores: Dict[str, float]):
+        fields = self.postings.get(term)
+        if not fields:
+            return
+        doc_count = len(self.doc_lengths)
+        docs_with_term = set()
+        for field_postings in fields.values():
+            docs_with_term.update(field_postings)
+        idf = math.log(1 + (doc_count - len(docs_with_term) + 0.5) / (len(docs_with_term) + 0.5))
+        for field, field_postings in fields.items():
+            boost = self.field_boosts[field]
+            avg_length = self.total_lengths[field] / doc_count if doc_count else 0
+            for doc_id, tf in field_postings.items():
+                length = self.doc_lengths[doc_id].get(field, 0)
+                norm = 1 - BM25_B + BM25_B * (length / avg_length if avg_length else 0)
+                scores[doc_id] = scores.get(doc_id, 0.0) + (
+                    weight * boost * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                )
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return (doc_id, score) pairs, best first"""
+        words = self.analyzer.words(query)
+        if not words:
+            return []
+        scores: Dict[str, float] = {}
+        for word in words[:-1]:
+            self._score_term(self.analyzer.stemmer(word), 1.0, scores)
+        # The last word may still be being typed: also match words it prefixes
+        last_term = self.analyzer.stemmer(words[-1])
+        self._score_term(last_term, 1.0, scores)
+        for term in self._expand_prefix(words[-1]) - {last_term}:
+            self._score_term(term, PREFIX_MATCH_WEIGHT, scores)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
+
+
+class DiseaseSearchIndex:
+    """Search index over disease documents, one segment per language"""
+
+    def __init__(self):
+        self.segments = {
+            language: SearchIndex(ANALYZERS[language], FIELD_BOOSTS)
+            for language in SEARCH_LANGUAGES
+        }
+
+    def __len__(self):
+        return len(self.segments['en'])
+
+    def rebuild(self, diseases: List[dict]):
+        for segment in self.segments.values():
+            segment.clear()
+        for disease in diseases:
+            self.add(disease)
+
+    def add(self, disease: dict):
+        for language, segment in self.segments.items():
+            segment.add(disease['id'], {
+                field: disease.get(source_field(field, language)) for field in FIELD_BOOSTS
+            })
+
+    def remove(self, disease_id: str):
+        for segment in self.segments.values():
+            segment.remove(disease_id)
+
+    def search(self, query: str, language: str = 'en', limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        return self.segments[language].search(query, limit)
@@ -1,19 +1,36 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne, ASCENDING, DESCENDING
+from pymongo.errors import DuplicateKeyError, OperationFailure
 import os
+import asyncio
 import logging
+import time
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple
 import uuid
 from datetime import datetime, timezone, timedelta
-import bcrypt
 import jwt
 import re
-from emergentintegrations.llm.chat import LlmChat, UserMessage
+import json
+import base64
+import hashlib
+import difflib
+from email.utils import format_datetime, parsedate_to_datetime
+from cache import LRUCache, SingleFlight
+from passwords import PasswordHasher
+from job_queue import ACTIVE_JOB_STATUSES, JobQueue, JobWorker
+from translators import EmergentTranslator, FakeTranslator, GuardedTranslator, Translator
+from circuit_breaker import CircuitBreaker
+from version_history import VersionHistory
+from translation_memory import TranslationMemory, content_hash, memory_key
+from llm_text import batch_payload, chunk_text, pack_batches, parse_batch_response, reassemble
+from search_index import DiseaseSearchIndex, INDEXED_FIELDS, SEARCH_LANGUAGES, SECTION_FIELDS, strip_html
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -28,9 +45,100 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'pmr-education-secret-key-change-in-pr
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# bcrypt cost factor and the size of the pool that runs it; changing the cost
+# rehashes each user's password on their next login
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '4'))
+
+# LLM translation fan-out: concurrent requests per worker and the deadline of each one, retries included
+TRANSLATION_CONCURRENCY = int(os.environ.get('TRANSLATION_CONCURRENCY', '4'))
+TRANSLATION_TIMEOUT_SECONDS = float(os.environ.get('TRANSLATION_TIMEOUT_SECONDS', '60'))
+
+# Each attempt at the provider is cut off after TRANSLATOR_ATTEMPT_TIMEOUT_SECONDS and retried
+# with jittered backoff; after TRANSLATOR_BREAKER_FAILURES consecutive failures the breaker
+# fails calls fast for TRANSLATOR_BREAKER_RESET_SECONDS before letting a trial call through
+TRANSLATOR_ATTEMPT_TIMEOUT_SECONDS = float(os.environ.get('TRANSLATOR_ATTEMPT_TIMEOUT_SECONDS', '30'))
+TRANSLATOR_MAX_ATTEMPTS = int(os.environ.get('TRANSLATOR_MAX_ATTEMPTS', '3'))
+TRANSLATOR_RETRY_BASE_SECONDS = float(os.environ.get('TRANSLATOR_RETRY_BASE_SECONDS', '0.5'))
+TRANSLATOR_RETRY_MAX_SECONDS = float(os.environ.get('TRANSLATOR_RETRY_MAX_SECONDS', '8'))
+TRANSLATOR_BREAKER_FAILURES = int(os.environ.get('TRANSLATOR_BREAKER_FAILURES', '5'))
+TRANSLATOR_BREAKER_RESET_SECONDS = float(os.environ.get('TRANSLATOR_BREAKER_RESET_SECONDS', '30'))
+
+# Idle LLM chat clients kept for reuse per (source, target, model, prompt)
+TRANSLATOR_POOL_SIZE = int(os.environ.get('TRANSLATOR_POOL_SIZE', '8'))
+
+# Whole-disease translation packs several sections into one request up to this many input tokens
+TRANSLATION_BATCHING = os.environ.get('TRANSLATION_BATCHING', 'true').lower() == 'true'
+TRANSLATION_BATCH_TOKEN_BUDGET = int(os.environ.get('TRANSLATION_BATCH_TOKEN_BUDGET', '1500'))
+
+# Streaming endpoints: how often a job's progress is re-read, and the idle time before a keepalive
+TRANSLATION_STREAM_POLL_SECONDS = float(os.environ.get('TRANSLATION_STREAM_POLL_SECONDS', '0.5'))
+SSE_KEEPALIVE_SECONDS = float(os.environ.get('SSE_KEEPALIVE_SECONDS', '15'))
+
+# Sections longer than this many tokens are split between blocks and translated chunk by chunk
+TRANSLATION_CHUNK_TOKEN_BUDGET = int(os.environ.get('TRANSLATION_CHUNK_TOKEN_BUDGET', '800'))
+
+# Past translations kept in process in front of the translation_memory collection
+TRANSLATION_MEMORY_SIZE = int(os.environ.get('TRANSLATION_MEMORY_SIZE', '2000'))
+
+# A running translation job renews its lease; jobs whose lease lapses are resumed
+TRANSLATION_JOB_LEASE_SECONDS = float(os.environ.get('TRANSLATION_JOB_LEASE_SECONDS', '120'))
+
+# Failed translation jobs are retried with exponential backoff, then parked as dead
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', '5'))
+JOB_RETRY_BASE_SECONDS = float(os.environ.get('JOB_RETRY_BASE_SECONDS', '10'))
+JOB_RETRY_MAX_SECONDS = float(os.environ.get('JOB_RETRY_MAX_SECONDS', '600'))
+
+# Job worker: jobs run at once and how often the queue is polled. Jobs run in separate
+# worker processes (worker.py), and API processes report the translator breaker state
+# those publish; RUN_JOB_WORKER=true runs them in the API process too (single-process dev)
+RUN_JOB_WORKER = os.environ.get('RUN_JOB_WORKER', 'false').lower() == 'true'
+JOB_WORKER_CONCURRENCY = int(os.environ.get('JOB_WORKER_CONCURRENCY', '4'))
+JOB_POLL_SECONDS = float(os.environ.get('JOB_POLL_SECONDS', '1'))
+
+# How often the API picks up disease writes made by job workers in other processes
+JOB_SYNC_SECONDS = float(os.environ.get('JOB_SYNC_SECONDS', '2'))
+
+# Authenticated users are cached briefly so most requests skip the users lookup
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', '1000'))
+USER_CACHE_TTL_SECONDS = float(os.environ.get('USER_CACHE_TTL_SECONDS', '30'))
+
+# Fail startup if any hot-path query would run as a collection scan (test mode)
+VERIFY_QUERY_PLANS = os.environ.get('VERIFY_QUERY_PLANS', 'false').lower() == 'true'
+
+# Disease summary listing pagination
+DISEASE_PAGE_SIZE = int(os.environ.get('DISEASE_PAGE_SIZE', '50'))
+MAX_DISEASE_PAGE_SIZE = 200
+SUMMARY_EXCERPT_LENGTH = 200
+# Raw definition HTML read per row; markup is stripped before cutting it down to the excerpt
+SUMMARY_EXCERPT_FETCH_LENGTH = SUMMARY_EXCERPT_LENGTH * 5
+
+# Recent views kept per user, and when buffered view events are written out
+RECENT_VIEWS_LIMIT = 20
+RECENT_VIEW_FLUSH_SIZE = int(os.environ.get('RECENT_VIEW_FLUSH_SIZE', '500'))
+RECENT_VIEW_FLUSH_SECONDS = float(os.environ.get('RECENT_VIEW_FLUSH_SECONDS', '2'))
+
+# Disease history stores field-level deltas with a full copy every VERSION_KEYFRAME_INTERVAL versions
+VERSION_KEYFRAME_INTERVAL = int(os.environ.get('VERSION_KEYFRAME_INTERVAL', '20'))
+
+# Cache of serialized single-disease responses. Writes made in another process are seen within
+# DISEASE_CACHE_REVALIDATE_SECONDS: an older entry is checked against the stored version before it is served
+DISEASE_CACHE_SIZE = int(os.environ.get('DISEASE_CACHE_SIZE', '500'))
+DISEASE_CACHE_TTL_SECONDS = float(os.environ.get('DISEASE_CACHE_TTL_SECONDS', '300'))
+DISEASE_CACHE_REVALIDATE_SECONDS = float(os.environ.get('DISEASE_CACHE_REVALIDATE_SECONDS', '2'))
+
 # LLM Configuration
 EMERGENT_LLM_KEY = os.environ.get('EMERGENT_LLM_KEY', '')
 
+# Translator backend: "emergent" (the LLM) or "fake" (local stand-in for benchmarks and load tests).
+# The fake's latency is log-normal around a median, plus output tokens at a given throughput
+TRANSLATOR_BACKEND = os.environ.get('TRANSLATOR_BACKEND', 'emergent')
+FAKE_TRANSLATOR_LATENCY_MS = float(os.environ.get('FAKE_TRANSLATOR_LATENCY_MS', '800'))
+FAKE_TRANSLATOR_LATENCY_SIGMA = float(os.environ.get('FAKE_TRANSLATOR_LATENCY_SIGMA', '0.5'))
+FAKE_TRANSLATOR_TOKENS_PER_SECOND = float(os.environ.get('FAKE_TRANSLATOR_TOKENS_PER_SECOND', '80'))
+FAKE_TRANSLATOR_ERROR_RATE = float(os.environ.get('FAKE_TRANSLATOR_ERROR_RATE', '0'))
+FAKE_TRANSLATOR_SEED = os.environ.get('FAKE_TRANSLATOR_SEED')
+
 # Create the main app
 app = FastAPI(title="PMR Education Platform API")
 
@@ -40,6 +148,10 @@ api_router = APIRouter(prefix="/api")
 # Security
 security = HTTPBearer()
 
+# In-process full-text search index over diseases (rebuilt at startup)
+search_engine = DiseaseSearchIndex()
+version_history = VersionHistory(db.disease_versions, VERSION_KEYFRAME_INTERVAL)
+
 # ==================== MODELS ====================
 
 class UserRole:
@@ -167,21 +279,21 @@ class DiseaseResponse(BaseModel):
     category_id: str
     category_name: str = ""
     tags: List[str]
-    definition: str
-    epidemiology: str
-    pathophysiology: str
-    biomechanics: str
-    clinical_presentation: str
-    physical_examination: str
-    imaging_findings: str
-    differential_diagnosis: str
-    treatment_conservative: str
-    treatment_interventional: str
-    treatment_surgical: str
-    rehabilitation_protocol: str
-    prognosis: str
-    references: List[str]
-    images: List[str]
+    definition: str = ""
+    epidemiology: str = ""
+    pathophysiology: str = ""
+    biomechanics: str = ""
+    clinical_presentation: str = ""
+    physical_examination: str = ""
+    imaging_findings: str = ""
+    differential_diagnosis: str = ""
+    treatment_conservative: str = ""
+    treatment_interventional: str = ""
+    treatment_surgical: str = ""
+    rehabilitation_protocol: str = ""
+    prognosis: str = ""
+    references: List[str] = []
+    images: List[str] = []
     created_at: str
     updated_at: str
     created_by: str = ""
@@ -216,6 +328,21 @@ class DiseaseResponse(BaseModel):
     prognosis_pt: Optional[str] = None
     prognosis_es: Optional[str] = None
 
+class DiseaseSummary(BaseModel):
+    """Lightweight listing row: enough to render a name, badge and excerpt"""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    name: str
+    category_id: str
+    category_name: str = ""
+    tags: List[str] = []
+    excerpt: str = ""
+    version: int = 1
+
+class DiseaseSummaryPage(BaseModel):
+    items: List[DiseaseSummary]
+    next_cursor: Optional[str] = None
+
 class BookmarkCreate(BaseModel):
     disease_id: str
 
@@ -253,11 +380,13 @@ class RecentViewResponse(BaseModel):
 
 # ==================== HELPER FUNCTIONS ====================
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+password_hasher = PasswordHasher(BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS)
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await password_hasher.verify(password, hashed)
 
 def create_token(user_id: str, email: str, role: str) -> str:
     payload = {
@@ -277,13 +406,28 @@ def decode_token(token: str) -> dict:
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+user_cache = LRUCache(USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
     payload = decode_token(token)
-    user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user
+    user = user_cache.get(payload["sub"])
+    if user is None:
+        user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0, "password": 0})
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found")
+        user_cache.set(payload["sub"], user)
+    return dict(user)
+
+async def get_token_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """User identity taken from the verified token claims, without a database lookup.
+    
+    Only for reads of the caller's own data: the claims can outlive the account or
+    its role until the token expires, so writes and permission checks must use
+    get_current_user.
+    """
+    payload = decode_token(credentials.credentials)
+    return {"id": payload["sub"], "email": payload.get("email"), "role": payload.get("role")}
 
 async def require_role(roles: List[str]):
     async def role_checker(user: dict = Depends(get_current_user)):
@@ -292,6 +436,281 @@ async def require_role(roles: List[str]):
         return user
     return role_checker
 
+# ==================== DATABASE INDEXES ====================
+
+# Indexes required by the hot query paths: (collection, keys, options)
+REQUIRED_INDEXES = [
+    ("diseases", [("id", ASCENDING)], {"unique": True}),
+    ("diseases", [("name", ASCENDING), ("id", ASCENDING)], {}),
+    ("diseases", [("category_id", ASCENDING), ("name", ASCENDING)], {}),
+    ("diseases", [("tags", ASCENDING), ("name", ASCENDING)], {}),
+    ("categories", [("id", ASCENDING)], {"unique": True}),
+    ("categories", [("order", ASCENDING)], {}),
+    ("users", [("id", ASCENDING)], {"unique": True}),
+    ("users", [("email", ASCENDING)], {"unique": True}),
+    ("bookmarks", [("user_id", ASCENDING), ("disease_id", ASCENDING)], {"unique": True}),
+    ("bookmarks", [("user_id", ASCENDING), ("created_at", DESCENDING)], {}),
+    ("bookmarks", [("disease_id", ASCENDING)], {}),
+    ("notes", [("id", ASCENDING)], {"unique": True}),
+    ("notes", [("user_id", ASCENDING), ("disease_id", ASCENDING)], {"unique": True}),
+    ("notes", [("user_id", ASCENDING), ("updated_at", DESCENDING)], {}),
+    ("notes", [("disease_id", ASCENDING)], {}),
+    ("recent_view_lists", [("user_id", ASCENDING)], {"unique": True}),
+    ("recent_view_lists", [("views.disease_id", ASCENDING)], {}),
+    ("translation_jobs", [("id", ASCENDING)], {"unique": True}),
+    ("translation_jobs", [("status", ASCENDING), ("lease_expires_at", ASCENDING)], {}),
+    ("translation_jobs", [("status", ASCENDING), ("run_at", ASCENDING)], {}),
+    ("translation_jobs", [("updated_at", ASCENDING)], {}),
+    ("translation_jobs", [("disease_id", ASCENDING), ("target_language", ASCENDING), ("status", ASCENDING)], {}),
+    ("disease_versions", [("disease_id", ASCENDING), ("version", DESCENDING)], {"unique": True}),
+]
+
+async def dedupe_disease_versions() -> int:
+    """Keep the newest record of each (disease_id, version) so the unique index can be built"""
+    pipeline = [
+        {"$sort": {"_id": -1}},
+        {"$group": {"_id": {"disease_id": "$disease_id", "version": "$version"}, "ids": {"$push": "$_id"}}},
+        {"$match": {"ids.1": {"$exists": True}}}
+    ]
+    duplicates = [record_id async for group in db.disease_versions.aggregate(pipeline) for record_id in group["ids"][1:]]
+    if duplicates:
+        await db.disease_versions.delete_many({"_id": {"$in": duplicates}})
+        logger.warning(f"Removed {len(duplicates)} duplicate disease versions before building their unique index")
+    return len(duplicates)
+
+# Run before creating a unique index that existing data may violate: "collection.index name" -> cleanup
+INDEX_PREPARATIONS: Dict[str, Callable[[], Awaitable[int]]] = {
+    "disease_versions.disease_id_1_version_-1": dedupe_disease_versions,
+}
+
+def index_name(keys: list) -> str:
+    """Default MongoDB index name for a key pattern, e.g. user_id_1_disease_id_1"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+async def ensure_indexes() -> Dict[str, Any]:
+    """Create the declared indexes idempotently and report drift against the live database"""
+    report = {"created": [], "failed": [], "mismatched": [], "unexpected": []}
+    
+    declared = {}
+    for collection, keys, options in REQUIRED_INDEXES:
+        declared.setdefault(collection, {})[index_name(keys)] = (keys, options)
+    
+    for collection, indexes in declared.items():
+        existing = await db[collection].index_information()
+        
+        for name, (keys, options) in indexes.items():
+            current = existing.get(name)
+            if current is None:
+                try:
+                    prepare = INDEX_PREPARATIONS.get(f"{collection}.{name}")
+                    if prepare:
+                        await prepare()
+                    await db[collection].create_index(keys, name=name, **options)
+                    report["created"].append(f"{collection}.{name}")
+                except OperationFailure as e:
+                    # e.g. duplicate data blocking a unique index; keep serving, surface it
+                    logger.error(f"Index creation failed for {collection}.{name}: {str(e)}")
+                    report["failed"].append(f"{collection}.{name}")
+            elif bool(current.get("unique", False)) != bool(options.get("unique", False)):
+                report["mismatched"].append(f"{collection}.{name}")
+        
+        for name in existing:
+            if name != "_id_" and name not in indexes:
+                report["unexpected"].append(f"{collection}.{name}")
+    
+    if report["created"]:
+        logger.info(f"Created indexes: {', '.join(report['created'])}")
+    if report["failed"] or report["mismatched"] or report["unexpected"]:
+        logger.warning(
+            f"Index drift - failed: {report['failed']}, "
+            f"mismatched: {report['mismatched']}, unexpected: {report['unexpected']}"
+        )
+    
+    return report
+
+def hot_path_queries() -> List[Dict[str, Any]]:
+    """Representative query shapes issued by the API endpoints, for plan verification"""
+    sample = "00000000-0000-0000-0000-000000000000"
+    return [
+        {"endpoint": "get_disease", "collection": "diseases", "filter": {"id": sample}},
+        {"endpoint": "get_diseases", "collection": "diseases", "filter": {}, "sort": [("name", 1)]},
+        {"endpoint": "get_diseases?category_id", "collection": "diseases", "filter": {"category_id": sample}, "sort": [("name", 1)]},
+        {"endpoint": "get_diseases?tag", "collection": "diseases", "filter": {"tags": "acute"}, "sort": [("name", 1)]},
+        {"endpoint": "get_categories", "collection": "categories", "filter": {}, "sort": [("order", 1)]},
+        {"endpoint": "update_category", "collection": "categories", "filter": {"id": sample}},
+        {"endpoint": "get_current_user", "collection": "users", "filter": {"id": sample}},
+        {"endpoint": "login", "collection": "users", "filter": {"email": "nobody@example.com"}},
+        {"endpoint": "get_bookmarks", "collection": "bookmarks", "filter": {"user_id": sample}, "sort": [("created_at", -1)]},
+        {"endpoint": "delete_bookmark", "collection": "bookmarks", "filter": {"user_id": sample, "disease_id": sample}},
+        {"endpoint": "get_notes", "collection": "notes", "filter": {"user_id": sample}, "sort": [("updated_at", -1)]},
+        {"endpoint": "get_note_for_disease", "collection": "notes", "filter": {"user_id": sample, "disease_id": sample}},
+        {"endpoint": "delete_note", "collection": "notes", "filter": {"id": sample, "user_id": sample}},
+        {"endpoint": "get_recent_views", "collection": "recent_view_lists", "filter": {"user_id": sample}},
+        {"endpoint": "get_disease_versions", "collection": "disease_versions", "filter": {"disease_id": sample}, "sort": [("version", -1)]},
+    ]
+
+def plan_stages(plan: Any) -> List[str]:
+    """Collect every stage name in an explain() plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(plan_stages(item))
+    return stages
+
+async def verify_query_plans() -> List[Dict[str, Any]]:
+    """Run explain() on every hot-path query and flag collection scans"""
+    results = []
+    for query in hot_path_queries():
+        cursor = db[query["collection"]].find(query["filter"])
+        if query.get("sort"):
+            cursor = cursor.sort(query["sort"])
+        explain = await cursor.explain()
+        stages = plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        results.append({
+            "endpoint": query["endpoint"],
+            "collection": query["collection"],
+            "stages": stages,
+            "collection_scan": "COLLSCAN" in stages
+        })
+    return results
+
+# ==================== HTTP CACHING ====================
+
+# Single document counting catalog writes; list endpoints derive their ETag from it
+CATALOG_META_ID = "catalog"
+
+async def get_catalog_meta() -> dict:
+    return await db.catalog_meta.find_one({"_id": CATALOG_META_ID}) or {}
+
+async def bump_catalog_revision(categories: bool = False):
+    """Record a catalog write; categories=True also marks category names/counts as changed"""
+    now = datetime.now(timezone.utc).isoformat()
+    increments = {"revision": 1}
+    updates = {"updated_at": now}
+    if categories:
+        increments["category_revision"] = 1
+        updates["category_updated_at"] = now
+    await db.catalog_meta.update_one(
+        {"_id": CATALOG_META_ID},
+        {"$inc": increments, "$set": updates},
+        upsert=True
+    )
+
+async def disease_changed(disease_id: str):
+    """Call after any write to a disease document"""
+    disease_cache.invalidate(disease_id)
+    await bump_catalog_revision()
+
+async def categories_changed():
+    """Call after any write to the categories collection"""
+    # Cached disease responses embed the category name
+    disease_cache.clear()
+    await bump_catalog_revision(categories=True)
+
+def make_etag(*parts) -> str:
+    return 'W/"' + hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:24] + '"'
+
+def http_date(iso_timestamp: Optional[str]) -> Optional[str]:
+    if not iso_timestamp:
+        return None
+    try:
+        return format_datetime(datetime.fromisoformat(iso_timestamp).astimezone(timezone.utc), usegmt=True)
+    except ValueError:
+        return None
+
+def is_not_modified(request: Request, etag: str, modified_at: Optional[str]) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no If-None-Match was sent.
+    
+    modified_at is the stored ISO timestamp behind the Last-Modified header. The header
+    has whole seconds, so a later write in the same second would look unmodified; unless
+    the timestamp is a whole second, If-Modified-Since is answered in full and only the
+    ETag earns a 304.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        # Weak comparison: W/"x" matches "x"
+        return "*" in tags or any(t.removeprefix("W/") == etag.removeprefix("W/") for t in tags)
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and modified_at:
+        try:
+            modified = datetime.fromisoformat(modified_at)
+            if modified.microsecond:
+                return False
+            return modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def validator_headers(etag: str, last_modified: Optional[str]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+def not_modified(etag: str, last_modified: Optional[str]) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+# ==================== SERVER-SENT EVENTS ====================
+
+# Progress callback of the streaming endpoints: (event name, payload)
+EventEmitter = Callable[[str, dict], Awaitable[None]]
+
+# Work started by a stream keeps running if the client disconnects; hold it here until done
+streaming_work: set = set()
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def stream_events(run: Callable[[EventEmitter], Awaitable[Any]]) -> AsyncIterator[str]:
+    """Run work that reports progress through an emit callback, yielding each report as an SSE event.
+    
+    The work's return value is sent as a final 'done' event (or 'error' if it raised).
+    Comments are sent while idle so proxies keep the connection open.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def emit(event: str, data: dict):
+        await queue.put(sse_event(event, data))
+    
+    async def work():
+        try:
+            await queue.put(sse_event("done", await run(emit)))
+        except HTTPException as e:
+            await queue.put(sse_event("error", {"status_code": e.status_code, "detail": e.detail}))
+        except Exception as e:
+            logger.exception("Streamed work failed")
+            await queue.put(sse_event("error", {"status_code": 500, "detail": str(e)}))
+        finally:
+            await queue.put(None)
+    
+    task = asyncio.create_task(work())
+    streaming_work.add(task)
+    task.add_done_callback(streaming_work.discard)
+    
+    while True:
+        try:
+            item = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+        except asyncio.TimeoutError:
+            yield ": keepalive\n\n"
+            continue
+        if item is None:
+            break
+        yield item
+
+def sse_response(run: Callable[[EventEmitter], Awaitable[Any]]) -> StreamingResponse:
+    return StreamingResponse(
+        stream_events(run),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # ==================== AUTH ROUTES ====================
 
 @api_router.post("/auth/register", response_model=TokenResponse)
@@ -309,13 +728,17 @@ async def register(user_data: UserCreate):
         "id": user_id,
         "email": user_data.email,
         "name": user_data.name,
-        "password": hash_password(user_data.password),
+        "password": await hash_password(user_data.password),
         "role": user_data.role,
         "created_at": now,
         "email_verified": False
     }
     
-    await db.users.insert_one(user_doc)
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # Registered concurrently since the check above
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     token = create_token(user_id, user_data.email, user_data.role)
     
@@ -336,9 +759,17 @@ async def login(credentials: UserLogin):
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not verify_password(credentials.password, user["password"]):
+    if not await verify_password(credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    # Upgrade the stored hash to the configured cost now that we have the plaintext
+    if password_hasher.needs_rehash(user["password"]):
+        result = await db.users.update_one(
+            {"id": user["id"], "password": user["password"]},
+            {"$set": {"password": await hash_password(credentials.password)}}
+        )
+        password_hasher.rehashed += result.modified_count
+    
     token = create_token(user["id"], user["email"], user["role"])
     
     return TokenResponse(
@@ -364,15 +795,44 @@ async def get_me(user: dict = Depends(get_current_user)):
 
 # ==================== CATEGORY ROUTES ====================
 
-@api_router.get("/categories", response_model=List[CategoryResponse])
-async def get_categories():
-    categories = await db.categories.find({}, {"_id": 0}).sort("order", 1).to_list(100)
+async def adjust_category_count(category_id: Optional[str], delta: int):
+    """Apply a delta to the materialized disease_count of a category"""
+    if not category_id or delta == 0:
+        return
+    await db.categories.update_one(
+        {"id": category_id},
+        {"$inc": {"disease_count": delta}}
+    )
+
+async def rebuild_category_counts() -> Dict[str, int]:
+    """Recompute every category's disease_count with a single $group aggregation"""
+    pipeline = [
+        {"$group": {"_id": "$category_id", "count": {"$sum": 1}}}
+    ]
+    counts = {r["_id"]: r["count"] for r in await db.diseases.aggregate(pipeline).to_list(None)}
     
-    # Count diseases for each category
-    for cat in categories:
-        count = await db.diseases.count_documents({"category_id": cat["id"]})
-        cat["disease_count"] = count
+    categories = await db.categories.find({}, {"_id": 0, "id": 1}).to_list(None)
+    if categories:
+        await db.categories.bulk_write([
+            UpdateOne({"id": cat["id"]}, {"$set": {"disease_count": counts.get(cat["id"], 0)}})
+            for cat in categories
+        ], ordered=False)
+    await bump_catalog_revision(categories=True)
     
+    return {cat["id"]: counts.get(cat["id"], 0) for cat in categories}
+
+@api_router.get("/categories", response_model=List[CategoryResponse])
+async def get_categories(request: Request, response: Response):
+    # Counts change with disease writes, so any catalog revision invalidates the listing
+    meta = await get_catalog_meta()
+    etag = make_etag("categories", meta.get("revision", 0))
+    last_modified = http_date(meta.get("updated_at"))
+    if is_not_modified(request, etag, meta.get("updated_at")):
+        return not_modified(etag, last_modified)
+    
+    # disease_count is maintained by the disease write paths, so this is a single query
+    categories = await db.categories.find({}, {"_id": 0}).sort("order", 1).to_list(100)
+    response.headers.update(validator_headers(etag, last_modified))
     return categories
 
 @api_router.post("/categories", response_model=CategoryResponse)
@@ -389,11 +849,12 @@ async def create_category(
         "name": category.name,
         "description": category.description or "",
         "icon": category.icon or "folder",
-        "order": category.order or 0
+        "order": category.order or 0,
+        "disease_count": 0
     }
     
     await db.categories.insert_one(cat_doc)
-    cat_doc["disease_count"] = 0
+    await categories_changed()
     return cat_doc
 
 class CategoryOrderUpdate(BaseModel):
@@ -414,6 +875,7 @@ async def reorder_categories(
             {"id": cat_id},
             {"$set": {"order": index}}
         )
+    await categories_changed()
     
     return {"message": "Categories reordered", "new_order": order_update.category_ids}
 
@@ -426,22 +888,22 @@ async def update_category(
     if user["role"] not in [UserRole.ADMIN, UserRole.EDITOR]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     
-    result = await db.categories.update_one(
+    cat = await db.categories.find_one_and_update(
         {"id": category_id},
         {"$set": {
             "name": category.name,
             "description": category.description or "",
             "icon": category.icon or "folder",
             "order": category.order or 0
-        }}
+        }},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
     
-    if result.matched_count == 0:
+    if not cat:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    cat = await db.categories.find_one({"id": category_id}, {"_id": 0})
-    count = await db.diseases.count_documents({"category_id": category_id})
-    cat["disease_count"] = count
+    await categories_changed()
     return cat
 
 @api_router.delete("/categories/{category_id}")
@@ -460,6 +922,7 @@ async def delete_category(
     result = await db.categories.delete_one({"id": category_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Category not found")
+    await categories_changed()
     
     return {"message": "Category deleted"}
 
@@ -467,10 +930,23 @@ async def delete_category(
 
 @api_router.get("/diseases", response_model=List[DiseaseResponse])
 async def get_diseases(
+    request: Request,
+    response: Response,
     category_id: Optional[str] = None,
     tag: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    lang: str = "en"
 ):
+    if lang not in SEARCH_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+    
+    meta = await get_catalog_meta()
+    etag = make_etag("diseases", meta.get("revision", 0), category_id, tag, search, lang)
+    last_modified = http_date(meta.get("updated_at"))
+    if is_not_modified(request, etag, meta.get("updated_at")):
+        return not_modified(etag, last_modified)
+    response.headers.update(validator_headers(etag, last_modified))
+    
     query = {}
     
     if category_id:
@@ -478,14 +954,16 @@ async def get_diseases(
     if tag:
         query["tags"] = tag
     if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"definition": {"$regex": search, "$options": "i"}},
-            {"clinical_presentation": {"$regex": search, "$options": "i"}}
-        ]
+        ranked_ids = [doc_id for doc_id, _ in search_engine.search(search, lang)]
+        query["id"] = {"$in": ranked_ids}
     
     diseases = await db.diseases.find(query, {"_id": 0}).sort("name", 1).to_list(1000)
     
+    if search:
+        # Keep relevance order from the search index
+        rank = {doc_id: i for i, doc_id in enumerate(ranked_ids)}
+        diseases.sort(key=lambda d: rank[d["id"]])
+    
     # Add category names
     categories = {c["id"]: c["name"] for c in await db.categories.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(100)}
     for disease in diseases:
@@ -493,17 +971,326 @@ async def get_diseases(
     
     return diseases
 
-@api_router.get("/diseases/{disease_id}", response_model=DiseaseResponse)
-async def get_disease(disease_id: str):
-    disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
-    if not disease:
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def localized(field: str, lang: str):
+    """Aggregation expression for a field in lang, falling back to English when missing or empty"""
+    english = {"$ifNull": [f"${field}", ""]}
+    if lang == "en":
+        return english
+    translated = f"${field}_{lang}"
+    return {"$cond": [{"$gt": [{"$ifNull": [translated, ""]}, ""]}, translated, english]}
+
+def summary_projection(lang: str) -> dict:
+    return {
+        "_id": 0,
+        "id": 1,
+        "category_id": 1,
+        "tags": 1,
+        "version": 1,
+        "name": localized("name", lang),
+        "excerpt": {"$substrCP": [localized("definition", lang), 0, SUMMARY_EXCERPT_FETCH_LENGTH]}
+    }
+
+# A tag or entity cut off by the end of the fetched HTML
+PARTIAL_MARKUP_RE = re.compile(r'<[^>]*$|&[#\w]*$')
+
+def summary_excerpt(html: str) -> str:
+    """Plain-text excerpt of SUMMARY_EXCERPT_LENGTH characters from the start of a definition"""
+    text = " ".join(strip_html(PARTIAL_MARKUP_RE.sub("", html)).split())
+    return text[:SUMMARY_EXCERPT_LENGTH]
+
+@api_router.get("/diseases/summary", response_model=DiseaseSummaryPage)
+async def get_disease_summaries(
+    category_id: Optional[str] = None,
+    tag: Optional[str] = None,
+    search: Optional[str] = None,
+    lang: str = "en",
+    cursor: Optional[str] = None,
+    limit: int = DISEASE_PAGE_SIZE
+):
+    """Paginated disease listing that only loads id, name, category, tags and an excerpt.
+    
+    Without search, pages are keyset-paginated on (name, id). With search, pages follow
+    relevance order and the cursor is the position in the ranked results.
+    """
+    if lang not in SEARCH_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+    limit = max(1, min(limit, MAX_DISEASE_PAGE_SIZE))
+    
+    query = {}
+    if category_id:
+        query["category_id"] = category_id
+    if tag:
+        query["tags"] = tag
+    
+    if search:
+        ranked_ids = [doc_id for doc_id, _ in search_engine.search(search, lang)]
+        if query:
+            matching = await db.diseases.find(
+                {**query, "id": {"$in": ranked_ids}}, {"_id": 0, "id": 1}
+            ).to_list(None)
+            matching_ids = {d["id"] for d in matching}
+            ranked_ids = [doc_id for doc_id in ranked_ids if doc_id in matching_ids]
+        
+        offset = 0
+        if cursor:
+            values = decode_cursor(cursor)
+            if len(values) != 1 or not isinstance(values[0], int) or values[0] < 0:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            offset = values[0]
+        page_ids = ranked_ids[offset:offset + limit]
+        
+        pipeline = [
+            {"$match": {"id": {"$in": page_ids}}},
+            {"$project": summary_projection(lang)}
+        ]
+        items = await db.diseases.aggregate(pipeline).to_list(None)
+        rank = {doc_id: i for i, doc_id in enumerate(page_ids)}
+        items.sort(key=lambda d: rank[d["id"]])
+        next_cursor = encode_cursor([offset + limit]) if offset + limit < len(ranked_ids) else None
+    else:
+        if cursor:
+            values = decode_cursor(cursor)
+            if len(values) != 2:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            last_name, last_id = values
+            query["$or"] = [
+                {"name": {"$gt": last_name}},
+                {"name": last_name, "id": {"$gt": last_id}}
+            ]
+        
+        pipeline = [
+            {"$match": query},
+            {"$sort": {"name": 1, "id": 1}},
+            {"$limit": limit + 1},
+            # Keep the stored (English) name for the cursor; the projection may localize it
+            {"$addFields": {"sort_name": "$name"}},
+            {"$project": {**summary_projection(lang), "sort_name": 1}}
+        ]
+        items = await db.diseases.aggregate(pipeline).to_list(None)
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor([items[-1]["sort_name"], items[-1]["id"]])
+    
+    categories = {c["id"]: c["name"] for c in await db.categories.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(100)}
+    for item in items:
+        item["category_name"] = categories.get(item.get("category_id", ""), "")
+        item["excerpt"] = summary_excerpt(item.get("excerpt") or "")
+    
+    return {"items": items, "next_cursor": next_cursor}
+
+# Fields returned with every single-disease fetch, whatever fieldset is requested
+DISEASE_CORE_FIELDS = ["id", "name", "category_id", "tags", "created_at", "updated_at", "created_by", "version"]
+
+DISEASE_GLOBAL_META_FIELDS = [
+    "last_edited_language", "last_edited_at", "last_edited_by", "last_edited_section",
+    "last_translation_source", "last_translation_at"
+]
+
+# Everything a caller may name in ?fields=
+SELECTABLE_DISEASE_FIELDS = (
+    SECTION_FIELDS + ["references", "images"]
+    + [f"{section}_media" for section in SECTION_FIELDS + ["references"]]
+    + [f"{section}_edit_meta" for section in SECTION_FIELDS + ["references"]]
+    + [f"{section}_media_meta" for section in SECTION_FIELDS + ["references"]]
+)
+
+def disease_projection(lang: Optional[str], fields: Optional[List[str]]) -> dict:
+    """Build a $project stage for a language-scoped and/or sparse disease fetch.
+    
+    With lang, translated fields (name and the 13 sections) are coalesced into their
+    base keys, falling back to English, and the other languages are not loaded.
+    Without lang, every language variant of the selected sections is included.
+    """
+    selected = fields if fields is not None else SELECTABLE_DISEASE_FIELDS + DISEASE_GLOBAL_META_FIELDS
+    projection = {"_id": 0}
+    
+    for field in DISEASE_CORE_FIELDS + selected:
+        translatable = field == "name" or field in SECTION_FIELDS
+        if not translatable:
+            projection[field] = 1
+        elif lang is None:
+            projection[field] = 1
+            for other in SEARCH_LANGUAGES:
+                if other != "en":
+                    projection[f"{field}_{other}"] = 1
+        elif lang == "en":
+            projection[field] = 1
+        else:
+            projection[field] = localized(field, lang)
+    
+    if lang is not None:
+        projection["content_language"] = {"$literal": lang}
+    return projection
+
+class DiseaseResponseCache:
+    """Serialized get_disease bodies (with their ETag and Last-Modified) keyed by (id, stamp, lang, fields).
+    
+    The stamp (version, updated_at, category revision) of the cached document is
+    remembered per disease, so lookups hit the entry for the latest known stamp.
+    Every write path in this process calls invalidate(), which forgets the stamp;
+    a load that raced with a write is discarded by comparing generations. Writes
+    from other processes don't reach invalidate(), so once a stamp is older than
+    revalidate_after seconds, needs_check() asks the caller to read the stored
+    stamp and confirm() it before serving. Concurrent misses for the same key
+    share one load.
+    """
+    
+    def __init__(self, max_size: int, ttl: float, revalidate_after: float):
+        self.entries = LRUCache(max_size, ttl)
+        self.loads = SingleFlight()
+        self.revalidate_after = revalidate_after
+        self.latest_stamps: Dict[str, tuple] = {}
+        self.checked_at: Dict[str, float] = {}
+        self.generations: Dict[str, int] = {}
+        self.epoch = 0
+    
+    def generation(self, disease_id: str) -> tuple:
+        return (self.epoch, self.generations.get(disease_id, 0))
+    
+    def get(self, disease_id: str, variant: tuple) -> Optional[tuple]:
+        stamp = self.latest_stamps.get(disease_id)
+        return self.entries.get((disease_id, stamp, *variant))
+    
+    def needs_check(self, disease_id: str) -> bool:
+        return time.monotonic() - self.checked_at.get(disease_id, 0.0) >= self.revalidate_after
+    
+    def confirm(self, disease_id: str, stamp: Optional[tuple]) -> bool:
+        """Keep the cached entries if stamp is still the stored one, otherwise drop them"""
+        if stamp is not None and stamp == self.latest_stamps.get(disease_id):
+            self.checked_at[disease_id] = time.monotonic()
+            return True
+        self.invalidate(disease_id)
+        return False
+    
+    def put(self, disease_id: str, generation: tuple, stamp: tuple, variant: tuple, entry: tuple):
+        if generation != self.generation(disease_id):
+            return
+        if self.latest_stamps.get(disease_id) != stamp:
+            self.latest_stamps[disease_id] = stamp
+            self.checked_at[disease_id] = time.monotonic()
+        self.entries.set((disease_id, stamp, *variant), entry)
+    
+    def invalidate(self, disease_id: str):
+        self.generations[disease_id] = self.generations.get(disease_id, 0) + 1
+        self.latest_stamps.pop(disease_id, None)
+        self.checked_at.pop(disease_id, None)
+        self.entries.delete_where(lambda key: key[0] == disease_id)
+    
+    def clear(self):
+        self.epoch += 1
+        self.latest_stamps.clear()
+        self.checked_at.clear()
+        self.entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.entries.stats(), "coalesced_loads": self.loads.coalesced}
+
+disease_cache = DiseaseResponseCache(
+    DISEASE_CACHE_SIZE, DISEASE_CACHE_TTL_SECONDS, DISEASE_CACHE_REVALIDATE_SECONDS
+)
+
+def disease_stamp(disease: dict, meta: dict) -> tuple:
+    """What a cached disease body depends on: its version, last write and the category names"""
+    return (disease.get("version", 1), disease.get("updated_at"), meta.get("category_revision", 0))
+
+async def read_disease_stamp(disease_id: str) -> Optional[tuple]:
+    disease, meta = await asyncio.gather(
+        db.diseases.find_one({"id": disease_id}, {"_id": 0, "version": 1, "updated_at": 1}),
+        get_catalog_meta()
+    )
+    return disease_stamp(disease, meta) if disease else None
+
+async def load_disease_body(
+    disease_id: str,
+    lang: Optional[str],
+    field_list: Optional[List[str]],
+    generation: tuple
+) -> tuple:
+    """Read one disease (with its category) from Mongo, serialize it and cache (body, etag, modified_at)"""
+    if lang is None and field_list is None:
+        projection = {"_id": 0}
+    else:
+        projection = disease_projection(lang, field_list)
+    pipeline = [
+        {"$match": {"id": disease_id}},
+        {"$limit": 1},
+        {"$project": projection},
+        {"$lookup": {"from": "categories", "localField": "category_id", "foreignField": "id", "as": "category"}}
+    ]
+    found, meta = await asyncio.gather(db.diseases.aggregate(pipeline).to_list(1), get_catalog_meta())
+    if not found:
         raise HTTPException(status_code=404, detail="Disease not found")
     
-    # Get category name
-    category = await db.categories.find_one({"id": disease.get("category_id", "")}, {"_id": 0})
-    disease["category_name"] = category["name"] if category else ""
+    disease = found[0]
+    category = disease.pop("category")
+    disease["category_name"] = category[0]["name"] if category else ""
+    
+    stamp = disease_stamp(disease, meta)
+    variant = (lang, tuple(field_list) if field_list is not None else None)
+    etag = make_etag("disease", disease_id, *stamp, *variant)
+    modified_at = max(disease.get("updated_at") or "", meta.get("category_updated_at") or "")
+    body = DiseaseResponse.model_validate(disease).model_dump_json(exclude_unset=True)
+    entry = (body, etag, modified_at)
+    disease_cache.put(disease_id, generation, stamp, variant, entry)
+    return entry
+
+@api_router.get(
+    "/diseases/{disease_id}",
+    response_model=DiseaseResponse,
+    response_model_exclude_unset=True
+)
+async def get_disease(
+    request: Request,
+    disease_id: str,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """Fetch one disease; ?lang= scopes it to one language, ?fields= to a sparse fieldset"""
+    if lang is not None and lang not in SEARCH_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+    
+    field_list = None
+    if fields is not None:
+        field_list = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in field_list if f not in SELECTABLE_DISEASE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    
+    variant = (lang, tuple(field_list) if field_list is not None else None)
+    entry = disease_cache.get(disease_id, variant)
+    if entry is not None and disease_cache.needs_check(disease_id):
+        # Another process may have written since the entry was loaded or last checked
+        if not disease_cache.confirm(disease_id, await read_disease_stamp(disease_id)):
+            entry = None
+    if entry is None:
+        generation = disease_cache.generation(disease_id)
+        entry = await disease_cache.loads.do(
+            (disease_id, *variant),
+            lambda: load_disease_body(disease_id, lang, field_list, generation)
+        )
     
-    return disease
+    body, etag, modified_at = entry
+    last_modified = http_date(modified_at)
+    if is_not_modified(request, etag, modified_at):
+        return not_modified(etag, last_modified)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=validator_headers(etag, last_modified)
+    )
 
 @api_router.post("/diseases", response_model=DiseaseResponse)
 async def create_disease(
@@ -531,19 +1318,31 @@ async def create_disease(
     }
     
     await db.diseases.insert_one(disease_doc)
+    await adjust_category_count(disease.category_id, 1)
+    await disease_changed(disease_id)
+    search_engine.add(disease_doc)
     
     # Store version history
-    await db.disease_versions.insert_one({
-        "disease_id": disease_id,
-        "version": 1,
-        "data": disease_doc,
-        "created_by": user["id"],
-        "created_at": now
-    })
+    await version_history.record(disease_id, disease_doc, created_by=user["id"], created_at=now, edit_type="create")
     
+    disease_doc.pop("_id", None)
     disease_doc["category_name"] = category["name"]
     return disease_doc
 
+async def apply_disease_edit(disease_id: str, update_data: Dict[str, Any]) -> Optional[dict]:
+    """Write an edit and take the next version number in one atomic update; returns the updated disease.
+    
+    Concurrent edits of the same disease each get their own version, so their history records never collide.
+    """
+    updated = await db.diseases.find_one_and_update(
+        {"id": disease_id},
+        {"$set": update_data, "$inc": {"version": 1}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    await disease_changed(disease_id)
+    return updated
+
 @api_router.put("/diseases/{disease_id}", response_model=DiseaseResponse)
 async def update_disease(
     disease_id: str,
@@ -560,23 +1359,25 @@ async def update_disease(
     now = datetime.now(timezone.utc).isoformat()
     update_data = {k: v for k, v in disease.model_dump().items() if v is not None}
     update_data["updated_at"] = now
-    update_data["version"] = existing.get("version", 1) + 1
     
-    await db.diseases.update_one(
-        {"id": disease_id},
-        {"$set": update_data}
-    )
+    updated = await apply_disease_edit(disease_id, update_data)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Disease not found")
     
-    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    if "name" in update_data and update_data["name"] != existing.get("name"):
+        await sync_disease_name(disease_id, update_data["name"])
+    
+    # Move the disease between category counts if it changed category
+    old_category_id = existing.get("category_id")
+    new_category_id = update_data.get("category_id", old_category_id)
+    if new_category_id != old_category_id:
+        await adjust_category_count(old_category_id, -1)
+        await adjust_category_count(new_category_id, 1)
+    
+    search_engine.add(updated)
     
     # Store version history
-    await db.disease_versions.insert_one({
-        "disease_id": disease_id,
-        "version": updated["version"],
-        "data": updated,
-        "created_by": user["id"],
-        "created_at": now
-    })
+    await version_history.record(disease_id, updated, created_by=user["id"], created_at=now, edit_type="full_update")
     
     # Get category name
     category = await db.categories.find_one({"id": updated.get("category_id", "")}, {"_id": 0})
@@ -592,14 +1393,25 @@ async def delete_disease(
     if user["role"] != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Only admins can delete diseases")
     
-    result = await db.diseases.delete_one({"id": disease_id})
-    if result.deleted_count == 0:
+    deleted = await db.diseases.find_one_and_delete(
+        {"id": disease_id},
+        projection={"_id": 0, "category_id": 1}
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Disease not found")
     
+    await adjust_category_count(deleted.get("category_id"), -1)
+    await disease_changed(disease_id)
+    search_engine.remove(disease_id)
+    
     # Clean up related data
     await db.bookmarks.delete_many({"disease_id": disease_id})
     await db.notes.delete_many({"disease_id": disease_id})
-    await db.recent_views.delete_many({"disease_id": disease_id})
+    recent_view_buffer.forget_disease(disease_id)
+    await db.recent_view_lists.update_many(
+        {"views.disease_id": disease_id},
+        {"$pull": {"views": {"disease_id": disease_id}}}
+    )
     
     return {"message": "Disease deleted"}
 
@@ -666,6 +1478,11 @@ async def inline_save_single_language(
     
     update_data[field_key] = sanitized
     
+    # A hand-edited translation is current for today's English text; an English edit
+    # leaves the existing translations to show up as stale by hash
+    if request.language != "en":
+        update_data[f"translation_sources.{request.section_id}.{request.language}"] = content_hash(disease.get(request.section_id) or "")
+    
     # Update section-level edit metadata
     section_meta_key = f"{request.section_id}_edit_meta"
     section_meta = {
@@ -681,28 +1498,21 @@ async def inline_save_single_language(
     update_data["last_edited_at"] = now
     update_data["last_edited_by"] = user["id"]
     update_data["last_edited_section"] = request.section_id
-    update_data["version"] = disease.get("version", 1) + 1
     
-    await db.diseases.update_one(
-        {"id": disease_id},
-        {"$set": update_data}
-    )
+    updated = await apply_disease_edit(disease_id, update_data)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Disease not found")
+    search_engine.add(updated)
     
     # Store version history
-    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
-    
-    # Create a copy for version history to avoid mutating updated dict
-    version_data = {**updated}
-    await db.disease_versions.insert_one({
-        "disease_id": disease_id,
-        "version": version_data["version"],
-        "data": version_data,
-        "created_by": user["id"],
-        "created_at": now,
-        "edit_type": "single_section",
-        "section_id": request.section_id,
-        "language": request.language
-    })
+    await version_history.record(
+        disease_id, updated,
+        created_by=user["id"],
+        created_at=now,
+        edit_type="single_section",
+        section_id=request.section_id,
+        language=request.language
+    )
     
     # Get category name
     category = await db.categories.find_one({"id": updated.get("category_id", "")}, {"_id": 0})
@@ -713,20 +1523,63 @@ async def inline_save_single_language(
         "disease": updated
     }
 
-@api_router.put("/diseases/{disease_id}/inline-save-translate")
+@api_router.put("/diseases/{disease_id}/inline-save-translate", status_code=status.HTTP_202_ACCEPTED)
 async def inline_save_and_translate(
     disease_id: str,
     request: InlineSaveAndTranslateRequest,
     user: dict = Depends(get_current_user)
 ):
-    """Save single section content and translate to other languages"""
+    """Save single section content and queue its translation to other languages"""
+    disease = await load_disease_for_inline_edit(disease_id, user)
+    return await save_and_translate_section(disease, request, user)
+
+@api_router.put("/diseases/{disease_id}/inline-save-translate/stream")
+async def inline_save_and_translate_stream(
+    disease_id: str,
+    request: InlineSaveAndTranslateRequest,
+    user: dict = Depends(get_current_user)
+):
+    """inline-save-translate reporting each language as Server-Sent Events as it finishes"""
+    disease = await load_disease_for_inline_edit(disease_id, user)
+    
+    async def run(emit: EventEmitter) -> dict:
+        saved = await save_and_translate_section(disease, request, user)
+        translations = saved["translations"]
+        for lang, result in translations.items():
+            if result["status"] != "queued":
+                await emit("translation", {"language": lang, **result})
+        
+        job = saved["job"]
+        if job:
+            job = await follow_translation_job(job["job_id"], emit)
+            translations.update(job["languages"])
+        
+        updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+        category = await db.categories.find_one({"id": updated.get("category_id", "")}, {"_id": 0})
+        updated["category_name"] = category["name"] if category else ""
+        translated_languages = [lang for lang, result in translations.items() if result["status"] == "translated"]
+        return {
+            "message": f"Saved in {request.source_language} and translated to {len(translated_languages)} languages",
+            "disease": updated,
+            "translations_count": len(translated_languages),
+            "translations": translations,
+            "job": job
+        }
+    
+    return sse_response(run)
+
+async def load_disease_for_inline_edit(disease_id: str, user: dict) -> dict:
     if user["role"] != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Only admins can edit diseases")
     
     disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
-    
+    return disease
+
+async def save_and_translate_section(disease: dict, request: InlineSaveAndTranslateRequest, user: dict) -> dict:
+    """Save a section in its source language and queue a job translating it to the target languages"""
+    disease_id = disease["id"]
     now = datetime.now(timezone.utc).isoformat()
     update_data = {"updated_at": now}
     
@@ -735,45 +1588,27 @@ async def inline_save_and_translate(
     sanitized = re.sub(r'on\w+\s*=', '', sanitized, flags=re.IGNORECASE)
     
     # Save source language content
+    update_data[language_field(request.section_id, request.source_language)] = sanitized
+    
+    targets = [lang for lang in dict.fromkeys(request.target_languages) if lang != request.source_language]
+    translation_results = {}
+    
+    # Translations already made from this exact English text are kept as they are
     if request.source_language == "en":
-        update_data[request.section_id] = sanitized
-    else:
-        update_data[f"{request.section_id}_{request.source_language}"] = sanitized
+        for lang in list(targets):
+            if translation_state(disease, request.section_id, lang, sanitized) == "current":
+                translation_results[lang] = {"status": "unchanged"}
+                targets.remove(lang)
     
-    # Translate to target languages
-    source_lang_name = LANGUAGE_NAMES.get(request.source_language, 'English')
-    translated_count = 0
+    if not sanitized.strip():
+        translation_results.update({lang: {"status": "skipped"} for lang in targets})
+        targets = []
     
-    try:
-        for target_lang in request.target_languages:
-            if target_lang == request.source_language:
-                continue
-                
-            target_lang_name = LANGUAGE_NAMES.get(target_lang, target_lang)
-            
-            chat = LlmChat(
-                api_key=EMERGENT_LLM_KEY,
-                session_id=f"translate-section-{uuid.uuid4()}",
-                system_message=f"""You are a professional medical translator. Translate medical/clinical text from {source_lang_name} to {target_lang_name}. 
-
-Rules:
-- Preserve all medical terminology accurately
-- Maintain the same formatting (bullet points, line breaks, markdown)
-- Only output the translated text, nothing else"""
-            ).with_model("openai", "gpt-4.1-mini")
-            
-            if sanitized and sanitized.strip():
-                user_message = UserMessage(text=sanitized)
-                translated = await chat.send_message(user_message)
-                
-                if target_lang == "en":
-                    update_data[request.section_id] = translated
-                else:
-                    update_data[f"{request.section_id}_{target_lang}"] = translated
-                translated_count += 1
-    except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
-        # Still save the source language even if translation fails
+    # Record which English text the saved version corresponds to; the job records it for each translation,
+    # or the English it writes when English is one of the targets
+    base_text = update_data.get(request.section_id, disease.get(request.section_id) or "")
+    if request.source_language != "en":
+        update_data[f"translation_sources.{request.section_id}.{request.source_language}"] = content_hash(base_text)
     
     # Update section-level edit metadata
     section_meta_key = f"{request.section_id}_edit_meta"
@@ -782,8 +1617,7 @@ Rules:
         "last_edited_by": user["id"],
         "last_edited_by_name": user.get("name", "Admin"),
         "last_edited_language": request.source_language,
-        "translated_at": now,
-        "translated_to": request.target_languages
+        "translated_to": [lang for lang, result in translation_results.items() if result["status"] == "unchanged"]
     }
     update_data[section_meta_key] = section_meta
     
@@ -792,40 +1626,48 @@ Rules:
     update_data["last_edited_at"] = now
     update_data["last_edited_by"] = user["id"]
     update_data["last_edited_section"] = request.section_id
-    update_data["last_translation_source"] = request.source_language
-    update_data["last_translation_at"] = now
-    update_data["version"] = disease.get("version", 1) + 1
     
-    await db.diseases.update_one(
-        {"id": disease_id},
-        {"$set": update_data}
-    )
+    updated = await apply_disease_edit(disease_id, update_data)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Disease not found")
+    search_engine.add(updated)
     
     # Store version history
-    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    await version_history.record(
+        disease_id, updated,
+        created_by=user["id"],
+        created_at=now,
+        edit_type="section_save_and_translate",
+        section_id=request.section_id,
+        source_language=request.source_language,
+        target_languages=request.target_languages
+    )
     
-    # Create a copy for version history to avoid mutating updated dict
-    version_data = {**updated}
-    await db.disease_versions.insert_one({
-        "disease_id": disease_id,
-        "version": version_data["version"],
-        "data": version_data,
-        "created_by": user["id"],
-        "created_at": now,
-        "edit_type": "section_save_and_translate",
-        "section_id": request.section_id,
-        "source_language": request.source_language,
-        "target_languages": request.target_languages
-    })
+    job = None
+    if targets:
+        job = await enqueue_translation_job(
+            "translate_section",
+            disease_id=disease_id,
+            section_id=request.section_id,
+            source_language=request.source_language,
+            target_languages=targets,
+            text=sanitized,
+            source_hash=content_hash(base_text),
+            completed_languages=[],
+            failed_languages={},
+            created_by=user["id"]
+        )
+        translation_results.update({lang: {"status": "queued"} for lang in targets})
     
     # Get category name
     category = await db.categories.find_one({"id": updated.get("category_id", "")}, {"_id": 0})
     updated["category_name"] = category["name"] if category else ""
     
     return {
-        "message": f"Saved in {request.source_language} and translated to {len(request.target_languages) - 1} languages",
+        "message": f"Saved in {request.source_language}, translating to {len(targets)} languages",
         "disease": updated,
-        "translations_count": translated_count
+        "translations": translation_results,
+        "job": job_progress(job) if job else None
     }
 
 @api_router.put("/diseases/{disease_id}/section-media")
@@ -852,8 +1694,7 @@ async def save_section_media(
     
     update_data = {
         media_field_key: media_list,
-        "updated_at": now,
-        "version": disease.get("version", 1) + 1
+        "updated_at": now
     }
     
     # Update section media metadata
@@ -866,25 +1707,18 @@ async def save_section_media(
     }
     update_data[media_meta_key] = media_meta
     
-    await db.diseases.update_one(
-        {"id": disease_id},
-        {"$set": update_data}
-    )
+    updated = await apply_disease_edit(disease_id, update_data)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Disease not found")
     
     # Store version history
-    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
-    
-    # Create a copy for version history to avoid mutating updated dict
-    version_data = {**updated}
-    await db.disease_versions.insert_one({
-        "disease_id": disease_id,
-        "version": version_data["version"],
-        "data": version_data,
-        "created_by": user["id"],
-        "created_at": now,
-        "edit_type": "section_media",
-        "section_id": request.section_id
-    })
+    await version_history.record(
+        disease_id, updated,
+        created_by=user["id"],
+        created_at=now,
+        edit_type="section_media",
+        section_id=request.section_id
+    )
     
     # Get category name
     category = await db.categories.find_one({"id": updated.get("category_id", "")}, {"_id": 0})
@@ -896,33 +1730,211 @@ async def save_section_media(
         "media_count": len(media_list)
     }
 
+# ==================== VERSION HISTORY ROUTES ====================
+
+VERSION_PAGE_SIZE = 100
+MAX_VERSION_PAGE_SIZE = 500
+
+# Bookkeeping that changes with every save; left out of version diffs
+VERSION_DIFF_IGNORED = {"version", "updated_at"} | set(DISEASE_GLOBAL_META_FIELDS)
+
+def version_languages(record: dict) -> List[str]:
+    """Languages an edit touched, from what its write path recorded"""
+    if record.get("language"):
+        return [record["language"]]
+    if record.get("source_language"):
+        return [record["source_language"]] + [
+            lang for lang in record.get("target_languages") or [] if lang != record["source_language"]
+        ]
+    return []
+
+async def version_summaries(records: List[dict]) -> List[dict]:
+    """History list entries, with author names from one batched users query"""
+    author_ids = list({record.get("created_by") for record in records if record.get("created_by")})
+    authors = {
+        author["id"]: author.get("name")
+        for author in await db.users.find({"id": {"$in": author_ids}}, {"_id": 0, "id": 1, "name": 1}).to_list(None)
+    }
+    return [
+        {
+            "version": record["version"],
+            "created_by": record.get("created_by"),
+            "created_by_name": authors.get(record.get("created_by")),
+            "created_at": record.get("created_at"),
+            "edit_type": record.get("edit_type"),
+            "section_id": record.get("section_id"),
+            "languages": version_languages(record)
+        }
+        for record in records
+    ]
+
+def word_changes(before: str, after: str) -> Dict[str, Any]:
+    """Changed runs of words between two HTML texts, compared as plain text"""
+    old_words, new_words = strip_html(before).split(), strip_html(after).split()
+    changes, added, removed = [], 0, 0
+    matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        removed += i2 - i1
+        added += j2 - j1
+        changes.append({"op": op, "before": " ".join(old_words[i1:i2]), "after": " ".join(new_words[j1:j2])})
+    return {"added_words": added, "removed_words": removed, "changes": changes}
+
+def section_diff(old: dict, new: dict, sections: List[str], languages: List[str]) -> Dict[str, Any]:
+    """Section-level differences between two versions of a disease"""
+    def status(before, after) -> str:
+        return "added" if not before else "removed" if not after else "modified"
+    
+    changed_sections = []
+    for section in sections:
+        translatable = section == "name" or section in SECTION_FIELDS
+        for lang in (languages if translatable else ["en"]):
+            field = section if lang == "en" else f"{section}_{lang}"
+            before, after = old.get(field) or "", new.get(field) or ""
+            if before == after:
+                continue
+            entry = {"section_id": section, "language": lang, "status": status(before, after), "before": before, "after": after}
+            if isinstance(before, list) or isinstance(after, list):
+                # List fields (references) are compared item by item
+                before_items, after_items = list(before or []), list(after or [])
+                entry.update({
+                    "kind": "list",
+                    "added_items": [item for item in after_items if item not in before_items],
+                    "removed_items": [item for item in before_items if item not in after_items]
+                })
+            else:
+                entry.update({"kind": "text", **word_changes(str(before), str(after))})
+            changed_sections.append(entry)
+        before_media, after_media = old.get(f"{section}_media") or [], new.get(f"{section}_media") or []
+        if before_media != after_media:
+            before_urls = [item.get("url") for item in before_media]
+            after_urls = [item.get("url") for item in after_media]
+            changed_sections.append({
+                "section_id": section,
+                "language": None,
+                "kind": "media",
+                "status": status(before_media, after_media),
+                "before_count": len(before_media),
+                "after_count": len(after_media),
+                "added_urls": [url for url in after_urls if url not in before_urls],
+                "removed_urls": [url for url in before_urls if url not in after_urls]
+            })
+    
+    # Other top-level fields (tags, category, references' images...) that changed
+    section_fields = set()
+    for section in sections:
+        section_fields.update({section, f"{section}_media", f"{section}_edit_meta", f"{section}_media_meta"})
+        section_fields.update(f"{section}_{lang}" for lang in SEARCH_LANGUAGES)
+    other_fields = sorted(
+        field for field in set(old) | set(new)
+        if field not in section_fields and field not in VERSION_DIFF_IGNORED
+        and not field.endswith(("_edit_meta", "_media_meta")) and old.get(field) != new.get(field)
+    )
+    return {"sections": changed_sections, "other_fields": other_fields}
+
 @api_router.get("/diseases/{disease_id}/versions")
 async def get_disease_versions(
     disease_id: str,
+    limit: int = VERSION_PAGE_SIZE,
+    before: Optional[int] = None,
     user: dict = Depends(get_current_user)
 ):
-    versions = await db.disease_versions.find(
-        {"disease_id": disease_id},
-        {"_id": 0}
-    ).sort("version", -1).to_list(100)
+    """Edit history without the documents: who changed what, when, in which languages.
+    
+    Newest first; pass the oldest version of a page as before to get the next one.
+    """
+    limit = max(1, min(limit, MAX_VERSION_PAGE_SIZE))
+    records = await version_history.listing(disease_id, limit, before)
+    return await version_summaries(records)
+
+@api_router.get("/diseases/{disease_id}/versions/diff")
+async def diff_disease_versions(
+    disease_id: str,
+    from_version: int,
+    to_version: int,
+    section_id: Optional[str] = None,
+    lang: Optional[str] = None,
+    user: dict = Depends(get_current_user)
+):
+    """Section-by-section differences between two versions"""
+    sections = ["name"] + SECTION_FIELDS + ["references"]
+    if section_id is not None:
+        if section_id not in sections:
+            raise HTTPException(status_code=400, detail=f"Unknown section: {section_id}")
+        sections = [section_id]
+    languages = SEARCH_LANGUAGES
+    if lang is not None:
+        if lang not in SEARCH_LANGUAGES:
+            raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+        languages = [lang]
+    
+    old, new = await asyncio.gather(
+        version_history.reconstruct(disease_id, from_version),
+        version_history.reconstruct(disease_id, to_version)
+    )
+    if old is None or new is None:
+        missing = from_version if old is None else to_version
+        raise HTTPException(status_code=404, detail=f"Version {missing} not found")
     
-    return versions
+    return {
+        "disease_id": disease_id,
+        "from_version": from_version,
+        "to_version": to_version,
+        **section_diff(old, new, sections, languages)
+    }
+
+@api_router.get("/diseases/{disease_id}/versions/{version}")
+async def get_disease_version(
+    disease_id: str,
+    version: int,
+    user: dict = Depends(get_current_user)
+):
+    """One version with the full disease document as it was then"""
+    found = await version_history.get(disease_id, version)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+    summary = (await version_summaries([found]))[0]
+    return {**summary, "data": found["data"]}
 
 # ==================== BOOKMARK ROUTES ====================
 
+async def attach_disease_names(rows: List[dict]) -> List[dict]:
+    """Fill disease_name on rows written before it was denormalized, with one batched query"""
+    missing = {row["disease_id"] for row in rows if not row.get("disease_name")}
+    if missing:
+        diseases = await db.diseases.find(
+            {"id": {"$in": list(missing)}},
+            {"_id": 0, "id": 1, "name": 1}
+        ).to_list(None)
+        names = {d["id"]: d["name"] for d in diseases}
+        for row in rows:
+            if not row.get("disease_name"):
+                row["disease_name"] = names.get(row["disease_id"], "Unknown")
+    return rows
+
+async def sync_disease_name(disease_id: str, name: str):
+    """Propagate a rename to every collection that denormalizes disease_name"""
+    for collection in (db.bookmarks, db.notes):
+        await collection.update_many(
+            {"disease_id": disease_id},
+            {"$set": {"disease_name": name}}
+        )
+    recent_view_buffer.rename_disease(disease_id, name)
+    await db.recent_view_lists.update_many(
+        {"views.disease_id": disease_id},
+        # A list holds each disease at most once, so the positional match is the only one
+        {"$set": {"views.$.disease_name": name}}
+    )
+
 @api_router.get("/bookmarks", response_model=List[BookmarkResponse])
-async def get_bookmarks(user: dict = Depends(get_current_user)):
+async def get_bookmarks(user: dict = Depends(get_token_user)):
     bookmarks = await db.bookmarks.find(
         {"user_id": user["id"]},
         {"_id": 0}
     ).sort("created_at", -1).to_list(100)
     
-    # Add disease names
-    for bookmark in bookmarks:
-        disease = await db.diseases.find_one({"id": bookmark["disease_id"]}, {"_id": 0, "name": 1})
-        bookmark["disease_name"] = disease["name"] if disease else "Unknown"
-    
-    return bookmarks
+    return await attach_disease_names(bookmarks)
 
 @api_router.post("/bookmarks", response_model=BookmarkResponse)
 async def create_bookmark(
@@ -930,7 +1942,7 @@ async def create_bookmark(
     user: dict = Depends(get_current_user)
 ):
     # Check if disease exists
-    disease = await db.diseases.find_one({"id": bookmark.disease_id}, {"_id": 0})
+    disease = await db.diseases.find_one({"id": bookmark.disease_id}, {"_id": 0, "name": 1})
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
     
@@ -949,11 +1961,14 @@ async def create_bookmark(
         "id": bookmark_id,
         "user_id": user["id"],
         "disease_id": bookmark.disease_id,
+        "disease_name": disease["name"],
         "created_at": now
     }
     
-    await db.bookmarks.insert_one(bookmark_doc)
-    bookmark_doc["disease_name"] = disease["name"]
+    try:
+        await db.bookmarks.insert_one(bookmark_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already bookmarked")
     
     return bookmark_doc
 
@@ -975,23 +1990,18 @@ async def delete_bookmark(
 # ==================== NOTES ROUTES ====================
 
 @api_router.get("/notes", response_model=List[NoteResponse])
-async def get_notes(user: dict = Depends(get_current_user)):
+async def get_notes(user: dict = Depends(get_token_user)):
     notes = await db.notes.find(
         {"user_id": user["id"]},
         {"_id": 0}
     ).sort("updated_at", -1).to_list(100)
     
-    # Add disease names
-    for note in notes:
-        disease = await db.diseases.find_one({"id": note["disease_id"]}, {"_id": 0, "name": 1})
-        note["disease_name"] = disease["name"] if disease else "Unknown"
-    
-    return notes
+    return await attach_disease_names(notes)
 
 @api_router.get("/notes/{disease_id}", response_model=Optional[NoteResponse])
 async def get_note_for_disease(
     disease_id: str,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_token_user)
 ):
     note = await db.notes.find_one({
         "user_id": user["id"],
@@ -999,8 +2009,7 @@ async def get_note_for_disease(
     }, {"_id": 0})
     
     if note:
-        disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0, "name": 1})
-        note["disease_name"] = disease["name"] if disease else "Unknown"
+        await attach_disease_names([note])
     
     return note
 
@@ -1010,7 +2019,7 @@ async def create_or_update_note(
     user: dict = Depends(get_current_user)
 ):
     # Check if disease exists
-    disease = await db.diseases.find_one({"id": note.disease_id}, {"_id": 0})
+    disease = await db.diseases.find_one({"id": note.disease_id}, {"_id": 0, "name": 1})
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
     
@@ -1022,25 +2031,31 @@ async def create_or_update_note(
         "disease_id": note.disease_id
     }, {"_id": 0})
     
-    if existing:
-        await db.notes.update_one(
-            {"id": existing["id"]},
-            {"$set": {"content": note.content, "updated_at": now}}
-        )
-        note_doc = await db.notes.find_one({"id": existing["id"]}, {"_id": 0})
-    else:
+    if not existing:
         note_id = str(uuid.uuid4())
         note_doc = {
             "id": note_id,
             "user_id": user["id"],
             "disease_id": note.disease_id,
+            "disease_name": disease["name"],
             "content": note.content,
             "created_at": now,
             "updated_at": now
         }
-        await db.notes.insert_one(note_doc)
+        try:
+            await db.notes.insert_one(note_doc)
+            return note_doc
+        except DuplicateKeyError:
+            # Created concurrently since the check above; update that note instead
+            pass
+    
+    note_doc = await db.notes.find_one_and_update(
+        {"user_id": user["id"], "disease_id": note.disease_id},
+        {"$set": {"content": note.content, "disease_name": disease["name"], "updated_at": now}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
     
-    note_doc["disease_name"] = disease["name"]
     return note_doc
 
 @api_router.delete("/notes/{note_id}")
@@ -1060,14 +2075,159 @@ async def delete_note(
 
 # ==================== RECENT VIEWS ROUTES ====================
 
+def recent_views_update(views: List[dict]) -> List[dict]:
+    """Update pipeline appending views (oldest first) to a user's list, replacing earlier views of the same diseases"""
+    disease_ids = [view["disease_id"] for view in views]
+    return [
+        {"$set": {"views": {"$concatArrays": [
+            {"$filter": {
+                "input": {"$ifNull": ["$views", []]},
+                "cond": {"$not": {"$in": ["$$this.disease_id", {"$literal": disease_ids}]}}
+            }},
+            {"$literal": views}
+        ]}}},
+        {"$set": {"views": {"$slice": ["$views", -RECENT_VIEWS_LIMIT]}}}
+    ]
+
+class RecentViewBuffer:
+    """Write-behind buffer of view events, flushed to recent_view_lists with bulk_write.
+    
+    Repeat views of a disease by the same user coalesce into the latest one. A flush
+    runs when max_pending views are buffered, every flush_interval seconds, and on
+    shutdown; a failed flush puts its views back. Buffered views are per-process, so
+    reads merge them in via pending_for() until they are written.
+    """
+    
+    def __init__(self, max_pending: int, flush_interval: float):
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        # user_id -> disease_id -> view, in view order
+        self.pending: Dict[str, Dict[str, dict]] = {}
+        self.in_flight: Dict[str, Dict[str, dict]] = {}
+        self.size = 0
+        self.lock = asyncio.Lock()
+        self.flusher: Optional[asyncio.Task] = None
+        self.triggered: Optional[asyncio.Task] = None
+        self.coalesced = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failures = 0
+    
+    def add(self, user_id: str, view: dict):
+        views = self.pending.setdefault(user_id, {})
+        if views.pop(view["disease_id"], None) is not None:
+            self.coalesced += 1
+        else:
+            self.size += 1
+        views[view["disease_id"]] = view
+        if self.size >= self.max_pending and (self.triggered is None or self.triggered.done()):
+            self.triggered = asyncio.create_task(self.flush())
+    
+    def pending_for(self, user_id: str) -> List[dict]:
+        """Unwritten views of a user, oldest first"""
+        views = dict(self.in_flight.get(user_id, {}))
+        for disease_id, view in self.pending.get(user_id, {}).items():
+            views.pop(disease_id, None)
+            views[disease_id] = view
+        return list(views.values())
+    
+    def forget_disease(self, disease_id: str):
+        for batch in (self.pending, self.in_flight):
+            for views in batch.values():
+                if views.pop(disease_id, None) is not None and batch is self.pending:
+                    self.size -= 1
+    
+    def rename_disease(self, disease_id: str, name: str):
+        for batch in (self.pending, self.in_flight):
+            for views in batch.values():
+                if disease_id in views:
+                    views[disease_id]["disease_name"] = name
+    
+    def requeue(self, batch: Dict[str, Dict[str, dict]]):
+        """Put back views from a failed flush, behind anything viewed since"""
+        for user_id, views in batch.items():
+            newer = self.pending.get(user_id, {})
+            merged = {disease_id: view for disease_id, view in views.items() if disease_id not in newer}
+            merged.update(newer)
+            self.pending[user_id] = merged
+        self.size = sum(len(views) for views in self.pending.values())
+    
+    async def flush(self) -> int:
+        async with self.lock:
+            if not self.pending:
+                return 0
+            self.in_flight, self.pending, self.size = self.pending, {}, 0
+            operations = [
+                UpdateOne({"user_id": user_id}, recent_views_update(list(views.values())), upsert=True)
+                for user_id, views in self.in_flight.items()
+            ]
+            count = sum(len(views) for views in self.in_flight.values())
+            try:
+                await db.recent_view_lists.bulk_write(operations, ordered=False)
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Recent view flush of {count} views failed: {e}")
+                self.requeue(self.in_flight)
+                return 0
+            except asyncio.CancelledError:
+                # Cancelled mid-write the batch may or may not be stored; writing it again is harmless
+                self.requeue(self.in_flight)
+                raise
+            finally:
+                self.in_flight = {}
+            self.flushes += 1
+            self.flushed += count
+            return count
+    
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Recent view flush loop error")
+    
+    def start(self):
+        self.flusher = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        if self.flusher:
+            self.flusher.cancel()
+        # Let a cancelled or triggered flush settle (a cancelled one requeues its batch) before the last flush
+        tasks = [task for task in (self.flusher, self.triggered) if task]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.flusher = self.triggered = None
+        await self.flush()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.size,
+            "max_pending": self.max_pending,
+            "flush_interval_seconds": self.flush_interval,
+            "coalesced": self.coalesced,
+            "flushed": self.flushed,
+            "flushes": self.flushes,
+            "failures": self.failures
+        }
+
+recent_view_buffer = RecentViewBuffer(RECENT_VIEW_FLUSH_SIZE, RECENT_VIEW_FLUSH_SECONDS)
+
 @api_router.get("/recent-views", response_model=List[RecentViewResponse])
-async def get_recent_views(user: dict = Depends(get_current_user)):
-    views = await db.recent_views.find(
+async def get_recent_views(user: dict = Depends(get_token_user)):
+    recent = await db.recent_view_lists.find_one(
         {"user_id": user["id"]},
-        {"_id": 0}
-    ).sort("viewed_at", -1).to_list(20)
+        {"_id": 0, "views": 1}
+    )
+    views = recent["views"] if recent else []
     
-    return views
+    # Merge views still waiting in the write buffer so the latest page open shows up immediately
+    buffered = recent_view_buffer.pending_for(user["id"])
+    if buffered:
+        buffered_ids = {view["disease_id"] for view in buffered}
+        views = [view for view in views if view["disease_id"] not in buffered_ids] + buffered
+    
+    # Stored oldest first so writes can trim with $slice; newest first for the client
+    return list(reversed(views[-RECENT_VIEWS_LIMIT:]))
 
 @api_router.post("/recent-views/{disease_id}")
 async def add_recent_view(
@@ -1075,45 +2235,30 @@ async def add_recent_view(
     user: dict = Depends(get_current_user)
 ):
     # Check if disease exists
-    disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0, "name": 1})
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
     
-    now = datetime.now(timezone.utc).isoformat()
-    
-    # Remove existing view for this disease
-    await db.recent_views.delete_one({
-        "user_id": user["id"],
-        "disease_id": disease_id
-    })
-    
-    # Add new view
-    view_doc = {
+    recent_view_buffer.add(user["id"], {
         "id": str(uuid.uuid4()),
-        "user_id": user["id"],
         "disease_id": disease_id,
         "disease_name": disease["name"],
-        "viewed_at": now
-    }
-    
-    await db.recent_views.insert_one(view_doc)
-    
-    # Keep only last 20 views
-    views = await db.recent_views.find(
-        {"user_id": user["id"]},
-        {"_id": 0, "id": 1}
-    ).sort("viewed_at", -1).to_list(100)
-    
-    if len(views) > 20:
-        old_ids = [v["id"] for v in views[20:]]
-        await db.recent_views.delete_many({"id": {"$in": old_ids}})
+        "viewed_at": datetime.now(timezone.utc).isoformat()
+    })
     
     return {"message": "View recorded"}
 
 # ==================== TAGS ROUTE ====================
 
 @api_router.get("/tags")
-async def get_tags():
+async def get_tags(request: Request, response: Response):
+    meta = await get_catalog_meta()
+    etag = make_etag("tags", meta.get("revision", 0))
+    last_modified = http_date(meta.get("updated_at"))
+    if is_not_modified(request, etag, meta.get("updated_at")):
+        return not_modified(etag, last_modified)
+    response.headers.update(validator_headers(etag, last_modified))
+    
     # Get all unique tags from diseases
     pipeline = [
         {"$unwind": "$tags"},
@@ -1154,6 +2299,8 @@ async def update_user_role(
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
     
+    user_cache.delete(user_id)
+    
     return {"message": "Role updated"}
 
 @api_router.get("/admin/stats")
@@ -1171,6 +2318,50 @@ async def get_admin_stats(user: dict = Depends(get_current_user)):
     
     return stats
 
+@api_router.get("/admin/indexes")
+async def get_index_report(user: dict = Depends(get_current_user)):
+    """Re-apply declared indexes and report drift plus the query plan of each hot path"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can inspect indexes")
+    
+    return {
+        "indexes": await ensure_indexes(),
+        "query_plans": await verify_query_plans()
+    }
+
+@api_router.get("/admin/cache-stats")
+async def get_cache_stats(user: dict = Depends(get_current_user)):
+    """Hit rates and sizes of the in-process caches (this worker only)"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view cache stats")
+    
+    return {
+        "disease_cache": disease_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "translation_memory": translation_memory.stats(),
+        "translation_batches": dict(translation_batch_stats),
+        "translator": translator.stats(),
+        "recent_view_buffer": recent_view_buffer.stats(),
+        "version_history": version_history.stats()
+    }
+
+@api_router.get("/admin/auth-stats")
+async def get_auth_stats(user: dict = Depends(get_current_user)):
+    """Password hashing pool load (this worker only)"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view auth stats")
+    
+    return {"password_hashing": password_hasher.stats()}
+
+@api_router.post("/admin/categories/recount")
+async def recount_categories(user: dict = Depends(get_current_user)):
+    """Rebuild materialized category disease counts from the diseases collection"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can recount categories")
+    
+    counts = await rebuild_category_counts()
+    return {"message": "Category counts rebuilt", "counts": counts}
+
 # ==================== SEED DATA ====================
 
 @api_router.post("/seed")
@@ -1406,6 +2597,8 @@ async def seed_data():
     ]
     
     await db.diseases.insert_many(diseases_data)
+    await rebuild_category_counts()
+    await rebuild_search_index()
     
     # Create admin user
     admin_id = str(uuid.uuid4())
@@ -1413,7 +2606,7 @@ async def seed_data():
         "id": admin_id,
         "email": "admin@pmr.edu",
         "name": "Admin User",
-        "password": hash_password("admin123"),
+        "password": await hash_password("admin123"),
         "role": "admin",
         "created_at": now,
         "email_verified": True
@@ -1430,7 +2623,8 @@ async def root():
 
 @api_router.get("/health")
 async def health_check():
-    return {"status": "healthy", "database": "connected"}
+    state, _ = await translator_status()
+    return {"status": "healthy", "database": "connected", "translator": state}
 
 # ==================== TRANSLATION ROUTES ====================
 
@@ -1450,104 +2644,766 @@ LANGUAGE_NAMES = {
     'es': 'Spanish'
 }
 
+# Model and prompt used for every translation; bump the prompt version when the
+# prompt changes so the translation memory stops serving the old output
+TRANSLATION_MODEL_PROVIDER = "openai"
+TRANSLATION_MODEL = "gpt-4.1-mini"
+TRANSLATION_PROMPT_VERSION = "1"
+TRANSLATION_SYSTEM_PROMPT = """You are a professional medical translator. Translate medical/clinical text from {source} to {target}. 
+
+Rules:
+- Preserve all medical terminology accurately
+- Maintain the same formatting (bullet points, line breaks, markdown, HTML tags)
+- Do not add explanations or notes
+- Only output the translated text, nothing else"""
+
+# Several sections in one request: a JSON object in, the same keys out
+TRANSLATION_BATCH_PROMPT = """You are a professional medical translator. The user message is a JSON object whose values are medical/clinical texts in {source}. Translate every value to {target}.
+
+Rules:
+- Preserve all medical terminology accurately
+- Maintain the same formatting inside each value (bullet points, line breaks, markdown, HTML tags)
+- Do not add explanations or notes
+- Output only a JSON object with exactly the same keys, each mapped to its translated text"""
+
+def make_translator() -> GuardedTranslator:
+    backend: Translator
+    if TRANSLATOR_BACKEND == "fake":
+        backend = FakeTranslator(
+            latency_ms=FAKE_TRANSLATOR_LATENCY_MS,
+            latency_sigma=FAKE_TRANSLATOR_LATENCY_SIGMA,
+            tokens_per_second=FAKE_TRANSLATOR_TOKENS_PER_SECOND,
+            error_rate=FAKE_TRANSLATOR_ERROR_RATE,
+            seed=int(FAKE_TRANSLATOR_SEED) if FAKE_TRANSLATOR_SEED else None
+        )
+    elif TRANSLATOR_BACKEND == "emergent":
+        backend = EmergentTranslator(EMERGENT_LLM_KEY, TRANSLATION_MODEL_PROVIDER, TRANSLATION_MODEL, TRANSLATOR_POOL_SIZE)
+    else:
+        raise RuntimeError(f"Unknown TRANSLATOR_BACKEND: {TRANSLATOR_BACKEND}")
+    return GuardedTranslator(
+        backend,
+        CircuitBreaker("Translation provider", TRANSLATOR_BREAKER_FAILURES, TRANSLATOR_BREAKER_RESET_SECONDS),
+        max_attempts=TRANSLATOR_MAX_ATTEMPTS,
+        attempt_timeout_seconds=TRANSLATOR_ATTEMPT_TIMEOUT_SECONDS,
+        deadline_seconds=TRANSLATION_TIMEOUT_SECONDS,
+        retry_base_seconds=TRANSLATOR_RETRY_BASE_SECONDS,
+        retry_max_seconds=TRANSLATOR_RETRY_MAX_SECONDS,
+        concurrency=TRANSLATION_CONCURRENCY
+    )
+
+translator = make_translator()
+translation_memory = TranslationMemory(db.translation_memory, TRANSLATION_MEMORY_SIZE)
+translation_loads = SingleFlight()
+translation_batch_stats = {"requests": 0, "sections": 0, "fallbacks": 0}
+
+def language_field(field: str, language: str) -> str:
+    """Document key holding a field in a language (English is the unsuffixed base field)"""
+    return field if language == "en" else f"{field}_{language}"
+
+async def call_translation_model(
+    text: str,
+    source_language: str,
+    target_language: str,
+    prompt: str = TRANSLATION_SYSTEM_PROMPT
+) -> str:
+    """One translator call, with the translator's concurrency limit, deadline and retries"""
+    system_message = prompt.format(
+        source=LANGUAGE_NAMES.get(source_language, 'English'),
+        target=LANGUAGE_NAMES.get(target_language, target_language)
+    )
+    state = translator.breaker.state
+    try:
+        return await translator.translate(text, source_language, target_language, system_message)
+    finally:
+        if translator.breaker.state != state:
+            await publish_translator_state()
+
+# Breaker state of the last process to call the provider, for API processes that never call it themselves
+TRANSLATOR_STATE_ID = "translator"
+
+async def publish_translator_state():
+    breaker = translator.breaker
+    try:
+        await db.service_state.update_one(
+            {"_id": TRANSLATOR_STATE_ID},
+            {"$set": {
+                "state": breaker.state,
+                "retry_at": time.time() + breaker.retry_after(),
+                "worker_id": WORKER_ID,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }},
+            upsert=True
+        )
+    except Exception:
+        logger.exception("Publishing translator state failed")
+
+async def translator_status() -> Tuple[str, float]:
+    """(breaker state, seconds until a call would be let through) of the processes that run translations"""
+    if RUN_JOB_WORKER:
+        breaker = translator.breaker
+        return breaker.state, 0.0 if breaker.available() else breaker.retry_after() or breaker.reset_seconds
+    shared = await db.service_state.find_one({"_id": TRANSLATOR_STATE_ID}) or {}
+    state = shared.get("state", "closed")
+    retry_after = max(0.0, shared.get("retry_at", 0) - time.time())
+    if state == "open" and retry_after == 0:
+        state = "half_open"
+    return state, retry_after if state == "open" else 0.0
+
+def section_memory_key(text: str, source_language: str, target_language: str) -> str:
+    # Keyed by the active backend's model, so a fake translator never serves or pollutes real translations
+    return memory_key(text, source_language, target_language, translator.model, TRANSLATION_PROMPT_VERSION)
+
+async def remember_translation(key: str, translated: str, source_language: str, target_language: str):
+    await translation_memory.put(
+        key, translated,
+        source_language=source_language,
+        target_language=target_language,
+        model=translator.model,
+        prompt_version=TRANSLATION_PROMPT_VERSION
+    )
+
+async def translate_section(text: str, source_language: str, target_language: str) -> str:
+    """Translate one section's text, served from the translation memory when it was translated before.
+    
+    Long text is split into block-aligned chunks that are translated concurrently (each
+    through the memory, so editing one paragraph only retranslates its chunk) and rejoined.
+    """
+    key = section_memory_key(text, source_language, target_language)
+    
+    async def load():
+        translated = await translation_memory.get(key)
+        if translated is None:
+            chunks = chunk_text(text, TRANSLATION_CHUNK_TOKEN_BUDGET)
+            if len(chunks) > 1:
+                parts = await asyncio.gather(
+                    *(translate_section(chunk.strip(), source_language, target_language) for chunk in chunks)
+                )
+                translated = reassemble(chunks, parts)
+            else:
+                translated = await call_translation_model(text, source_language, target_language)
+            await remember_translation(key, translated, source_language, target_language)
+        return translated
+    
+    # Identical requests in flight at the same time share one model call
+    return await translation_loads.do(key, load)
+
+async def translate_batch(sections: Dict[str, str], source_language: str, target_language: str) -> Dict[str, str]:
+    """Translate several sections in one model request; returns the sections that came back valid"""
+    response = await call_translation_model(
+        batch_payload(sections), source_language, target_language, TRANSLATION_BATCH_PROMPT
+    )
+    translation_batch_stats["requests"] += 1
+    parsed = parse_batch_response(response, sections)
+    translation_batch_stats["sections"] += len(parsed)
+    for field, translated in parsed.items():
+        await remember_translation(
+            section_memory_key(sections[field], source_language, target_language),
+            translated, source_language, target_language
+        )
+    return parsed
+
+async def translate_sections(
+    sections: Dict[str, str],
+    source_language: str,
+    target_language: str,
+    on_done: Callable[[str, Any], Awaitable[None]]
+):
+    """Translate several fields, passing each translation (or its exception) to on_done as it arrives.
+    
+    Fields found in the translation memory are answered from it; the rest are packed
+    into batched requests under TRANSLATION_BATCH_TOKEN_BUDGET, and any field a batch
+    fails to return is retried with its own request.
+    """
+    pending = {}
+    for field, text in sections.items():
+        cached = await translation_memory.get(section_memory_key(text, source_language, target_language))
+        if cached is not None:
+            await on_done(field, cached)
+        else:
+            pending[field] = text
+    
+    async def translate_one(field: str):
+        try:
+            result = await translate_section(pending[field], source_language, target_language)
+        except Exception as e:
+            result = e
+        await on_done(field, result)
+    
+    async def translate_group(fields: List[str]):
+        if len(fields) == 1:
+            await translate_one(fields[0])
+            return
+        try:
+            parsed = await translate_batch({field: pending[field] for field in fields}, source_language, target_language)
+        except Exception as e:
+            logger.warning(f"Batched translation of {len(fields)} sections failed: {str(e)}")
+            parsed = {}
+        for field in fields:
+            if field in parsed:
+                await on_done(field, parsed[field])
+        unparsed = [field for field in fields if field not in parsed]
+        translation_batch_stats["fallbacks"] += len(unparsed)
+        await asyncio.gather(*(translate_one(field) for field in unparsed))
+    
+    if TRANSLATION_BATCHING:
+        groups = pack_batches(pending, TRANSLATION_BATCH_TOKEN_BUDGET)
+    else:
+        groups = [[field] for field in pending]
+    await asyncio.gather(*(translate_group(fields) for fields in groups))
+
 @api_router.post("/translate", response_model=TranslationResponse)
 async def translate_text(
     request: TranslationRequest,
     user: dict = Depends(get_current_user)
 ):
-    """Translate medical content between languages"""
-    if not EMERGENT_LLM_KEY:
+    """Translate medical content between languages.
+    
+    Texts already in the translation memory are answered at once. Anything else is
+    queued as a job: the response is 202 with the job's progress, and the translation
+    arrives as the job's translated_text (poll /translation-jobs/{job_id} or stream
+    its events).
+    """
+    if not translator.configured:
         raise HTTPException(status_code=500, detail="Translation service not configured")
+    _, retry_after = await translator_status()
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=503,
+            detail="Translation provider unavailable",
+            headers={"Retry-After": str(max(1, round(retry_after)))}
+        )
     
-    source_name = LANGUAGE_NAMES.get(request.source_language, request.source_language)
-    target_name = LANGUAGE_NAMES.get(request.target_language, request.target_language)
+    # Repeats are answered from the translation memory; anything else runs on the job queue
+    translated = await translation_memory.get(
+        section_memory_key(request.text, request.source_language, request.target_language)
+    )
+    if translated is None:
+        job = await enqueue_translation_job(
+            "translate_text",
+            text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            created_by=user["id"]
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=job_progress(job),
+            headers={"Location": f"/api/translation-jobs/{job['id']}"}
+        )
     
-    try:
-        chat = LlmChat(
-            api_key=EMERGENT_LLM_KEY,
-            session_id=f"translate-{uuid.uuid4()}",
-            system_message=f"""You are a professional medical translator. Translate the following medical/clinical text from {source_name} to {target_name}. 
-            
-Rules:
-- Preserve all medical terminology accurately
-- Maintain the same formatting (bullet points, line breaks, etc.)
-- Keep any markdown formatting intact
-- Do not add explanations or notes
-- Only output the translated text, nothing else"""
-        ).with_model("openai", "gpt-4.1-mini")
+    return TranslationResponse(
+        translated_text=translated,
+        source_language=request.source_language,
+        target_language=request.target_language
+    )
+
+# ==================== TRANSLATION JOBS ====================
+
+# Whole-disease translation covers every section plus the name
+DISEASE_TRANSLATION_FIELDS = SECTION_FIELDS + ["name"]
+
+# Identifies this process as the lease holder of the jobs it runs
+WORKER_ID = str(uuid.uuid4())
+
+job_queue = JobQueue(
+    db.translation_jobs,
+    WORKER_ID,
+    lease_seconds=TRANSLATION_JOB_LEASE_SECONDS,
+    max_attempts=JOB_MAX_ATTEMPTS,
+    retry_base_seconds=JOB_RETRY_BASE_SECONDS,
+    retry_max_seconds=JOB_RETRY_MAX_SECONDS
+)
+job_sync_task: Optional[asyncio.Task] = None
+
+def translation_error(error: Exception) -> str:
+    return "Translation timed out" if isinstance(error, asyncio.TimeoutError) else str(error)
+
+def awaiting_retry(job: dict) -> bool:
+    return job["status"] == "queued" and job.get("attempts", 0) > 0
+
+def section_languages(job: dict) -> Dict[str, dict]:
+    """Per-language outcome of a section job so far"""
+    failed = job.get("failed_languages") or {}
+    languages = {}
+    for lang in job["target_languages"]:
+        if lang in job["completed_languages"]:
+            languages[lang] = {"status": "translated"}
+        elif lang in failed:
+            languages[lang] = {"status": "failed", "error": failed[lang]}
+        else:
+            languages[lang] = {"status": "queued"}
+    return languages
+
+def job_progress(job: dict) -> dict:
+    kind = job.get("kind", "translate_disease")
+    progress = {
+        "job_id": job["id"],
+        "kind": kind,
+        "status": job["status"],
+        "attempts": job.get("attempts", 0),
+        "max_attempts": job.get("max_attempts", JOB_MAX_ATTEMPTS),
+        "next_attempt_at": job.get("run_at") if awaiting_retry(job) else None,
+        "last_error": job.get("last_error"),
+        "error": job.get("error"),
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+        "finished_at": job.get("finished_at")
+    }
+    if kind == "translate_disease":
+        progress.update({
+            "disease_id": job["disease_id"],
+            "target_language": job["target_language"],
+            "total": len(job["fields"]),
+            "completed": len(job["completed_fields"]),
+            "failed_fields": job.get("failed_fields", {})
+        })
+    elif kind == "translate_section":
+        progress.update({
+            "disease_id": job["disease_id"],
+            "section_id": job["section_id"],
+            "total": len(job["target_languages"]),
+            "completed": len(job["completed_languages"]),
+            "languages": section_languages(job)
+        })
+    elif kind == "translate_text":
+        progress["translated_text"] = (job.get("result") or {}).get("translated_text")
+    return progress
+
+async def execute_translation_job(job: dict) -> dict:
+    """Translate the fields a job has not completed yet, persisting each one as it finishes"""
+    disease_id = job["disease_id"]
+    target_language = job["target_language"]
+    disease = await db.diseases.find_one(
+        {"id": disease_id},
+        {"_id": 0, **{field: 1 for field in job["fields"]}}
+    )
+    if not disease:
+        raise RuntimeError("Disease not found")
+    
+    completed = set(job["completed_fields"])
+    sources = {field: disease.get(field, "") for field in job["fields"] if field not in completed}
+    
+    async def field_done(field: str, result: Any):
+        if isinstance(result, Exception):
+            error = translation_error(result)
+            logger.error(f"Translation job {job['id']} failed on {field}: {error}")
+            await db.translation_jobs.update_one(
+                {"id": job["id"]},
+                {"$set": {f"failed_fields.{field}": error, "updated_at": datetime.now(timezone.utc).isoformat()}}
+            )
+            return
         
-        user_message = UserMessage(text=request.text)
-        translated = await chat.send_message(user_message)
+        now = datetime.now(timezone.utc).isoformat()
+        await db.diseases.update_one(
+            {"id": disease_id},
+            {"$set": {
+                language_field(field, target_language): result,
+                f"translation_sources.{field}.{target_language}": content_hash(sources[field]),
+                "updated_at": now
+            }}
+        )
+        await disease_changed(disease_id)
+        await db.translation_jobs.update_one(
+            {"id": job["id"]},
+            {
+                "$addToSet": {"completed_fields": field},
+                "$unset": {f"failed_fields.{field}": ""},
+                "$set": {"updated_at": now}
+            }
+        )
+    
+    # Concurrency across requests is bounded by the translator
+    await translate_sections(sources, job["source_language"], target_language, field_done)
+    
+    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    if updated:
+        search_engine.add(updated)
+    
+    # Raising schedules a retry, which picks up only the fields still missing
+    final = await db.translation_jobs.find_one({"id": job["id"]}, {"_id": 0, "fields": 1, "completed_fields": 1})
+    failed = [field for field in final["fields"] if field not in final["completed_fields"]]
+    if failed:
+        raise RuntimeError(f"{len(failed)} fields failed to translate")
+    return {"translated_fields": len(final["completed_fields"])}
+
+async def execute_section_job(job: dict) -> dict:
+    """Translate one saved section to each target language it still lacks"""
+    disease_id = job["disease_id"]
+    section_id = job["section_id"]
+    source_field = language_field(section_id, job["source_language"])
+    pending = [lang for lang in job["target_languages"] if lang not in job["completed_languages"]]
+    # Hash of the English text the translations are made against
+    source_hash = job["source_hash"]
+    
+    async def record_failure(target_lang: str, error: str):
+        await db.translation_jobs.update_one(
+            {"id": job["id"]},
+            {"$set": {f"failed_languages.{target_lang}": error, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        )
+    
+    async def translate_to(target_lang: str) -> bool:
+        nonlocal source_hash
+        try:
+            translated = await translate_section(job["text"], job["source_language"], target_lang)
+        except Exception as e:
+            error = translation_error(e)
+            logger.error(f"Translation to {target_lang} failed: {error}")
+            await record_failure(target_lang, error)
+            return False
         
-        return TranslationResponse(
-            translated_text=translated,
-            source_language=request.source_language,
-            target_language=request.target_language
+        now = datetime.now(timezone.utc).isoformat()
+        if target_lang == "en":
+            # The saved text and every other translation now correspond to this English
+            source_hash = content_hash(translated)
+            sources = {f"translation_sources.{section_id}.{job['source_language']}": source_hash}
+        else:
+            sources = {f"translation_sources.{section_id}.{target_lang}": source_hash}
+        # Only written while the section still holds the text that was translated; a newer save queued its own job
+        result = await db.diseases.update_one(
+            {"id": disease_id, source_field: job["text"]},
+            {
+                "$set": {
+                    language_field(section_id, target_lang): translated,
+                    f"{section_id}_edit_meta.translated_at": now,
+                    "last_translation_source": job["source_language"],
+                    "last_translation_at": now,
+                    "updated_at": now,
+                    **sources
+                },
+                "$addToSet": {f"{section_id}_edit_meta.translated_to": target_lang}
+            }
         )
-    except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+        if result.matched_count == 0:
+            logger.info(f"Section {section_id} of {disease_id} changed before its {target_lang} translation was saved")
+        await db.translation_jobs.update_one(
+            {"id": job["id"]},
+            {
+                "$addToSet": {"completed_languages": target_lang},
+                "$unset": {f"failed_languages.{target_lang}": ""},
+                "$set": {"updated_at": now, "source_hash": source_hash}
+            }
+        )
+        return True
+    
+    # English goes first, so the other languages are recorded against the English the job writes
+    if "en" in pending:
+        pending.remove("en")
+        if not await translate_to("en"):
+            for lang in pending:
+                await record_failure(lang, "Waiting for the English translation")
+            pending = []
+    await asyncio.gather(*(translate_to(lang) for lang in pending))
+    await disease_changed(disease_id)
+    updated = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    if updated:
+        search_engine.add(updated)
+    
+    final = await db.translation_jobs.find_one({"id": job["id"]}, {"_id": 0, "target_languages": 1, "completed_languages": 1})
+    failed = [lang for lang in final["target_languages"] if lang not in final["completed_languages"]]
+    if failed:
+        raise RuntimeError(f"Translation failed for {', '.join(failed)}")
+    return {"translated_languages": final["completed_languages"]}
+
+async def execute_text_job(job: dict) -> dict:
+    translated = await translate_section(job["text"], job["source_language"], job["target_language"])
+    return {"translated_text": translated}
+
+job_worker = JobWorker(
+    job_queue,
+    {
+        "translate_disease": execute_translation_job,
+        "translate_section": execute_section_job,
+        "translate_text": execute_text_job
+    },
+    concurrency=JOB_WORKER_CONCURRENCY,
+    poll_interval=JOB_POLL_SECONDS
+)
 
-@api_router.post("/translate-disease/{disease_id}")
-async def translate_disease(
-    disease_id: str,
-    target_language: str,
-    user: dict = Depends(get_current_user)
-):
-    """Translate all text fields of a disease to target language"""
+async def enqueue_translation_job(kind: str, **fields: Any) -> dict:
+    job = await job_queue.enqueue(kind, **fields)
+    # An in-process worker starts on it now rather than at its next poll
+    job_worker.wake()
+    return job
+
+async def sync_job_writes():
+    """Drop cached responses and reindex diseases translated by workers in other processes"""
+    since = datetime.now(timezone.utc).isoformat()
+    while True:
+        await asyncio.sleep(JOB_SYNC_SECONDS)
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            disease_ids = await db.translation_jobs.distinct(
+                "disease_id", {"updated_at": {"$gt": since}, "worker_id": {"$ne": WORKER_ID}}
+            )
+            since = now
+            for disease_id in disease_ids:
+                if not disease_id:
+                    continue
+                disease_cache.invalidate(disease_id)
+                disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+                if disease:
+                    search_engine.add(disease)
+        except Exception:
+            logger.exception("Syncing job writes failed")
+
+def translation_state(disease: dict, field: str, language: str, source_text: Optional[str] = None) -> str:
+    """Whether a field's translation matches its source text.
+    
+    current: made from the source text as it is now; stale: the source changed since;
+    missing: no translation yet; untracked: translated before source hashes were
+    recorded (or imported), so it is left alone unless forced; empty: no source text.
+    """
+    source = (disease.get(field) or "") if source_text is None else source_text
+    if not source.strip():
+        return "empty"
+    if not disease.get(language_field(field, language)):
+        return "missing"
+    recorded = (disease.get("translation_sources") or {}).get(field, {}).get(language)
+    if recorded is None:
+        return "untracked"
+    return "current" if recorded == content_hash(source) else "stale"
+
+def fields_to_translate(disease: dict, language: str, force: bool = False) -> List[str]:
+    states = {field: translation_state(disease, field, language) for field in DISEASE_TRANSLATION_FIELDS}
+    if force:
+        return [field for field, state in states.items() if state != "empty"]
+    return [field for field, state in states.items() if state in ("missing", "stale")]
+
+def translation_status_projection() -> dict:
+    projection = {"_id": 0, "id": 1, "language": 1, "translation_sources": 1}
+    for field in DISEASE_TRANSLATION_FIELDS:
+        projection[field] = 1
+        for language in SEARCH_LANGUAGES:
+            if language != "en":
+                projection[language_field(field, language)] = 1
+    return projection
+
+async def create_translation_job(disease_id: str, source_lang: str, target_language: str, fields: List[str], user_id: str) -> dict:
+    return await enqueue_translation_job(
+        "translate_disease",
+        disease_id=disease_id,
+        source_language=source_lang,
+        target_language=target_language,
+        fields=fields,
+        completed_fields=[],
+        failed_fields={},
+        created_by=user_id
+    )
+
+async def find_active_translation_job(disease_id: str, target_language: str) -> Optional[dict]:
+    return await db.translation_jobs.find_one(
+        {
+            "kind": "translate_disease",
+            "disease_id": disease_id,
+            "target_language": target_language,
+            "status": {"$in": ACTIVE_JOB_STATUSES}
+        },
+        {"_id": 0}
+    )
+
+async def start_disease_translation(disease_id: str, target_language: str, force: bool, dry_run: bool, user: dict) -> dict:
+    """Validate a whole-disease translation request and start (or find) its job"""
     if user["role"] not in [UserRole.ADMIN, UserRole.EDITOR]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     
-    disease = await db.diseases.find_one({"id": disease_id}, {"_id": 0})
+    disease = await db.diseases.find_one({"id": disease_id}, translation_status_projection())
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
     
-    # Fields to translate
-    text_fields = [
-        'definition', 'epidemiology', 'pathophysiology', 'biomechanics',
-        'clinical_presentation', 'physical_examination', 'imaging_findings',
-        'differential_diagnosis', 'treatment_conservative', 'treatment_interventional',
-        'treatment_surgical', 'rehabilitation_protocol', 'prognosis'
-    ]
-    
     source_lang = disease.get('language', 'en')
-    translations = {}
+    if target_language not in LANGUAGE_NAMES or target_language == source_lang:
+        raise HTTPException(status_code=400, detail=f"Cannot translate from {source_lang} to {target_language}")
     
-    try:
-        chat = LlmChat(
-            api_key=EMERGENT_LLM_KEY,
-            session_id=f"translate-disease-{uuid.uuid4()}",
-            system_message=f"""You are a professional medical translator. Translate medical/clinical text from {LANGUAGE_NAMES.get(source_lang, 'English')} to {LANGUAGE_NAMES.get(target_language, target_language)}. 
-            
-Rules:
-- Preserve all medical terminology accurately
-- Maintain the same formatting (bullet points, line breaks, etc.)
-- Keep any markdown formatting intact
-- Only output the translated text, nothing else"""
-        ).with_model("openai", "gpt-4.1-mini")
+    fields = fields_to_translate(disease, target_language, force)
+    
+    if dry_run:
+        return {
+            "disease_id": disease_id,
+            "target_language": target_language,
+            "sections": {field: translation_state(disease, field, target_language) for field in DISEASE_TRANSLATION_FIELDS},
+            "to_translate": fields
+        }
+    
+    active = await find_active_translation_job(disease_id, target_language)
+    if active:
+        return {"message": f"Already translating to {target_language}", **job_progress(active)}
+    
+    if not fields:
+        return {"message": f"Already up to date in {target_language}", "job_id": None, "status": "completed", "total": 0, "completed": 0}
+    
+    job = await create_translation_job(disease_id, source_lang, target_language, fields, user["id"])
+    return {"message": f"Translating {len(fields)} fields to {target_language}", **job_progress(job)}
+
+async def follow_translation_job(job_id: str, emit: EventEmitter) -> dict:
+    """Emit an event per finished item (with its translation) and 'progress' after each change.
+    
+    Disease jobs report 'field' events, section jobs 'translation' events per language.
+    Returns once the job ends or is waiting out the backoff before a retry.
+    """
+    reported = set()
+    last_state = None
+    while True:
+        job = await db.translation_jobs.find_one({"id": job_id}, {"_id": 0})
+        if not job:
+            raise HTTPException(status_code=404, detail="Translation job not found")
         
-        for field in text_fields:
-            content = disease.get(field, '')
-            if content and content.strip():
-                user_message = UserMessage(text=content)
-                translated = await chat.send_message(user_message)
-                translations[f"{field}_{target_language}"] = translated
+        if job.get("kind") == "translate_section":
+            event, key, done_status = "translation", "language", "translated"
+            items, failures = job["completed_languages"], job.get("failed_languages") or {}
+            item_field = lambda lang: language_field(job["section_id"], lang)
+        else:
+            event, key, done_status = "field", "field", "completed"
+            items, failures = job["completed_fields"], job.get("failed_fields") or {}
+            item_field = lambda field: language_field(field, job["target_language"])
+        completed = [item for item in items if (item, "completed") not in reported]
+        failed = {item: error for item, error in failures.items() if (item, "failed") not in reported}
         
-        # Also translate name
-        if disease.get('name'):
-            user_message = UserMessage(text=disease['name'])
-            translations[f"name_{target_language}"] = await chat.send_message(user_message)
+        if completed:
+            disease = await db.diseases.find_one(
+                {"id": job["disease_id"]},
+                {"_id": 0, **{item_field(item): 1 for item in completed}}
+            ) or {}
+            for item in completed:
+                await emit(event, {key: item, "status": done_status, "content": disease.get(item_field(item), "")})
+                reported.add((item, "completed"))
+        for item, error in failed.items():
+            await emit(event, {key: item, "status": "failed", "error": error})
+            reported.add((item, "failed"))
         
-        # Update disease with translations
-        await db.diseases.update_one(
-            {"id": disease_id},
-            {"$set": translations}
-        )
+        state = (job["status"], job.get("attempts", 0))
+        if completed or failed or state != last_state:
+            await emit("progress", job_progress(job))
+        last_state = state
         
-        return {"message": f"Translated to {target_language}", "fields_translated": len(translations)}
-    except Exception as e:
-        logger.error(f"Disease translation error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+        if job["status"] not in ACTIVE_JOB_STATUSES or awaiting_retry(job):
+            return job_progress(job)
+        await asyncio.sleep(TRANSLATION_STREAM_POLL_SECONDS)
+
+@api_router.post("/translate-disease/{disease_id}", status_code=status.HTTP_202_ACCEPTED)
+async def translate_disease(
+    disease_id: str,
+    target_language: str,
+    dry_run: bool = False,
+    force: bool = False,
+    user: dict = Depends(get_current_user)
+):
+    """Start a background job translating the stale text fields of a disease to target language"""
+    return await start_disease_translation(disease_id, target_language, force, dry_run, user)
+
+@api_router.post("/translate-disease/{disease_id}/stream")
+async def translate_disease_stream(
+    disease_id: str,
+    target_language: str,
+    force: bool = False,
+    user: dict = Depends(get_current_user)
+):
+    """translate-disease, then its job's progress and translated fields as Server-Sent Events"""
+    started = await start_disease_translation(disease_id, target_language, force, False, user)
+    
+    async def run(emit: EventEmitter) -> dict:
+        await emit("started", started)
+        if started["job_id"] is None:
+            return started
+        return await follow_translation_job(started["job_id"], emit)
+    
+    return sse_response(run)
+
+@api_router.post("/admin/translate-stale")
+async def translate_all_stale(
+    languages: Optional[str] = None,
+    dry_run: bool = False,
+    user: dict = Depends(get_current_user)
+):
+    """Start translation jobs for every stale or missing section in the atlas, or list them with dry_run"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can run batch translation")
+    
+    targets = languages.split(",") if languages else [lang for lang in SEARCH_LANGUAGES if lang != "en"]
+    unknown = [lang for lang in targets if lang not in LANGUAGE_NAMES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported languages: {', '.join(unknown)}")
+    
+    plan = []
+    jobs_started = 0
+    already_running = 0
+    by_language = {lang: 0 for lang in targets}
+    
+    async for disease in db.diseases.find({}, translation_status_projection()):
+        source_lang = disease.get("language", "en")
+        for lang in targets:
+            if lang == source_lang:
+                continue
+            fields = fields_to_translate(disease, lang)
+            if not fields:
+                continue
+            by_language[lang] += len(fields)
+            plan.append({"disease_id": disease["id"], "name": disease.get("name", ""), "language": lang, "sections": fields})
+            if dry_run:
+                continue
+            if await find_active_translation_job(disease["id"], lang):
+                already_running += 1
+                continue
+            await create_translation_job(disease["id"], source_lang, lang, fields, user["id"])
+            jobs_started += 1
+    
+    return {
+        "dry_run": dry_run,
+        "sections_to_translate": sum(by_language.values()),
+        "by_language": by_language,
+        "stale": plan,
+        "jobs_started": jobs_started,
+        "already_running": already_running
+    }
+
+def check_job_access(job: dict, user: dict):
+    """Editors see every job; anyone else only the jobs they queued (e.g. through /translate)"""
+    if user["role"] not in [UserRole.ADMIN, UserRole.EDITOR] and job.get("created_by") != user["id"]:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+@api_router.get("/translation-jobs/{job_id}")
+async def get_translation_job(job_id: str, user: dict = Depends(get_current_user)):
+    """Progress of a translation job"""
+    job = await db.translation_jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Translation job not found")
+    check_job_access(job, user)
+    
+    return job_progress(job)
+
+@api_router.get("/translation-jobs/{job_id}/events")
+async def get_translation_job_events(job_id: str, user: dict = Depends(get_current_user)):
+    """Progress of a translation job as Server-Sent Events, from its current state until it ends"""
+    job = await db.translation_jobs.find_one({"id": job_id}, {"_id": 0, "created_by": 1})
+    if not job:
+        raise HTTPException(status_code=404, detail="Translation job not found")
+    check_job_access(job, user)
+    
+    return sse_response(lambda emit: follow_translation_job(job_id, emit))
+
+@api_router.get("/admin/job-queue")
+async def get_job_queue(user: dict = Depends(get_current_user)):
+    """Job counts by status and kind, this process's worker, and the most recent dead jobs"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view the job queue")
+    
+    return {
+        "queue": await job_queue.stats(),
+        "worker": job_worker.stats(),
+        "dead_letters": [job_progress(job) for job in await job_queue.dead_letters(50)]
+    }
+
+@api_router.post("/admin/translation-jobs/{job_id}/retry")
+async def retry_translation_job(job_id: str, user: dict = Depends(get_current_user)):
+    """Requeue a dead job with a fresh set of attempts"""
+    if user["role"] != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can retry jobs")
+    
+    if not await job_queue.retry(job_id):
+        raise HTTPException(status_code=404, detail="No dead job with that id")
+    job_worker.wake()
+    
+    job = await db.translation_jobs.find_one({"id": job_id}, {"_id": 0})
+    return job_progress(job)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -1567,6 +3423,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def bootstrap_indexes():
+    await ensure_indexes()
+    
+    if VERIFY_QUERY_PLANS:
+        scans = [p for p in await verify_query_plans() if p["collection_scan"]]
+        if scans:
+            raise RuntimeError(
+                "Collection scans on hot paths: " + ", ".join(p["endpoint"] for p in scans)
+            )
+
+async def rebuild_search_index():
+    projection = {"_id": 0, "id": 1, **{field: 1 for field in INDEXED_FIELDS}}
+    diseases = await db.diseases.find({}, projection).to_list(None)
+    search_engine.rebuild(diseases)
+    logger.info(f"Search index built for {len(search_engine)} diseases")
+
+@app.on_event("startup")
+async def load_search_index():
+    await rebuild_search_index()
+
+@app.on_event("startup")
+async def init_catalog_meta():
+    # Ensure list endpoints always have a Last-Modified to report
+    await db.catalog_meta.update_one(
+        {"_id": CATALOG_META_ID},
+        {"$setOnInsert": {"revision": 0, "category_revision": 0, "updated_at": datetime.now(timezone.utc).isoformat()}},
+        upsert=True
+    )
+
+@app.on_event("startup")
+async def backfill_category_counts():
+    # Databases created before disease_count was materialized need one rebuild
+    if await db.categories.find_one({"disease_count": {"$exists": False}}, {"_id": 1}):
+        await rebuild_category_counts()
+
+@app.on_event("startup")
+async def backfill_disease_versions():
+    # Edits increment the version in place; diseases stored without one start from 1
+    await db.diseases.update_many({"version": {"$exists": False}}, {"$set": {"version": 1}})
+
+@app.on_event("startup")
+async def migrate_recent_views():
+    # Fold the legacy one-document-per-view collection into per-user capped lists
+    if "recent_views" not in await db.list_collection_names():
+        return
+    pipeline = [
+        {"$sort": {"viewed_at": 1}},
+        {"$group": {
+            "_id": "$user_id",
+            "views": {"$push": {
+                "id": "$id",
+                "disease_id": "$disease_id",
+                "disease_name": "$disease_name",
+                "viewed_at": "$viewed_at"
+            }}
+        }}
+    ]
+    migrated = 0
+    async for row in db.recent_views.aggregate(pipeline):
+        await db.recent_view_lists.update_one(
+            {"user_id": row["_id"]},
+            {"$setOnInsert": {"views": row["views"][-RECENT_VIEWS_LIMIT:]}},
+            upsert=True
+        )
+        migrated += 1
+    await db.recent_views.drop()
+    logger.info(f"Migrated recent views for {migrated} users")
+
+@app.on_event("startup")
+async def start_recent_view_flusher():
+    recent_view_buffer.start()
+
+@app.on_event("startup")
+async def migrate_translation_jobs():
+    # Jobs created before the queue had kinds and retries were all whole-disease jobs
+    now = datetime.now(timezone.utc).isoformat()
+    await db.translation_jobs.update_many(
+        {"kind": {"$exists": False}},
+        {"$set": {"kind": "translate_disease", "attempts": 0, "max_attempts": JOB_MAX_ATTEMPTS, "run_at": now}}
+    )
+    await db.translation_jobs.update_many({"status": "failed"}, {"$set": {"status": "dead"}})
+
+@app.on_event("startup")
+async def compact_version_history():
+    # Versions stored before deltas are full copies of the disease; rewrite them as deltas between keyframes
+    if not await db.disease_versions.find_one({"keyframe_version": {"$exists": False}}, {"_id": 1}):
+        return
+    compacted = await version_history.compact_all()
+    if compacted["records"]:
+        logger.info(f"Compacted {compacted['records']} versions of {compacted['diseases']} diseases")
+
+@app.on_event("startup")
+async def start_job_worker():
+    global job_sync_task
+    if RUN_JOB_WORKER:
+        job_worker.start()
+    job_sync_task = asyncio.create_task(sync_job_writes())
+
+@app.on_event("shutdown")
+async def stop_job_worker():
+    if job_sync_task:
+        job_sync_task.cancel()
+    # Hands our running jobs back so another worker picks them up without waiting out the lease
+    await job_worker.stop()
+
+@app.on_event("shutdown")
+async def flush_recent_views():
+    # Registered before shutdown_db_client so buffered views are written while the client is open
+    await recent_view_buffer.stop()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    password_hasher.shutdown()
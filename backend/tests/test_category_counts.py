@@ -0,0 +1,102 @@
+"""
+Backend API tests for materialized category disease counts
+Tests that disease_count follows create/move/delete and the admin recount endpoint
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "admin@pmr.edu"
+ADMIN_PASSWORD = "admin123"
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Shared requests session"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+@pytest.fixture(scope="module")
+def authenticated_admin_client(api_client):
+    """Session with admin auth header"""
+    response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin authentication failed - skipping authenticated tests")
+    api_client.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+    return api_client
+
+@pytest.fixture(scope="module")
+def categories(authenticated_admin_client):
+    """Two categories to move a disease between"""
+    response = authenticated_admin_client.get(f"{BASE_URL}/api/categories")
+    assert response.status_code == 200
+    cats = response.json()
+    if len(cats) < 2:
+        pytest.skip("Need at least two categories")
+    return cats[0]["id"], cats[1]["id"]
+
+
+def get_count(client, category_id):
+    cats = client.get(f"{BASE_URL}/api/categories").json()
+    return next(c["disease_count"] for c in cats if c["id"] == category_id)
+
+
+class TestCategoryCounts:
+    """disease_count is kept in sync by the disease write endpoints"""
+
+    def test_counts_match_disease_listing(self, authenticated_admin_client):
+        """Every category count equals the number of diseases filtered by that category"""
+        cats = authenticated_admin_client.get(f"{BASE_URL}/api/categories").json()
+        for cat in cats:
+            diseases = authenticated_admin_client.get(
+                f"{BASE_URL}/api/diseases", params={"category_id": cat["id"]}
+            ).json()
+            assert cat["disease_count"] == len(diseases), f"Count mismatch for {cat['name']}"
+        print(f"PASS: {len(cats)} category counts match disease listings")
+
+    def test_create_move_delete_updates_counts(self, authenticated_admin_client, categories):
+        """Counts follow a disease through create, category move and delete"""
+        first, second = categories
+        first_before = get_count(authenticated_admin_client, first)
+        second_before = get_count(authenticated_admin_client, second)
+
+        response = authenticated_admin_client.post(f"{BASE_URL}/api/diseases", json={
+            "name": "TEST_Count Disease",
+            "category_id": first
+        })
+        assert response.status_code == 200, f"Create failed: {response.text}"
+        disease_id = response.json()["id"]
+        assert get_count(authenticated_admin_client, first) == first_before + 1
+
+        response = authenticated_admin_client.put(
+            f"{BASE_URL}/api/diseases/{disease_id}",
+            json={"category_id": second}
+        )
+        assert response.status_code == 200, f"Move failed: {response.text}"
+        assert get_count(authenticated_admin_client, first) == first_before
+        assert get_count(authenticated_admin_client, second) == second_before + 1
+
+        response = authenticated_admin_client.delete(f"{BASE_URL}/api/diseases/{disease_id}")
+        assert response.status_code == 200
+        assert get_count(authenticated_admin_client, second) == second_before
+        print("PASS: Counts follow create, move and delete")
+
+    def test_recount_endpoint(self, authenticated_admin_client):
+        """Admin recount rebuilds the same counts the listing reports"""
+        response = authenticated_admin_client.post(f"{BASE_URL}/api/admin/categories/recount")
+        assert response.status_code == 200, f"Recount failed: {response.text}"
+        counts = response.json()["counts"]
+        cats = authenticated_admin_client.get(f"{BASE_URL}/api/categories").json()
+        for cat in cats:
+            assert counts[cat["id"]] == cat["disease_count"]
+        print("PASS: Recount endpoint rebuilds counts")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
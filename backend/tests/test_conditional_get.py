@@ -0,0 +1,108 @@
+"""
+Backend API tests for HTTP conditional GET
+Tests ETag / Last-Modified validators and 304 responses on the read endpoints
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "admin@pmr.edu"
+ADMIN_PASSWORD = "admin123"
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Shared requests session"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+@pytest.fixture(scope="module")
+def disease_id(api_client):
+    """Get first disease ID for testing"""
+    response = api_client.get(f"{BASE_URL}/api/diseases")
+    assert response.status_code == 200, f"Failed to get diseases: {response.text}"
+    diseases = response.json()
+    if not diseases:
+        pytest.skip("No diseases found for testing")
+    return diseases[0]["id"]
+
+
+@pytest.fixture(scope="module")
+def admin_headers(api_client):
+    """Auth header of the admin user"""
+    response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin authentication failed - skipping authenticated tests")
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture(params=["disease", "disease_pt", "diseases", "categories", "tags"])
+def url(request, disease_id):
+    return {
+        "disease": f"{BASE_URL}/api/diseases/{disease_id}",
+        "disease_pt": f"{BASE_URL}/api/diseases/{disease_id}?lang=pt",
+        "diseases": f"{BASE_URL}/api/diseases",
+        "categories": f"{BASE_URL}/api/categories",
+        "tags": f"{BASE_URL}/api/tags",
+    }[request.param]
+
+
+class TestConditionalGet:
+    """ETag and Last-Modified revalidation"""
+
+    def test_validators_present(self, api_client, url):
+        """Full responses carry ETag and Last-Modified"""
+        response = api_client.get(url)
+        assert response.status_code == 200
+        assert response.headers.get("ETag")
+        assert response.headers.get("Last-Modified")
+        print(f"PASS: Validators present on {url}")
+
+    def test_if_none_match_returns_304(self, api_client, url):
+        """Repeating the ETag yields an empty 304"""
+        etag = api_client.get(url).headers["ETag"]
+        response = api_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers.get("ETag") == etag
+        print(f"PASS: If-None-Match 304 on {url}")
+
+    def test_if_none_match_wins_over_if_modified_since(self, api_client, url):
+        """A matching ETag yields a 304 whatever If-Modified-Since says"""
+        first = api_client.get(url)
+        response = api_client.get(url, headers={
+            "If-None-Match": first.headers["ETag"],
+            "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"
+        })
+        assert response.status_code == 304
+        print(f"PASS: If-None-Match takes precedence on {url}")
+
+    def test_if_modified_since_after_write_returns_body(self, api_client, admin_headers):
+        """A write in the same second as Last-Modified still gets the new representation"""
+        url = f"{BASE_URL}/api/categories"
+        first = api_client.get(url)
+        # Re-saving the current order is a catalog write that changes nothing else
+        order = [category["id"] for category in first.json()]
+        response = api_client.put(f"{BASE_URL}/api/categories/reorder", json={"category_ids": order}, headers=admin_headers)
+        assert response.status_code == 200
+        response = api_client.get(url, headers={"If-Modified-Since": first.headers["Last-Modified"]})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != first.headers["ETag"]
+        print("PASS: If-Modified-Since after a write gets 200")
+
+    def test_stale_etag_returns_body(self, api_client, url):
+        """A non-matching ETag gets the full representation"""
+        response = api_client.get(url, headers={"If-None-Match": 'W/"stale"'})
+        assert response.status_code == 200
+        assert response.content
+        print(f"PASS: Stale ETag gets 200 on {url}")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,79 @@
+"""
+Backend API tests for the paginated disease summary listing
+Tests /api/diseases/summary projection and keyset cursor pagination
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+SUMMARY_FIELDS = {"id", "name", "category_id", "category_name", "tags", "excerpt", "version"}
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Shared requests session"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def fetch_all(client, **params):
+    """Follow next_cursor until the listing is exhausted"""
+    items, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"{BASE_URL}/api/diseases/summary", params=query)
+        assert response.status_code == 200, f"Summary listing failed: {response.text}"
+        page = response.json()
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return items
+
+
+class TestDiseaseSummary:
+    """Tests for /api/diseases/summary"""
+
+    def test_summary_only_has_listing_fields(self, api_client):
+        """Rows carry no section bodies, media or translations"""
+        response = api_client.get(f"{BASE_URL}/api/diseases/summary")
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) > 0
+        for item in items:
+            assert set(item) == SUMMARY_FIELDS
+            assert len(item["excerpt"]) <= 200
+            assert "<" not in item["excerpt"] and "&nbsp" not in item["excerpt"]
+        print(f"PASS: {len(items)} summaries with listing fields only")
+
+    def test_pages_cover_full_listing_in_name_order(self, api_client):
+        """Small pages joined together equal the full name-sorted listing"""
+        full = api_client.get(f"{BASE_URL}/api/diseases").json()
+        paged = fetch_all(api_client, limit=2)
+        assert [d["id"] for d in paged] == [d["id"] for d in full]
+        print(f"PASS: {len(paged)} diseases paged in (name, id) order")
+
+    def test_filters_apply_to_pages(self, api_client):
+        """category_id filter is applied before pagination"""
+        category_id = api_client.get(f"{BASE_URL}/api/categories").json()[0]["id"]
+        paged = fetch_all(api_client, category_id=category_id, limit=1)
+        assert all(d["category_id"] == category_id for d in paged)
+        print("PASS: Filters apply across pages")
+
+    def test_search_pages_follow_relevance(self, api_client):
+        """Search results are paginated in ranked order"""
+        ranked = api_client.get(f"{BASE_URL}/api/diseases", params={"search": "tear"}).json()
+        paged = fetch_all(api_client, search="tear", limit=1)
+        assert [d["id"] for d in paged] == [d["id"] for d in ranked]
+        print("PASS: Search pages follow relevance order")
+
+    def test_invalid_cursor(self, api_client):
+        """Malformed cursors are rejected"""
+        response = api_client.get(f"{BASE_URL}/api/diseases/summary", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        print("PASS: Invalid cursor rejected")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,64 @@
+"""
+Backend API tests for index bootstrap and query plan verification
+Tests the /api/admin/indexes report: declared indexes exist and no hot path collection-scans
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "admin@pmr.edu"
+ADMIN_PASSWORD = "admin123"
+
+@pytest.fixture(scope="module")
+def authenticated_admin_client():
+    """Session with admin auth header"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    response = session.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin authentication failed - skipping authenticated tests")
+    session.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+    return session
+
+@pytest.fixture(scope="module")
+def index_report(authenticated_admin_client):
+    response = authenticated_admin_client.get(f"{BASE_URL}/api/admin/indexes")
+    assert response.status_code == 200, f"Index report failed: {response.text}"
+    return response.json()
+
+
+class TestIndexBootstrap:
+    """Declared indexes are present and used by every hot path"""
+
+    def test_no_index_failures(self, index_report):
+        """Every declared index exists with the declared uniqueness"""
+        assert index_report["indexes"]["failed"] == [], f"Failed: {index_report['indexes']['failed']}"
+        assert index_report["indexes"]["mismatched"] == [], f"Mismatched: {index_report['indexes']['mismatched']}"
+        print("PASS: All declared indexes present")
+
+    def test_index_bootstrap_is_idempotent(self, index_report):
+        """A second run has nothing left to create"""
+        assert index_report["indexes"]["created"] == []
+        print("PASS: Index bootstrap is idempotent")
+
+    def test_no_collection_scans(self, index_report):
+        """explain() of every endpoint query uses an index"""
+        scans = [p["endpoint"] for p in index_report["query_plans"] if p["collection_scan"]]
+        assert scans == [], f"Collection scans on: {scans}"
+        print(f"PASS: {len(index_report['query_plans'])} hot path queries use indexes")
+
+    def test_requires_admin(self):
+        """Index report is admin only"""
+        response = requests.get(f"{BASE_URL}/api/admin/indexes")
+        assert response.status_code in [401, 403]
+        print("PASS: Index report requires admin")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
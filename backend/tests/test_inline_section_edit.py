@@ -7,6 +7,7 @@ import pytest
 import requests
 import os
 import uuid
+import time
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
@@ -268,13 +269,15 @@ class TestInlineSaveTranslateEndpoint:
                 "Authorization": f"Bearer {admin_token}",
                 "Content-Type": "application/json"
             },
-            timeout=60  # LLM translation may take time
+            timeout=60
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        assert response.status_code == 202, f"Expected 202, got {response.status_code}: {response.text}"
         data = response.json()
         assert "disease" in data
         assert data["disease"]["clinical_presentation"] == unique_content
-        print(f"PASS: Section saved and translated. Translations count: {data.get('translations_count', 0)}")
+        assert data["job"]["kind"] == "translate_section"
+        assert set(data["translations"]) == {"pt", "es"}
+        print(f"PASS: Section saved, translation queued as job {data['job']['job_id']}")
     
     def test_inline_translate_updates_translation_meta(self, admin_token, test_disease_id):
         """Inline save-translate updates section metadata with translation info"""
@@ -293,7 +296,18 @@ class TestInlineSaveTranslateEndpoint:
             },
             timeout=60
         )
-        assert response.status_code == 200
+        assert response.status_code == 202
+        job = response.json()["job"]
+        
+        # Translation runs on the job queue; wait for its first attempt to finish
+        deadline = time.time() + 120
+        while job["status"] in ("queued", "running") and not job["next_attempt_at"] and time.time() < deadline:
+            time.sleep(2)
+            job = requests.get(
+                f"{BASE_URL}/api/translation-jobs/{job['job_id']}",
+                headers={"Authorization": f"Bearer {admin_token}"}
+            ).json()
+        assert job["completed"] > 0, f"No language translated: {job}"
         
         # Verify edit metadata includes translation info
         get_response = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}")
@@ -337,6 +351,86 @@ class TestVersionHistory:
         assert new_version > initial_version, f"Version not incremented: {initial_version} -> {new_version}"
         print(f"PASS: Version incremented from {initial_version} to {new_version}")
 
+    def test_versions_rebuild_full_documents(self, admin_token, test_disease_id):
+        """Versions stored as deltas come back as the full document of each version"""
+        headers = {"Authorization": f"Bearer {admin_token}", "Content-Type": "application/json"}
+        contents = [f"TEST_Prognosis delta {i} {uuid.uuid4()}" for i in range(2)]
+        for content in contents:
+            response = requests.put(
+                f"{BASE_URL}/api/diseases/{test_disease_id}/inline-save",
+                json={"language": "en", "section_id": "prognosis", "content": content},
+                headers=headers
+            )
+            assert response.status_code == 200
+        current = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}").json()
+
+        versions_url = f"{BASE_URL}/api/diseases/{test_disease_id}/versions"
+        latest = requests.get(f"{versions_url}/{current['version']}", headers=headers).json()
+        previous = requests.get(f"{versions_url}/{current['version'] - 1}", headers=headers).json()
+        assert latest["data"]["prognosis"] == contents[1]
+        assert previous["data"]["prognosis"] == contents[0]
+        assert latest["data"]["name"] == current["name"]
+        print(f"PASS: Versions {previous['version']} and {latest['version']} rebuilt in full")
+
+    def test_version_listing_is_metadata_only(self, admin_token, test_disease_id):
+        """The history list carries edit metadata, not documents"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}/versions?limit=5", headers=headers)
+        assert response.status_code == 200
+        versions = response.json()
+        assert 0 < len(versions) <= 5
+        for entry in versions:
+            assert "data" not in entry
+            assert {"version", "created_by", "created_at", "edit_type", "section_id", "languages"} <= set(entry)
+        assert versions[0]["edit_type"] == "single_section" and versions[0]["languages"] == ["en"]
+        print(f"PASS: Listed {len(versions)} versions without documents")
+
+    def test_version_diff(self, admin_token, test_disease_id):
+        """Diff between consecutive prognosis edits reports only the prognosis section"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        version = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}").json()["version"]
+        response = requests.get(
+            f"{BASE_URL}/api/diseases/{test_disease_id}/versions/diff",
+            params={"from_version": version - 1, "to_version": version},
+            headers=headers
+        )
+        assert response.status_code == 200
+        sections = response.json()["sections"]
+        assert [(entry["section_id"], entry["language"]) for entry in sections] == [("prognosis", "en")]
+        assert sections[0]["status"] == "modified" and sections[0]["changes"]
+        print(f"PASS: Diff {version - 1} -> {version}: {sections[0]['added_words']} words added")
+
+    def test_version_diff_of_references(self, admin_token, test_disease_id):
+        """References are a list; their diff reports added and removed items"""
+        headers = {"Authorization": f"Bearer {admin_token}", "Content-Type": "application/json"}
+        current = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}").json()
+        reference = f"TEST_Reference {uuid.uuid4()}"
+        response = requests.put(
+            f"{BASE_URL}/api/diseases/{test_disease_id}",
+            json={"references": (current.get("references") or []) + [reference]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        version = response.json()["version"]
+
+        response = requests.get(
+            f"{BASE_URL}/api/diseases/{test_disease_id}/versions/diff",
+            params={"from_version": version - 1, "to_version": version, "section_id": "references"},
+            headers=headers
+        )
+        assert response.status_code == 200, response.text
+        sections = response.json()["sections"]
+        assert len(sections) == 1 and sections[0]["kind"] == "list"
+        assert sections[0]["added_items"] == [reference] and sections[0]["removed_items"] == []
+        print("PASS: References diff lists the added reference")
+
+    def test_missing_version_returns_404(self, admin_token, test_disease_id):
+        """Fetching a version that was never recorded returns 404"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = requests.get(f"{BASE_URL}/api/diseases/{test_disease_id}/versions/999999", headers=headers)
+        assert response.status_code == 404
+        print("PASS: Missing version returns 404")
+
 
 class TestCategoriesAndTags:
     """Supporting API tests"""
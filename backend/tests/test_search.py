@@ -0,0 +1,116 @@
+"""
+Backend API tests for full-text disease search
+Tests ranking, stemming, accent folding and prefix matching on /api/diseases?search=
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "admin@pmr.edu"
+ADMIN_PASSWORD = "admin123"
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Shared requests session"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def search(client, query, **params):
+    response = client.get(f"{BASE_URL}/api/diseases", params={"search": query, **params})
+    assert response.status_code == 200, f"Search failed: {response.text}"
+    return response.json()
+
+
+class TestDiseaseSearch:
+    """Tests for the search parameter of /api/diseases"""
+
+    def test_name_match_ranks_first(self, api_client):
+        """A disease whose name matches outranks body-only matches"""
+        results = search(api_client, "carpal tunnel")
+        assert len(results) > 0
+        assert results[0]["name"] == "Carpal Tunnel Syndrome"
+        print(f"PASS: Name match ranked first of {len(results)}")
+
+    def test_stemming(self, api_client):
+        """Plural and singular forms find the same diseases"""
+        singular = {d["id"] for d in search(api_client, "tear")}
+        plural = {d["id"] for d in search(api_client, "tears")}
+        assert singular and singular == plural
+        print("PASS: 'tear' and 'tears' match the same diseases")
+
+    def test_accent_folding(self, api_client):
+        """Accented queries match unaccented text"""
+        plain = {d["id"] for d in search(api_client, "stroke")}
+        accented = {d["id"] for d in search(api_client, "strokë")}
+        assert plain and plain == accented
+        print("PASS: Accent folding")
+
+    def test_prefix_of_last_word(self, api_client):
+        """Search-as-you-type matches a partial last word"""
+        results = search(api_client, "rotat")
+        assert any(d["name"] == "Rotator Cuff Tear" for d in results)
+        print("PASS: Prefix matching on last word")
+
+    def test_section_fields_are_searched(self, api_client):
+        """Terms only present in later sections are found"""
+        results = search(api_client, "Lachman")
+        assert any(d["name"] == "ACL Tear" for d in results)
+        print("PASS: physical_examination is indexed")
+
+    def test_regex_metacharacters_are_literal(self, api_client):
+        """Regex syntax in the query is not interpreted"""
+        response = api_client.get(f"{BASE_URL}/api/diseases", params={"search": "(.*"})
+        assert response.status_code == 200
+        assert response.json() == []
+        print("PASS: Regex metacharacters are ignored")
+
+    def test_search_combines_with_category_filter(self, api_client):
+        """Search results respect category_id"""
+        results = search(api_client, "tear")
+        category_id = results[0]["category_id"]
+        filtered = search(api_client, "tear", category_id=category_id)
+        assert filtered and all(d["category_id"] == category_id for d in filtered)
+        print("PASS: Search respects category filter")
+
+
+
+class TestTranslatedSearch:
+    """Tests for the lang parameter searching _pt/_es fields"""
+
+    def test_unsupported_language_rejected(self, api_client):
+        """Unknown languages are a 400, not an empty result"""
+        response = api_client.get(f"{BASE_URL}/api/diseases", params={"search": "dor", "lang": "fr"})
+        assert response.status_code == 400
+        print("PASS: Unsupported language rejected")
+
+    def test_portuguese_query_matches_pt_fields(self, api_client):
+        """A Portuguese query finds text saved in definition_pt, and only with lang=pt"""
+        response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        if response.status_code != 200:
+            pytest.skip("Admin authentication failed")
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        disease_id = search(api_client, "carpal tunnel")[0]["id"]
+
+        response = api_client.put(
+            f"{BASE_URL}/api/diseases/{disease_id}/inline-save",
+            json={"language": "pt", "section_id": "definition", "content": "TEST: Compressão do nervo mediano com lesões axonais"},
+            headers=headers
+        )
+        assert response.status_code == 200, f"Save failed: {response.text}"
+
+        results = search(api_client, "lesão axonal", lang="pt")
+        assert results and results[0]["id"] == disease_id
+        assert disease_id not in [d["id"] for d in search(api_client, "axonais", lang="es")]
+        print("PASS: Portuguese query resolves against the pt segment")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
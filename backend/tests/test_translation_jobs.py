@@ -0,0 +1,112 @@
+"""
+Backend API tests for background whole-disease translation jobs
+Tests job creation, progress polling, the queue view and request validation
+"""
+import pytest
+import requests
+import os
+import time
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "admin@pmr.edu"
+ADMIN_PASSWORD = "admin123"
+
+# How long to wait for a job to leave queued/running
+JOB_TIMEOUT_SECONDS = 300
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Shared requests session"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+@pytest.fixture(scope="module")
+def authenticated_admin_client(api_client):
+    """Session with admin auth header"""
+    response = api_client.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin authentication failed - skipping authenticated tests")
+    api_client.headers.update({"Authorization": f"Bearer {response.json()['access_token']}"})
+    return api_client
+
+@pytest.fixture(scope="module")
+def test_disease_id(authenticated_admin_client):
+    """ID of an existing disease"""
+    response = authenticated_admin_client.get(f"{BASE_URL}/api/diseases")
+    if response.status_code != 200 or not response.json():
+        pytest.skip("No diseases available for testing")
+    return response.json()[0]["id"]
+
+
+class TestTranslationJobs:
+    """POST /api/translate-disease starts a job; GET /api/translation-jobs reports it"""
+
+    def test_start_and_poll_job(self, authenticated_admin_client, test_disease_id):
+        """A job is accepted and reaches a terminal state with per-field progress"""
+        response = authenticated_admin_client.post(
+            f"{BASE_URL}/api/translate-disease/{test_disease_id}",
+            params={"target_language": "pt"}
+        )
+        assert response.status_code == 202, f"Start failed: {response.text}"
+        job = response.json()
+        assert job["status"] in ("queued", "running")
+        assert job["total"] > 0
+
+        deadline = time.time() + JOB_TIMEOUT_SECONDS
+        while job["status"] in ("queued", "running") and not job["next_attempt_at"] and time.time() < deadline:
+            time.sleep(2)
+            response = authenticated_admin_client.get(f"{BASE_URL}/api/translation-jobs/{job['job_id']}")
+            assert response.status_code == 200
+            job = response.json()
+
+        # A job with failed fields is queued again for a retry of just those fields
+        assert job["status"] == "completed" or job["next_attempt_at"], f"Job did not finish: {job}"
+        assert job["completed"] + len(job["failed_fields"]) == job["total"]
+        print(f"PASS: Job {job['status']} with {job['completed']}/{job['total']} fields after {job['attempts']} attempts")
+
+    def test_rejects_unknown_language(self, authenticated_admin_client, test_disease_id):
+        """Unsupported target language returns 400"""
+        response = authenticated_admin_client.post(
+            f"{BASE_URL}/api/translate-disease/{test_disease_id}",
+            params={"target_language": "xx"}
+        )
+        assert response.status_code == 400
+        print("PASS: Unknown target language rejected")
+
+    def test_job_queue_stats(self, authenticated_admin_client):
+        """Admin job queue view reports counts and dead-lettered jobs"""
+        response = authenticated_admin_client.get(f"{BASE_URL}/api/admin/job-queue")
+        assert response.status_code == 200
+        data = response.json()
+        assert {"queued", "running", "completed", "dead", "retrying"} <= set(data["queue"])
+        assert isinstance(data["dead_letters"], list)
+        print(f"PASS: Job queue has {data['queue']['queued']} queued and {data['queue']['dead']} dead jobs")
+
+    def test_retry_requires_dead_job(self, authenticated_admin_client):
+        """Retrying a job that is not dead returns 404"""
+        response = authenticated_admin_client.post(f"{BASE_URL}/api/admin/translation-jobs/non-existent-job/retry")
+        assert response.status_code == 404
+        print("PASS: Retry of a missing job returns 404")
+
+    def test_unknown_job_returns_404(self, authenticated_admin_client):
+        """Status of a missing job returns 404"""
+        response = authenticated_admin_client.get(f"{BASE_URL}/api/translation-jobs/non-existent-job")
+        assert response.status_code == 404
+        print("PASS: Missing job returns 404")
+
+    def test_translator_health(self, api_client):
+        """Health check reports the translation provider's circuit breaker state"""
+        response = api_client.get(f"{BASE_URL}/api/health")
+        assert response.status_code == 200
+        assert response.json()["translator"] in ("closed", "open", "half_open")
+        print(f"PASS: Translator breaker is {response.json()['translator']}")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
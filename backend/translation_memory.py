@@ -0,0 +1,84 @@
+"""
+Content-addressed translation memory.
+
+A translation is stored under a hash of the normalized source text, the language
+pair, the model and the prompt version, so any change to what would be sent to
+the LLM misses the memory while repeats of the exact same request are served
+from it. An in-process LRU sits in front of the Mongo collection that persists
+entries across restarts and workers.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from cache import LRUCache
+
+TRAILING_WHITESPACE = re.compile(r'[ \t]+$', re.MULTILINE)
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of source text: NFC, CRLF as LF, trailing spaces of each line and outer blank lines trimmed.
+
+    Line breaks are kept: section text is split on them for formatting, so an
+    edit that only moves them must still miss the memory and read as stale.
+    """
+    text = unicodedata.normalize('NFC', text).replace('\r\n', '\n').replace('\r', '\n')
+    return TRAILING_WHITESPACE.sub('', text).strip()
+
+
+def content_hash(text: str) -> str:
+    """Short fingerprint of source text, recorded with a translation to detect when it goes stale"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()[:16]
+
+
+def memory_key(text: str, source_language: str, target_language: str, model: str, prompt_version: str) -> str:
+    payload = json.dumps([normalize_text(text), source_language, target_language, model, prompt_version])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """LRU over a Mongo collection of translations keyed by memory_key()"""
+
+    def __init__(self, collection, max_size: int):
+        self.collection = collection
+        self.entries = LRUCache(max_size)
+        self.store_hits = 0
+        self.store_misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        translated = self.entries.get(key)
+        if translated is not None:
+            return translated
+        doc = await self.collection.find_one({"_id": key}, {"translated_text": 1})
+        if doc is None:
+            self.store_misses += 1
+            return None
+        self.store_hits += 1
+        self.entries.set(key, doc["translated_text"])
+        return doc["translated_text"]
+
+    async def put(self, key: str, translated: str, **metadata: Any):
+        self.entries.set(key, translated)
+        await self.collection.update_one(
+            {"_id": key},
+            {"$set": {
+                "translated_text": translated,
+                **metadata,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }},
+            upsert=True
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.entries.hits + self.store_hits + self.store_misses
+        hits = self.entries.hits + self.store_hits
+        return {
+            **self.entries.stats(),
+            "store_hits": self.store_hits,
+            "store_misses": self.store_misses,
+            "memory_hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,354 @@
+"""
+Translator backends: what actually turns a prompt and a text into a translation.
+
+Every translation path in the API goes through a Translator, so the LLM provider
+can be swapped without touching them. EmergentTranslator calls the real model
+through emergentintegrations, reusing pooled chat clients per language pair,
+model and prompt; the package is imported only when one is created, so the
+other backends run without it installed. FakeTranslator stands in for it when benchmarking or load
+testing offline. It is deterministic for a given seed, and it draws latency
+from a log-normal distribution, adds time per output token at a configured
+throughput, and fails at a configured rate. Batched requests (a JSON object of
+sections) get a JSON object back with the same keys.
+
+GuardedTranslator wraps a backend with a deadline per attempt, bounded retries
+with jittered backoff, and a circuit breaker, so a degraded provider fails fast
+instead of piling up calls.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from circuit_breaker import CircuitBreaker
+from llm_text import count_tokens
+
+
+class TranslatorError(Exception):
+    """The backend failed to produce a translation"""
+
+
+class Translator(ABC):
+    """Base class; subclasses implement complete()"""
+
+    name = "base"
+
+    def __init__(self, model: str):
+        self.model = model
+        self.calls = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def configured(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def complete(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        """Translate text once; translate() wraps this with the accounting"""
+
+    async def translate(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        """complete() with call, error, token and time accounting"""
+        self.calls += 1
+        self.input_tokens += count_tokens(system_message) + count_tokens(text)
+        started = time.monotonic()
+        try:
+            translated = await self.complete(text, source_language, target_language, system_message)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.busy_seconds += time.monotonic() - started
+        self.output_tokens += count_tokens(translated)
+        return translated
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "model": self.model,
+            "calls": self.calls,
+            "errors": self.errors,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "avg_call_ms": round(self.busy_seconds / self.calls * 1000, 2) if self.calls else 0.0
+        }
+
+
+class ClientPool:
+    """Idle clients kept per key for reuse; each client serves one call at a time"""
+
+    def __init__(self, factory: Callable[[Hashable], Any], max_idle_per_key: int):
+        self.factory = factory
+        self.max_idle_per_key = max_idle_per_key
+        self.idle: Dict[Hashable, List[Any]] = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, key: Hashable) -> Any:
+        idle = self.idle.get(key)
+        if idle:
+            self.reused += 1
+            return idle.pop()
+        self.created += 1
+        return self.factory(key)
+
+    def release(self, key: Hashable, client: Any):
+        idle = self.idle.setdefault(key, [])
+        if len(idle) < self.max_idle_per_key:
+            idle.append(client)
+        else:
+            self.discarded += 1
+
+    def discard(self, key: Hashable, client: Any):
+        """Drop a client whose state is unknown, e.g. after a failed or cancelled call"""
+        self.discarded += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self.idle),
+            "idle": sum(len(clients) for clients in self.idle.values()),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded
+        }
+
+
+class PooledChat:
+    """An LlmChat reused across calls.
+
+    LlmChat keeps the conversation so far and sends it with every message; the
+    history is cut back to the system prompt after each call so no translation
+    carries the text of another. A client whose history isn't a list it can cut
+    is not resettable and must not be reused.
+    """
+
+    def __init__(self, chat: Any, message_type: Callable[..., Any]):
+        self.chat = chat
+        self.message_type = message_type
+        history = getattr(chat, "messages", None)
+        self.history = history if isinstance(history, list) else None
+        self.base_length = len(self.history) if self.history is not None else 0
+
+    @property
+    def resettable(self) -> bool:
+        return self.history is not None
+
+    async def send(self, text: str) -> str:
+        try:
+            return await self.chat.send_message(self.message_type(text=text))
+        finally:
+            if self.history is not None:
+                del self.history[self.base_length:]
+
+
+class EmergentTranslator(Translator):
+    """The LLM behind emergentintegrations' LlmChat, with clients pooled per (source, target, model, prompt)"""
+
+    name = "emergent"
+
+    def __init__(self, api_key: str, provider: str, model: str, pool_size: int):
+        from emergentintegrations.llm.chat import LlmChat, UserMessage
+
+        super().__init__(model)
+        self.chat_type = LlmChat
+        self.message_type = UserMessage
+        self.api_key = api_key
+        self.provider = provider
+        self.pool = ClientPool(self.new_client, pool_size)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def new_client(self, key: tuple) -> PooledChat:
+        source_language, target_language, model, system_message = key
+        chat = self.chat_type(
+            api_key=self.api_key,
+            session_id=f"translate-{source_language}-{target_language}-{uuid.uuid4()}",
+            system_message=system_message
+        ).with_model(self.provider, model)
+        return PooledChat(chat, self.message_type)
+
+    async def complete(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        key = (source_language, target_language, self.model, system_message)
+        client = self.pool.acquire(key)
+        try:
+            translated = await client.send(text)
+        except BaseException:
+            self.pool.discard(key, client)
+            raise
+        if client.resettable:
+            self.pool.release(key, client)
+        else:
+            # Reusing it would resend every earlier translation with each call
+            self.pool.discard(key, client)
+        return translated
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "pool": self.pool.stats()}
+
+
+class FakeTranslator(Translator):
+    """Local stand-in for the LLM with configurable latency, throughput and error rate"""
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency_ms: float,
+        latency_sigma: float,
+        tokens_per_second: float,
+        error_rate: float,
+        seed: Optional[int] = None
+    ):
+        super().__init__("fake")
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+    def render(self, text: str, target_language: str) -> str:
+        return f"[{target_language}] {text}"
+
+    def respond(self, text: str, target_language: str) -> str:
+        try:
+            sections = json.loads(text)
+        except ValueError:
+            sections = None
+        if isinstance(sections, dict) and all(isinstance(value, str) for value in sections.values()):
+            return json.dumps(
+                {key: self.render(value, target_language) for key, value in sections.items()},
+                ensure_ascii=False
+            )
+        return self.render(text, target_language)
+
+    def delay(self, output: str) -> float:
+        """Seconds a call takes: log-normal time to first token (median latency_ms) plus generation time"""
+        first_token = self.latency_ms / 1000 * math.exp(self.random.gauss(0, self.latency_sigma))
+        generation = count_tokens(output) / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        return first_token + generation
+
+    async def complete(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        output = self.respond(text, target_language)
+        delay = self.delay(output)
+        failed = self.random.random() < self.error_rate
+        await asyncio.sleep(delay)
+        if failed:
+            raise TranslatorError("Simulated provider error")
+        return output
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "latency_ms": self.latency_ms,
+            "latency_sigma": self.latency_sigma,
+            "tokens_per_second": self.tokens_per_second,
+            "error_rate": self.error_rate
+        }
+
+
+class GuardedTranslator(Translator):
+    """A backend behind a circuit breaker, with a deadline per attempt and jittered retries.
+
+    A call gets up to max_attempts attempts within deadline_seconds overall. Each
+    attempt is cut off at attempt_timeout_seconds (or the time left), and the wait
+    before the next one is drawn uniformly up to retry_base_seconds * 2^(attempt-1),
+    capped at retry_max_seconds ("full jitter"), so retries from many callers spread out.
+    At most concurrency attempts run at once; a call gives up its slot while it
+    waits to retry, and its deadline starts once it first gets one.
+    """
+
+    def __init__(
+        self,
+        backend: Translator,
+        breaker: CircuitBreaker,
+        max_attempts: int,
+        attempt_timeout_seconds: float,
+        deadline_seconds: float,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        concurrency: int
+    ):
+        super().__init__(backend.model)
+        self.name = backend.name
+        self.backend = backend
+        self.breaker = breaker
+        self.max_attempts = max_attempts
+        self.attempt_timeout_seconds = attempt_timeout_seconds
+        self.deadline_seconds = deadline_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.slots = asyncio.Semaphore(concurrency)
+        self.retries = 0
+        self.attempt_timeouts = 0
+
+    @property
+    def configured(self) -> bool:
+        return self.backend.configured
+
+    async def complete(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        """One unguarded call to the backend; translate() is the guarded path"""
+        return await self.backend.complete(text, source_language, target_language, system_message)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempt - 1)))
+
+    async def translate(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        # The breaker sees one outcome per call, so a single bad text retried a few times cannot trip it
+        self.breaker.before_call()
+        try:
+            translated = await self.attempt(text, source_language, target_language, system_message)
+        except asyncio.CancelledError:
+            self.breaker.abandon()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return translated
+
+    async def attempt(self, text: str, source_language: str, target_language: str, system_message: str) -> str:
+        loop = asyncio.get_running_loop()
+        deadline = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self.slots:
+                    if deadline is None:
+                        deadline = loop.time() + self.deadline_seconds
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    return await asyncio.wait_for(
+                        self.backend.translate(text, source_language, target_language, system_message),
+                        min(self.attempt_timeout_seconds, remaining)
+                    )
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self.attempt_timeouts += 1
+                delay = self.backoff(attempt)
+                # Other calls may have opened the breaker meanwhile; stop adding load to the provider
+                if attempt >= self.max_attempts or loop.time() + delay >= deadline or self.breaker.state == "open":
+                    raise
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.backend.stats(),
+            "retries": self.retries,
+            "attempt_timeouts": self.attempt_timeouts,
+            "max_attempts": self.max_attempts,
+            "attempt_timeout_seconds": self.attempt_timeout_seconds,
+            "breaker": self.breaker.stats()
+        }
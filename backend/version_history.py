@@ -0,0 +1,239 @@
+"""
+Disease version history stored as field-level deltas.
+
+Each write records a version. Most versions hold only the fields that changed
+since the version before, as paths into the document (nested objects such as
+translation_sources are diffed key by key; lists and scalars are replaced
+whole). Every keyframe_interval versions, or whenever the previous version is
+missing, a full copy of the document (a keyframe) is stored instead. Every
+record carries the version of the keyframe its chain starts from, so any
+version is rebuilt from one indexed range read: the keyframe plus at most
+keyframe_interval - 1 deltas, replayed in order.
+
+Records written before deltas existed are full copies without keyframe_version;
+they read as keyframes, and compact() turns them into deltas unless a later
+record's chain starts from them.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from cache import LRUCache
+
+Path = List[str]
+
+# Fields of a record that describe how it is stored rather than the edit
+STORAGE_FIELDS = ("_id", "data", "changes", "keyframe_version")
+
+
+def diff_fields(old: Dict[str, Any], new: Dict[str, Any], prefix: Optional[Path] = None) -> Dict[str, list]:
+    """Changes that turn old into new: {"set": [{"path", "value"}], "unset": [path]}"""
+    prefix = prefix or []
+    changes = {"set": [], "unset": []}
+    for key, value in new.items():
+        path = prefix + [key]
+        if key not in old:
+            changes["set"].append({"path": path, "value": value})
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested = diff_fields(old[key], value, path)
+            changes["set"].extend(nested["set"])
+            changes["unset"].extend(nested["unset"])
+        elif old[key] != value or type(old[key]) is not type(value):
+            changes["set"].append({"path": path, "value": value})
+    changes["unset"].extend(prefix + [key] for key in old if key not in new)
+    return changes
+
+
+def apply_changes(document: Dict[str, Any], changes: Dict[str, list]) -> Dict[str, Any]:
+    """A copy of document with the changes applied; document itself is left as it was"""
+    result = dict(document)
+    copied = set()
+
+    def parent(path: Path) -> Dict[str, Any]:
+        # Copy each nested object on the way down once, so the input is never mutated
+        node = result
+        for depth, key in enumerate(path[:-1]):
+            marker = tuple(path[:depth + 1])
+            child = node.get(key)
+            if marker not in copied or not isinstance(child, dict):
+                child = dict(child) if isinstance(child, dict) else {}
+                node[key] = child
+                copied.add(marker)
+            node = child
+        return node
+
+    for change in changes.get("set", []):
+        parent(change["path"])[change["path"][-1]] = change["value"]
+    for path in changes.get("unset", []):
+        parent(path).pop(path[-1], None)
+    return result
+
+
+def version_state(document: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of a disease document kept in its history"""
+    return {key: value for key, value in document.items() if key != "_id"}
+
+
+def is_keyframe(record: dict) -> bool:
+    return "data" in record
+
+
+def chain_start(record: dict) -> int:
+    """Version of the keyframe a record is rebuilt from; full-copy records predating deltas are their own"""
+    return record.get("keyframe_version", record["version"])
+
+
+class VersionHistory:
+    """Delta-encoded versions of diseases in one collection, keyed by (disease_id, version)"""
+
+    def __init__(self, collection, keyframe_interval: int, cache_size: int = 200):
+        self.collection = collection
+        self.keyframe_interval = max(1, keyframe_interval)
+        # Latest recorded (version, state) per disease, so consecutive saves don't replay the chain
+        self.latest = LRUCache(cache_size)
+        self.keyframes = 0
+        self.deltas = 0
+        self.replayed = 0
+
+    async def chain(self, disease_id: str, first: int, last: int) -> List[dict]:
+        """Records from the keyframe that version first depends on through version last, oldest first"""
+        record = await self.collection.find_one(
+            {"disease_id": disease_id, "version": first}, {"_id": 0, "version": 1, "keyframe_version": 1}
+        )
+        if record is None:
+            return []
+        start = chain_start(record)
+        return await self.collection.find(
+            {"disease_id": disease_id, "version": {"$gte": start, "$lte": last}}, {"_id": 0}
+        ).sort("version", 1).to_list(None)
+
+    def replay(self, records: List[dict]) -> List[Tuple[dict, dict]]:
+        """(record, full document) for each record of a chain"""
+        states = []
+        state = None
+        for record in records:
+            if is_keyframe(record):
+                state = record["data"]
+            elif state is not None:
+                state = apply_changes(state, record["changes"])
+            else:
+                raise ValueError(
+                    f"Version {record['version']} of disease {record.get('disease_id')} is a delta "
+                    f"with no keyframe before it (chain starts at {chain_start(record)})"
+                )
+            self.replayed += 1
+            states.append((record, state))
+        return states
+
+    async def reconstruct(self, disease_id: str, version: int) -> Optional[dict]:
+        """The full disease document as of a version, or None if that version isn't recorded"""
+        cached = self.latest.get(disease_id)
+        if cached is not None and cached[0] == version:
+            return copy.deepcopy(cached[1])
+        found = await self.get(disease_id, version)
+        return found["data"] if found else None
+
+    async def listing(self, disease_id: str, limit: int, before: Optional[int] = None) -> List[dict]:
+        """Edit metadata of the newest versions (older than before, if given), newest first, without documents"""
+        query: Dict[str, Any] = {"disease_id": disease_id}
+        if before is not None:
+            query["version"] = {"$lt": before}
+        return await self.collection.find(
+            query, {field: 0 for field in STORAGE_FIELDS}
+        ).sort("version", -1).limit(limit).to_list(limit)
+
+    async def get(self, disease_id: str, version: int) -> Optional[dict]:
+        """A version's edit metadata with the full document as data, or None if it isn't recorded"""
+        states = self.replay(await self.chain(disease_id, version, version))
+        if not states or states[-1][0]["version"] != version:
+            return None
+        record, state = states[-1]
+        return {**{key: value for key, value in record.items() if key not in STORAGE_FIELDS}, "data": state}
+
+    async def record(self, disease_id: str, document: Dict[str, Any], **metadata: Any) -> dict:
+        """Store the version of document (its "version" field) as a delta against the one before, or a keyframe"""
+        version = document["version"]
+        state = copy.deepcopy(version_state(document))
+        previous = await self.collection.find_one(
+            {"disease_id": disease_id, "version": version - 1},
+            {"_id": 0, "version": 1, "keyframe_version": 1}
+        )
+
+        entry = {"disease_id": disease_id, "version": version, **metadata}
+        if previous is not None and version - chain_start(previous) < self.keyframe_interval:
+            cached = self.latest.get(disease_id)
+            if cached is not None and cached[0] == version - 1:
+                previous_state = cached[1]
+            else:
+                previous_state = await self.reconstruct(disease_id, version - 1)
+            if previous_state is not None:
+                entry["changes"] = diff_fields(previous_state, state)
+                entry["keyframe_version"] = chain_start(previous)
+        if "changes" not in entry:
+            entry["data"] = state
+            entry["keyframe_version"] = version
+
+        await self.collection.insert_one(entry)
+        entry.pop("_id", None)
+        self.latest.set(disease_id, (version, state))
+        if "data" in entry:
+            self.keyframes += 1
+        else:
+            self.deltas += 1
+        return entry
+
+    async def compact(self, disease_id: str) -> int:
+        """Rewrite a disease's full-copy records as deltas between keyframes; returns how many changed"""
+        records = await self.collection.find({"disease_id": disease_id}, {"_id": 0}).sort("version", 1).to_list(None)
+        # Versions recorded after deltas existed may start their chain at a full-copy record; those stay keyframes
+        chain_starts = {record["keyframe_version"] for record in records if "keyframe_version" in record}
+        updates = []
+        state, start, previous_version = None, None, None
+        for record in records:
+            version = record["version"]
+            if "keyframe_version" in record:
+                # Already stored the new way
+                state = record["data"] if is_keyframe(record) else apply_changes(state, record["changes"])
+                start, previous_version = chain_start(record), version
+                continue
+            data = version_state(record["data"])
+            if (
+                state is None
+                or version in chain_starts
+                or previous_version != version - 1
+                or version - start >= self.keyframe_interval
+            ):
+                updates.append(UpdateOne(
+                    {"disease_id": disease_id, "version": version},
+                    {"$set": {"data": data, "keyframe_version": version}}
+                ))
+                start = version
+            else:
+                updates.append(UpdateOne(
+                    {"disease_id": disease_id, "version": version},
+                    {"$set": {"changes": diff_fields(state, data), "keyframe_version": start}, "$unset": {"data": ""}}
+                ))
+            state, previous_version = data, version
+        if updates:
+            await self.collection.bulk_write(updates, ordered=True)
+        self.latest.delete(disease_id)
+        return len(updates)
+
+    async def compact_all(self) -> Dict[str, int]:
+        """compact() every disease that still has full-copy records"""
+        disease_ids = await self.collection.distinct("disease_id", {"keyframe_version": {"$exists": False}})
+        records = 0
+        for disease_id in disease_ids:
+            records += await self.compact(disease_id)
+        return {"diseases": len(disease_ids), "records": records}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keyframe_interval": self.keyframe_interval,
+            "keyframes_written": self.keyframes,
+            "deltas_written": self.deltas,
+            "versions_replayed": self.replayed,
+            "latest_cache": self.latest.stats()
+        }
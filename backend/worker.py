@@ -0,0 +1,47 @@
+"""
+Standalone translation job worker.
+
+Runs the jobs that the API enqueues in translation_jobs, so LLM load does not share
+an event loop with reader traffic. API processes don't run jobs unless started with
+RUN_JOB_WORKER=true, so start at least one of these next to them:
+
+    python worker.py --concurrency 8
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+import server
+
+logger = logging.getLogger("worker")
+
+
+async def run(concurrency: int):
+    await server.ensure_indexes()
+    worker = server.job_worker
+    worker.concurrency = concurrency
+    worker.start()
+    logger.info(f"Job worker {server.WORKER_ID} running up to {concurrency} jobs at once")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+    await stopping.wait()
+
+    # Running jobs go back to the queue for another worker
+    logger.info("Stopping job worker")
+    await worker.stop()
+    server.client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued translation jobs")
+    parser.add_argument(
+        "--concurrency", type=int, default=server.JOB_WORKER_CONCURRENCY,
+        help="jobs to run at once (default: JOB_WORKER_CONCURRENCY)"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency))
@@ -8,7 +8,7 @@ import axios from 'axios';
 const API_URL = `${process.env.REACT_APP_BACKEND_URL}/api`;
 
 export const DiseaseSearch = ({ currentDiseaseId }) => {
-  const { t } = useLanguage();
+  const { t, currentLanguage } = useLanguage();
   const [query, setQuery] = useState('');
   const [results, setResults] = useState([]);
   const [isOpen, setIsOpen] = useState(false);
@@ -39,7 +39,7 @@ export const DiseaseSearch = ({ currentDiseaseId }) => {
       setLoading(true);
       try {
         const response = await axios.get(`${API_URL}/diseases`, {
-          params: { search: query }
+          params: { search: query, lang: currentLanguage }
         });
         // Filter out current disease
         const filtered = response.data.filter(d => d.id !== currentDiseaseId);
@@ -54,7 +54,7 @@ export const DiseaseSearch = ({ currentDiseaseId }) => {
 
     const debounce = setTimeout(searchDiseases, 300);
     return () => clearTimeout(debounce);
-  }, [query, currentDiseaseId]);
+  }, [query, currentDiseaseId, currentLanguage]);
 
   const handleSelect = (diseaseId) => {
     setQuery('');
@@ -13,6 +13,19 @@ const LANGUAGES = [
   { code: 'es', name: 'Español', flag: '🇪🇸' },
 ];
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+// Poll a background translation job until it stops running or is waiting to retry failed fields
+const waitForTranslationJob = async (jobId, headers) => {
+  for (;;) {
+    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    const { data } = await axios.get(`${API_URL}/translation-jobs/${jobId}`, { headers });
+    if ((data.status !== 'queued' && data.status !== 'running') || data.next_attempt_at) {
+      return data;
+    }
+  }
+};
+
 export const LanguageSwitcher = ({ 
   currentLanguage = 'en', 
   onLanguageChange, 
@@ -30,12 +43,21 @@ export const LanguageSwitcher = ({
       setTranslating(true);
       try {
         const headers = getAuthHeaders();
-        await axios.post(
+        const response = await axios.post(
           `${API_URL}/translate-disease/${diseaseId}?target_language=${langCode}`,
           {},
           { headers }
         );
-        toast.success(`Translated to ${LANGUAGES.find(l => l.code === langCode)?.name}`);
+        // No job means every section was already translated from the current text
+        const job = response.data.job_id
+          ? await waitForTranslationJob(response.data.job_id, headers)
+          : response.data;
+        const langName = LANGUAGES.find(l => l.code === langCode)?.name;
+        if (job.status === 'completed') {
+          toast.success(`Translated to ${langName}`);
+        } else {
+          toast.warning(`Translated ${job.completed} of ${job.total} fields to ${langName}${job.next_attempt_at ? '; retrying the rest' : ''}`);
+        }
         if (onTranslationComplete) {
           onTranslationComplete(langCode);
         }
@@ -12,6 +12,8 @@ import { Avatar, AvatarFallback } from '../ui/avatar';
 import { Badge } from '../ui/badge';
 import { toast } from 'sonner';
 import axios from 'axios';
+import { fetchDiseaseSummaryPage } from '../../lib/diseases';
+import { useDiseaseSummaries } from '../../hooks/use-disease-summaries';
 import { 
   Activity, Search, ChevronRight, ChevronDown, Moon, Sun, 
   Menu, X, Bookmark, FileText, Clock, Settings, LogOut,
@@ -50,17 +52,27 @@ export const MainLayout = ({ children }) => {
   const [sidebarOpen, setSidebarOpen] = useState(true);
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false);
   const [categories, setCategories] = useState([]);
-  const [diseases, setDiseases] = useState([]);
+  // categoryId -> { items, cursor, loading }, filled when a category is first expanded
+  const [categoryDiseases, setCategoryDiseases] = useState({});
   const [searchQuery, setSearchQuery] = useState('');
+  const [debouncedQuery, setDebouncedQuery] = useState('');
+  // While filtering, matches come from the server so collapsed and unloaded categories are searched too
+  const {
+    diseases: filterMatches, hasMore: hasMoreMatches, loadingMore: loadingMoreMatches, loadMore: loadMoreMatches
+  } = useDiseaseSummaries(debouncedQuery ? { search: debouncedQuery } : null);
   const [expandedCategories, setExpandedCategories] = useState({});
   const [draggedCategory, setDraggedCategory] = useState(null);
   const [dropTargetId, setDropTargetId] = useState(null);
 
   useEffect(() => {
     fetchCategories();
-    fetchDiseases();
   }, []);
 
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedQuery(searchQuery.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
   const fetchCategories = async () => {
     try {
       const response = await axios.get(`${API_URL}/categories`);
@@ -70,16 +82,32 @@ export const MainLayout = ({ children }) => {
     }
   };
 
-  const fetchDiseases = async () => {
+  // Load a category's next page of diseases (the first page when cursor is null)
+  const fetchCategoryDiseases = async (categoryId, cursor = null) => {
+    setCategoryDiseases(prev => ({
+      ...prev,
+      [categoryId]: { items: [], cursor: null, ...prev[categoryId], loading: true }
+    }));
     try {
-      const response = await axios.get(`${API_URL}/diseases`);
-      setDiseases(response.data);
+      const page = await fetchDiseaseSummaryPage({ category_id: categoryId }, cursor);
+      setCategoryDiseases(prev => ({
+        ...prev,
+        [categoryId]: {
+          items: cursor ? [...(prev[categoryId]?.items || []), ...page.items] : page.items,
+          cursor: page.next_cursor,
+          loading: false
+        }
+      }));
     } catch (err) {
       console.error('Failed to fetch diseases:', err);
+      setCategoryDiseases(prev => ({ ...prev, [categoryId]: { ...prev[categoryId], loading: false } }));
     }
   };
 
   const toggleCategory = (categoryId) => {
+    if (!expandedCategories[categoryId] && !categoryDiseases[categoryId]) {
+      fetchCategoryDiseases(categoryId);
+    }
     setExpandedCategories(prev => ({
       ...prev,
       [categoryId]: !prev[categoryId]
@@ -87,10 +115,10 @@ export const MainLayout = ({ children }) => {
   };
 
   const getFilteredDiseases = (categoryId) => {
-    return diseases
-      .filter(d => d.category_id === categoryId)
-      .filter(d => !searchQuery || d.name.toLowerCase().includes(searchQuery.toLowerCase()))
-      .sort((a, b) => a.name.localeCompare(b.name));
+    if (debouncedQuery) {
+      return filterMatches.filter(d => d.category_id === categoryId);
+    }
+    return categoryDiseases[categoryId]?.items || [];
   };
 
   const handleSearch = (e) => {
@@ -275,7 +303,9 @@ export const MainLayout = ({ children }) => {
                 <div className="space-y-0.5 pb-4">
                   {categories.map((category, index) => {
                     const filteredDiseases = getFilteredDiseases(category.id);
-                    const isExpanded = expandedCategories[category.id];
+                    // A filter shows only the categories with matches, opened
+                    if (debouncedQuery && filteredDiseases.length === 0) return null;
+                    const isExpanded = Boolean(debouncedQuery) || expandedCategories[category.id];
                     const isDragging = draggedCategory === category.id;
                     const isDropTarget = dropTargetId === category.id;
                     
@@ -328,11 +358,33 @@ export const MainLayout = ({ children }) => {
                                 {disease.name}
                               </Link>
                             ))}
+                            {!debouncedQuery && categoryDiseases[category.id]?.cursor && (
+                              <button
+                                type="button"
+                                onClick={() => fetchCategoryDiseases(category.id, categoryDiseases[category.id].cursor)}
+                                disabled={categoryDiseases[category.id].loading}
+                                className="block w-full text-left py-1.5 px-3 text-xs text-blue-600 dark:text-blue-400 hover:underline"
+                                data-testid={`load-more-${category.id}`}
+                              >
+                                {categoryDiseases[category.id].loading ? 'Loading...' : 'Load more'}
+                              </button>
+                            )}
                           </div>
                         </CollapsibleContent>
                       </Collapsible>
                     );
                   })}
+                  {debouncedQuery && hasMoreMatches && (
+                    <button
+                      type="button"
+                      onClick={loadMoreMatches}
+                      disabled={loadingMoreMatches}
+                      className="block w-full text-left py-1.5 px-3 text-xs text-blue-600 dark:text-blue-400 hover:underline"
+                      data-testid="load-more-matches"
+                    >
+                      {loadingMoreMatches ? 'Loading...' : 'Load more'}
+                    </button>
+                  )}
                 </div>
               </ScrollArea>
             </>
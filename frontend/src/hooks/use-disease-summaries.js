@@ -0,0 +1,57 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+import { fetchDiseaseSummaryPage } from '../lib/diseases';
+
+// First page of disease summaries for the given filters; loadMore() appends the next one.
+// params === null fetches nothing and leaves the list empty.
+export function useDiseaseSummaries(params = {}) {
+  const key = params === null ? null : JSON.stringify(params);
+  const [diseases, setDiseases] = useState([]);
+  const [cursor, setCursor] = useState(null);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // Responses for filters that have since changed are dropped
+  const generation = useRef(0);
+
+  const reload = useCallback(async () => {
+    const current = ++generation.current;
+    if (key === null) {
+      setDiseases([]);
+      setCursor(null);
+      setLoading(false);
+      return;
+    }
+    setLoading(true);
+    try {
+      const page = await fetchDiseaseSummaryPage(JSON.parse(key));
+      if (current !== generation.current) return;
+      setDiseases(page.items);
+      setCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Failed to fetch diseases:', err);
+    } finally {
+      if (current === generation.current) setLoading(false);
+    }
+  }, [key]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  const loadMore = useCallback(async () => {
+    if (!cursor || loadingMore) return;
+    const current = generation.current;
+    setLoadingMore(true);
+    try {
+      const page = await fetchDiseaseSummaryPage(JSON.parse(key), cursor);
+      if (current !== generation.current) return;
+      setDiseases(prev => [...prev, ...page.items]);
+      setCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Failed to fetch more diseases:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [key, cursor, loadingMore]);
+
+  return { diseases, hasMore: Boolean(cursor), loading, loadingMore, loadMore, reload };
+}
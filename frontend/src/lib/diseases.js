@@ -0,0 +1,13 @@
+import axios from 'axios';
+
+const API_URL = `${process.env.REACT_APP_BACKEND_URL}/api`;
+
+export const DISEASE_SUMMARY_PAGE_SIZE = 50;
+
+// One page of the cursor-paginated summary listing: { items, next_cursor }
+export async function fetchDiseaseSummaryPage(params = {}, cursor = null) {
+  const response = await axios.get(`${API_URL}/diseases/summary`, {
+    params: { limit: DISEASE_SUMMARY_PAGE_SIZE, ...params, ...(cursor ? { cursor } : {}) }
+  });
+  return response.data;
+}
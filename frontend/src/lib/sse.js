@@ -0,0 +1,53 @@
+// Reads a Server-Sent Events response over fetch (EventSource cannot send auth
+// headers or a request body). Calls onEvent(event, data) for every event and
+// resolves with the data of the final "done" event.
+export async function fetchEventStream(url, { method = 'GET', headers = {}, body, onEvent } = {}) {
+  const response = await fetch(url, {
+    method,
+    headers: {
+      ...headers,
+      Accept: 'text/event-stream',
+      ...(body !== undefined ? { 'Content-Type': 'application/json' } : {})
+    },
+    body: body !== undefined ? JSON.stringify(body) : undefined
+  });
+  if (!response.ok) {
+    throw new Error(`Request failed with status ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      // Comment-only blocks are keepalives
+      if (!data) continue;
+
+      const parsed = JSON.parse(data);
+      if (event === 'error') {
+        throw new Error(parsed.detail || 'Stream failed');
+      }
+      if (event === 'done') {
+        result = parsed;
+      }
+      if (onEvent) onEvent(event, parsed);
+    }
+  }
+  return result;
+}
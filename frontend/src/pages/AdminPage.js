@@ -15,6 +15,7 @@ import { Label } from '../components/ui/label';
 import { Textarea } from '../components/ui/textarea';
 import { toast } from 'sonner';
 import axios from 'axios';
+import { useDiseaseSummaries } from '../hooks/use-disease-summaries';
 import { 
   Plus, Search, Edit, Trash2, Users, BookOpen, FolderTree,
   BarChart3, Shield, ChevronRight, GripVertical, ArrowUp, ArrowDown
@@ -29,10 +30,13 @@ export const AdminPage = () => {
   
   const [stats, setStats] = useState(null);
   const [users, setUsers] = useState([]);
-  const [diseases, setDiseases] = useState([]);
   const [categories, setCategories] = useState([]);
   const [loading, setLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState('');
+  const [debouncedQuery, setDebouncedQuery] = useState('');
+  const {
+    diseases, hasMore, loadingMore, loadMore, reload: reloadDiseases
+  } = useDiseaseSummaries(debouncedQuery ? { search: debouncedQuery } : {});
   
   // Dialog states
   const [showCategoryDialog, setShowCategoryDialog] = useState(false);
@@ -50,20 +54,24 @@ export const AdminPage = () => {
     fetchData();
   }, [isAdmin, navigate]);
 
+  // Search the whole catalog on the server, not just the loaded rows
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedQuery(searchQuery.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
   const fetchData = async () => {
     try {
       const headers = getAuthHeaders();
       
-      const [statsRes, usersRes, diseasesRes, categoriesRes] = await Promise.all([
+      const [statsRes, usersRes, categoriesRes] = await Promise.all([
         axios.get(`${API_URL}/admin/stats`, { headers }),
         axios.get(`${API_URL}/admin/users`, { headers }),
-        axios.get(`${API_URL}/diseases`),
         axios.get(`${API_URL}/categories`)
       ]);
 
       setStats(statsRes.data);
       setUsers(usersRes.data);
-      setDiseases(diseasesRes.data);
       setCategories(categoriesRes.data);
     } catch (err) {
       console.error('Failed to fetch admin data:', err);
@@ -100,6 +108,7 @@ export const AdminPage = () => {
       setCategoryForm({ name: '', description: '', icon: 'folder', order: 0 });
       setEditingCategory(null);
       fetchData();
+      reloadDiseases();
     } catch (err) {
       toast.error('Failed to save category');
     }
@@ -126,6 +135,7 @@ export const AdminPage = () => {
       await axios.delete(`${API_URL}/diseases/${diseaseId}`, { headers });
       toast.success('Disease deleted');
       fetchData();
+      reloadDiseases();
     } catch (err) {
       toast.error('Failed to delete disease');
     }
@@ -174,11 +184,6 @@ export const AdminPage = () => {
     }
   };
 
-  const filteredDiseases = diseases.filter(d => 
-    d.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-    d.category_name?.toLowerCase().includes(searchQuery.toLowerCase())
-  );
-
   if (loading) {
     return (
       <MainLayout>
@@ -315,7 +320,7 @@ export const AdminPage = () => {
                     </TableRow>
                   </TableHeader>
                   <TableBody>
-                    {filteredDiseases.map((disease) => (
+                    {diseases.map((disease) => (
                       <TableRow key={disease.id} data-testid={`disease-row-${disease.id}`}>
                         <TableCell className="font-medium">{disease.name}</TableCell>
                         <TableCell>
@@ -351,6 +356,13 @@ export const AdminPage = () => {
                     ))}
                   </TableBody>
                 </Table>
+                {hasMore && (
+                  <div className="flex justify-center pt-4">
+                    <Button variant="outline" onClick={loadMore} disabled={loadingMore} data-testid="load-more-diseases">
+                      {loadingMore ? 'Loading...' : 'Load more'}
+                    </Button>
+                  </div>
+                )}
               </CardContent>
             </Card>
           </TabsContent>
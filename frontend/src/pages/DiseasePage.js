@@ -12,6 +12,7 @@ import { SectionMedia } from '../components/editor/SectionMedia';
 import { DiseaseSearch } from '../components/DiseaseSearch';
 import { toast } from 'sonner';
 import axios from 'axios';
+import { fetchEventStream } from '../lib/sse';
 import { 
   Bookmark, BookmarkCheck, FileText, Pencil, Check, X,
   ArrowLeft, Save, Clock, Loader2, Globe, AlertTriangle, User, Image,
@@ -82,7 +83,6 @@ export const DiseasePage = () => {
 
   useEffect(() => {
     if (id) {
-      fetchDisease();
       checkBookmark();
       fetchNote();
       recordView();
@@ -90,6 +90,14 @@ export const DiseasePage = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [id]);
 
+  // The reader only needs the current language, so fetch it scoped
+  useEffect(() => {
+    if (id) {
+      fetchDisease();
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [id, currentLanguage]);
+
   // Cancel editing if language changes
   useEffect(() => {
     if (editingSection) {
@@ -123,7 +131,9 @@ export const DiseasePage = () => {
 
   const fetchDisease = async () => {
     try {
-      const response = await axios.get(`${API_URL}/diseases/${id}`);
+      const response = await axios.get(`${API_URL}/diseases/${id}`, {
+        params: { lang: currentLanguage }
+      });
       setDisease(response.data);
     } catch (err) {
       console.error('Failed to fetch disease:', err);
@@ -247,28 +257,47 @@ export const DiseasePage = () => {
     
     setSaving(true);
     setTranslating(true);
+    const progressToast = toast.loading('Translating...');
     
     try {
       const headers = getAuthHeaders();
       const targetLanguages = languages.map(l => l.code);
       
-      await axios.put(
-        `${API_URL}/diseases/${id}/inline-save-translate`,
+      // Streamed so each language is reported as soon as it is translated
+      const result = await fetchEventStream(
+        `${API_URL}/diseases/${id}/inline-save-translate/stream`,
         {
-          source_language: currentLanguage,
-          section_id: editingSection,
-          content: editedContent,
-          target_languages: targetLanguages
-        },
-        { headers }
+          method: 'PUT',
+          headers,
+          body: {
+            source_language: currentLanguage,
+            section_id: editingSection,
+            content: editedContent,
+            target_languages: targetLanguages
+          },
+          onEvent: (event, data) => {
+            if (event === 'translation' && data.status === 'translated') {
+              toast.loading(`Translated to ${data.language.toUpperCase()}...`, { id: progressToast });
+            }
+          }
+        }
       );
       
       await fetchDisease();
       setEditingSection(null);
       setEditedContent('');
-      toast.success('Saved and translated to all languages');
+      toast.dismiss(progressToast);
+      const failed = Object.entries(result?.translations || {})
+        .filter(([, result]) => result.status === 'failed')
+        .map(([lang]) => lang.toUpperCase());
+      if (failed.length > 0) {
+        toast.warning(`Saved, but translation failed for: ${failed.join(', ')}`);
+      } else {
+        toast.success('Saved and translated to all languages');
+      }
     } catch (err) {
       console.error('Save & translate error:', err);
+      toast.dismiss(progressToast);
       toast.error('Failed to save and translate');
     } finally {
       setSaving(false);
@@ -8,11 +8,14 @@ import { Button } from '../components/ui/button';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '../components/ui/select';
 import axios from 'axios';
 import { Search, Filter, ChevronRight, X } from 'lucide-react';
+import { useLanguage } from '../contexts/LanguageContext';
+import { useDiseaseSummaries } from '../hooks/use-disease-summaries';
 
 const API_URL = `${process.env.REACT_APP_BACKEND_URL}/api`;
 
 export const SearchPage = () => {
   const [searchParams, setSearchParams] = useSearchParams();
+  const { currentLanguage } = useLanguage();
   const initialQuery = searchParams.get('q') || '';
   const initialCategory = searchParams.get('category') || '';
   const initialTag = searchParams.get('tag') || '';
@@ -20,20 +23,20 @@ export const SearchPage = () => {
   const [query, setQuery] = useState(initialQuery);
   const [selectedCategory, setSelectedCategory] = useState(initialCategory);
   const [selectedTag, setSelectedTag] = useState(initialTag);
-  const [diseases, setDiseases] = useState([]);
   const [categories, setCategories] = useState([]);
   const [tags, setTags] = useState([]);
-  const [loading, setLoading] = useState(true);
+
+  const summaryParams = { lang: currentLanguage };
+  if (initialQuery) summaryParams.search = initialQuery;
+  if (initialCategory) summaryParams.category_id = initialCategory;
+  if (initialTag) summaryParams.tag = initialTag;
+  const { diseases, hasMore, loading, loadingMore, loadMore } = useDiseaseSummaries(summaryParams);
 
   useEffect(() => {
     fetchCategories();
     fetchTags();
   }, []);
 
-  useEffect(() => {
-    fetchDiseases();
-  }, [initialQuery, initialCategory, initialTag]);
-
   const fetchCategories = async () => {
     try {
       const response = await axios.get(`${API_URL}/categories`);
@@ -52,23 +55,6 @@ export const SearchPage = () => {
     }
   };
 
-  const fetchDiseases = async () => {
-    setLoading(true);
-    try {
-      const params = new URLSearchParams();
-      if (initialQuery) params.append('search', initialQuery);
-      if (initialCategory) params.append('category_id', initialCategory);
-      if (initialTag) params.append('tag', initialTag);
-
-      const response = await axios.get(`${API_URL}/diseases?${params.toString()}`);
-      setDiseases(response.data);
-    } catch (err) {
-      console.error('Failed to fetch diseases:', err);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const handleSearch = (e) => {
     e.preventDefault();
     updateSearch({ q: query });
@@ -199,7 +185,7 @@ export const SearchPage = () => {
         {/* Results */}
         <div className="mb-4 flex items-center justify-between">
           <p className="text-sm text-slate-500">
-            {loading ? 'Loading...' : `${diseases.length} results found`}
+            {loading ? 'Loading...' : `${diseases.length}${hasMore ? '+' : ''} results found`}
           </p>
         </div>
 
@@ -244,7 +230,7 @@ export const SearchPage = () => {
                           {disease.name}
                         </h3>
                         <p className="text-sm text-slate-500 dark:text-slate-400 line-clamp-2">
-                          {disease.definition}
+                          {disease.excerpt}
                         </p>
                       </div>
                       <ChevronRight className="w-5 h-5 text-slate-400 shrink-0 ml-4" />
@@ -253,6 +239,13 @@ export const SearchPage = () => {
                 </Card>
               </Link>
             ))}
+            {hasMore && (
+              <div className="flex justify-center pt-2">
+                <Button variant="outline" onClick={loadMore} disabled={loadingMore} data-testid="load-more-results">
+                  {loadingMore ? 'Loading...' : 'Load more'}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>